@@ -7,9 +7,8 @@ cp -R /runtime/python/. out/python/
 
 # Decky places backend/out under the installed plugin's bin/ directory. Keep
 # substantive Python backend source in backend/src; root main.py is only the
-# Decky Loader entry point.
-cp src/decktation_backend.py src/wow_voice_chat.py src/controller_listener.py \
-    src/deck_hid.py src/telemetry.py src/convert_wow_context.py out/
+# Decky Loader entry point. Every module in backend/src is part of the runtime.
+cp src/*.py out/
 
 # Keep inference code and package license metadata, but omit installation-time
 # tools, test suites, caches, and SymPy (used by ONNX conversion tooling, not
@@ -0,0 +1,104 @@
+"""Allocation-free PCM capture buffers for the PortAudio callback."""
+
+import numpy as np
+
+
+class CaptureBuffer:
+    """Growable int16 buffer that the audio callback writes into in place.
+
+    Samples stay int16 until ``_prepare_audio`` converts them for Whisper, and
+    readers receive views of the backing array instead of copies. Storage is
+    kept contiguous rather than wrapping so the transcriber can always be
+    handed one zero-copy slice; it only reallocates (doubling) when a hold
+    outlasts the preallocated capacity.
+    """
+
+    def __init__(self, capacity=0):
+        self._buffer = np.empty(capacity, dtype=np.int16)
+        self._length = 0
+
+    def __len__(self):
+        return self._length
+
+    @property
+    def capacity(self):
+        return len(self._buffer)
+
+    def reset(self, capacity=0):
+        """Discard captured audio, preallocating at least ``capacity`` samples."""
+        if capacity > len(self._buffer):
+            self._buffer = np.empty(capacity, dtype=np.int16)
+        self._length = 0
+
+    def write(self, frames):
+        """Copy one mono PortAudio block into the buffer."""
+        samples = frames.reshape(-1)
+        end = self._length + len(samples)
+        if end > len(self._buffer):
+            self._grow(end)
+        self._buffer[self._length:end] = samples
+        # Publish the new length only after the samples are in place so a
+        # concurrent reader never sees uninitialized memory.
+        self._length = end
+
+    def _grow(self, needed):
+        grown = np.empty(max(needed, 2 * len(self._buffer)), dtype=np.int16)
+        grown[: self._length] = self._buffer[: self._length]
+        self._buffer = grown
+
+    def view(self, start=0, end=None):
+        """Return a zero-copy view of the captured samples."""
+        if end is None:
+            end = self._length
+        return self._buffer[start:end]
+
+
+class PreRollBuffer:
+    """Fixed-size ring holding the most recent audio from before a press.
+
+    Writes wrap around a preallocated int16 array using at most two slice
+    assignments, so feeding it from the PortAudio callback never allocates.
+    """
+
+    def __init__(self, capacity):
+        self._buffer = np.zeros(capacity, dtype=np.int16)
+        self._write = 0
+        self._filled = 0
+
+    def __len__(self):
+        return self._filled
+
+    @property
+    def capacity(self):
+        return len(self._buffer)
+
+    def write(self, frames):
+        """Overwrite the oldest samples with one mono PortAudio block."""
+        samples = frames.reshape(-1)
+        capacity = len(self._buffer)
+        if capacity == 0:
+            return
+        if len(samples) >= capacity:
+            self._buffer[:] = samples[-capacity:]
+            self._write = 0
+            self._filled = capacity
+            return
+        first = min(len(samples), capacity - self._write)
+        self._buffer[self._write:self._write + first] = samples[:first]
+        rest = len(samples) - first
+        if rest:
+            self._buffer[:rest] = samples[first:]
+        self._write = (self._write + len(samples)) % capacity
+        self._filled = min(capacity, self._filled + len(samples))
+
+    def drain_into(self, target):
+        """Append the buffered audio, oldest first, to ``target`` and empty it."""
+        capacity = len(self._buffer)
+        if self._filled == 0:
+            return
+        start = (self._write - self._filled) % capacity
+        first = min(self._filled, capacity - start)
+        target.write(self._buffer[start:start + first])
+        if self._filled > first:
+            target.write(self._buffer[: self._filled - first])
+        self._filled = 0
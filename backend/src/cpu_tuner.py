@@ -0,0 +1,237 @@
+"""Calibrate CTranslate2 settings for the CPU Decktation runs on.
+
+An LCD Deck, an OLED Deck and a desktop want different compute types and
+thread counts, so instead of one hard-coded ``int8`` setup the tuner decodes
+a bundled clip with a few combinations and keeps the fastest one whose text
+stays within a word error tolerance of the default setup's. Compute types
+whose model would not fit in the given memory limit are not tried. The result
+is stored in the settings directory and reused by every later model load
+until the CPU changes or calibration is run again.
+"""
+
+import json
+import os
+import statistics
+import threading
+import time
+
+from model_pool import estimate_mb
+
+TUNING_VERSION = 1
+TUNING_FILE = "cpu_tuning.json"
+# Word error rate allowed against the default setting's transcript.
+MAX_WORD_ERROR_RATE = 0.1
+COMPUTE_TYPES = ("int8", "int8_float32", "int16", "float32")
+BEAM_SIZES = (5, 3, 1)
+DEFAULT_SETTING = {"compute_type": "int8", "cpu_threads": 0, "num_workers": 1}
+
+
+def cpu_model(path="/proc/cpuinfo"):
+    """Return the CPU model name, so a tuning copied to another device is ignored."""
+    try:
+        with open(path) as f:
+            for line in f:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return None
+
+
+def thread_counts(cpu_count):
+    """CTranslate2 thread counts worth timing on a CPU with ``cpu_count`` threads."""
+    counts = {max(1, cpu_count // 2), cpu_count}
+    if cpu_count > 4:
+        counts.add(4)
+    return sorted(counts)
+
+
+def word_error_rate(reference, hypothesis):
+    """Word-level edit distance divided by the reference length."""
+    ref = "".join(c for c in reference.lower() if c.isalnum() or c.isspace()).split()
+    hyp = "".join(c for c in hypothesis.lower() if c.isalnum() or c.isspace()).split()
+    if not ref:
+        return 0.0 if not hyp else 1.0
+    previous = list(range(len(hyp) + 1))
+    for i, ref_word in enumerate(ref, 1):
+        current = [i]
+        for j, hyp_word in enumerate(hyp, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (ref_word != hyp_word),
+            ))
+        previous = current
+    return previous[-1] / len(ref)
+
+
+def load_tuning(settings_dir, cpu=None):
+    """Return stored settings by model size for this CPU, or {}."""
+    try:
+        with open(os.path.join(settings_dir, TUNING_FILE)) as f:
+            tuning = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if tuning.get("version") != TUNING_VERSION or tuning.get("cpu") != (cpu or cpu_model()):
+        return {}
+    return tuning.get("models", {})
+
+
+def save_tuning(settings_dir, model_size, result, cpu=None):
+    """Store ``result`` for ``model_size`` next to other sizes' results."""
+    path = os.path.join(settings_dir, TUNING_FILE)
+    cpu = cpu or cpu_model()
+    models = load_tuning(settings_dir, cpu)
+    models[model_size] = result
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({"version": TUNING_VERSION, "cpu": cpu, "models": models}, f, indent=2)
+    os.replace(tmp_path, path)
+    return models
+
+
+class CpuTuner:
+    """Time setting combinations on one clip and pick the fastest accurate one."""
+
+    def __init__(self, create_model, clip, model_size="base", repeats=3,
+                 max_word_error_rate=MAX_WORD_ERROR_RATE, cpu_count=None,
+                 max_mb=None, clock=time.perf_counter):
+        self.create_model = create_model  # (model_size, **setting) -> model
+        self.clip = clip
+        self.model_size = model_size
+        self.repeats = repeats
+        self.max_word_error_rate = max_word_error_rate
+        self.cpu_count = cpu_count or os.cpu_count() or 1
+        self.max_mb = max_mb  # None tries every compute type
+        self.clock = clock
+        self.state = "idle"
+        self.progress = 0.0
+        self.result = None
+        self.error = None
+        self.candidates = []
+        self._lock = threading.Lock()
+
+    def _decode(self, model, beam_size):
+        segments, _ = model.transcribe(
+            self.clip,
+            beam_size=beam_size,
+            best_of=beam_size,
+            temperature=0.0,
+            task="transcribe",
+            vad_filter=False,
+            condition_on_previous_text=False,
+        )
+        return "".join(segment.text for segment in segments).strip()
+
+    def _time(self, model, beam_size):
+        text = self._decode(model, beam_size)  # untimed: lazy allocations
+        timings = []
+        for _ in range(self.repeats):
+            started = self.clock()
+            self._decode(model, beam_size)
+            timings.append(self.clock() - started)
+        return text, statistics.median(timings)
+
+    def _record(self, setting, beam_size, text, seconds, reference):
+        candidate = {
+            **setting,
+            "beam_size": beam_size,
+            "seconds": round(seconds, 4),
+            "word_error_rate": round(word_error_rate(reference, text), 3),
+        }
+        self.candidates.append(candidate)
+        return candidate
+
+    def run(self):
+        """Calibrate and return the chosen setting; raises if nothing loads."""
+        with self._lock:
+            self.state = "running"
+            self.progress = 0.0
+            self.candidates = []
+            self.error = None
+        try:
+            return self._run()
+        except Exception as e:
+            self.state = "failed"
+            self.error = str(e)
+            raise
+
+    def skipped_compute_types(self):
+        """Compute types whose estimated model size exceeds ``max_mb``."""
+        if self.max_mb is None:
+            return []
+        return [
+            compute_type for compute_type in COMPUTE_TYPES
+            if estimate_mb(self.model_size, compute_type) > self.max_mb
+        ]
+
+    def _run(self):
+        skipped = self.skipped_compute_types()
+        settings = [
+            {"compute_type": compute_type, "cpu_threads": threads, "num_workers": 1}
+            for compute_type in COMPUTE_TYPES
+            if compute_type not in skipped
+            for threads in thread_counts(self.cpu_count)
+        ]
+        steps = len(settings) + len(BEAM_SIZES)
+        done = 0
+
+        # The transcript of today's default setup is the accuracy reference.
+        model = self.create_model(self.model_size, **DEFAULT_SETTING)
+        reference, baseline_seconds = self._time(model, BEAM_SIZES[0])
+        del model
+        baseline = self._record(DEFAULT_SETTING, BEAM_SIZES[0], reference, baseline_seconds, reference)
+
+        best, best_model = baseline, None
+        for setting in settings:
+            done += 1
+            self.progress = round(done / steps, 2)
+            try:
+                model = self.create_model(self.model_size, **setting)
+            except Exception as e:
+                # Not every compute type is supported by every CPU.
+                print(f"Skipping {setting}: {e}")
+                continue
+            text, seconds = self._time(model, BEAM_SIZES[0])
+            candidate = self._record(setting, BEAM_SIZES[0], text, seconds, reference)
+            if candidate["word_error_rate"] <= self.max_word_error_rate and seconds < best["seconds"]:
+                best, best_model = candidate, model
+            del model
+
+        # Narrower beams only apply to long utterances, but are timed here too.
+        if best_model is None:
+            best_model = self.create_model(self.model_size, **DEFAULT_SETTING)
+        setting = {key: best[key] for key in DEFAULT_SETTING}
+        beam_size = BEAM_SIZES[0]
+        for candidate_beam in BEAM_SIZES[1:]:
+            done += 1
+            self.progress = round(done / steps, 2)
+            text, seconds = self._time(best_model, candidate_beam)
+            candidate = self._record(setting, candidate_beam, text, seconds, reference)
+            if candidate["word_error_rate"] > self.max_word_error_rate:
+                break
+            beam_size = candidate_beam
+
+        self.result = {
+            **setting,
+            "beam_size": beam_size,
+            "seconds": best["seconds"],
+            "baseline_seconds": baseline["seconds"],
+            "speedup": round(baseline["seconds"] / best["seconds"], 2) if best["seconds"] else None,
+            "word_error_rate": best["word_error_rate"],
+            "cpu_count": self.cpu_count,
+            "tuned_at": time.time(),
+        }
+        self.state = "done"
+        self.progress = 1.0
+        return self.result
+
+    def get_status(self):
+        return {
+            "state": self.state,
+            "progress": self.progress,
+            "result": self.result,
+            "error": self.error,
+            "candidates": len(self.candidates),
+            "skipped_compute_types": self.skipped_compute_types(),
+        }
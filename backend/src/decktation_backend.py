@@ -117,6 +117,20 @@ logger.info(f"Current working directory: {os.getcwd()}")
 WoWVoiceChat = None
 try:
     from wow_voice_chat import WoWVoiceChat
+    from decoding_profiles import SUPPORTED_DECODING_PROFILES
+    from model_residency import ModelResidency, read_mem_available, read_rss
+    from cpu_tuner import TUNING_FILE, CpuTuner, load_tuning, save_tuning
+    from inference_scheduling import InferenceScheduling
+    from power_policy import PowerPolicy, smaller_model_size
+    from latency_slo import LatencySlo
+    from transcription_server import SOCKET_PATH as TRANSCRIPTION_SOCKET_PATH
+    from transcription_server import TranscriptionClient, TranscriptionServer
+    from inference_worker import (
+        InferenceWorkerClient,
+        RemoteWhisperModel,
+        connect_worker,
+        spawn_worker,
+    )
     logger.info("Successfully imported WoWVoiceChat")
 except ImportError as e:
     logger.error(f"Failed to import WoWVoiceChat: {e}")
@@ -138,6 +152,16 @@ if not os.path.exists(PRESETS_FILE):
     # Keep source-tree execution useful for tests and local development.
     PRESETS_FILE = os.path.join(plugin_path, "defaults", "game_presets.json")
 
+CALIBRATION_CLIP = os.path.join(plugin_path, "calibration_clip.wav")
+if not os.path.exists(CALIBRATION_CLIP):
+    CALIBRATION_CLIP = os.path.join(plugin_path, "defaults", "calibration_clip.wav")
+# The first calibration waits until nothing was dictated for this long, so it
+# does not start in the middle of the session that enabled dictation.
+CALIBRATION_IDLE_SECONDS = 120
+CALIBRATION_IDLE_CHECK_SECONDS = 15
+
+DEFAULT_PRE_ROLL_MS = 400
+
 DEFAULT_BUTTON_CONFIG = {
     "buttons": ["L1", "R1"],
     "showNotifications": True,
@@ -148,9 +172,32 @@ DEFAULT_BUTTON_CONFIG = {
     "shareDiagnostics": False,
     "modelSize": "base",
     "transcriptionLanguage": "auto",
+    "streamingTranscription": False,
+    "warmMic": False,
+    "preRollMs": DEFAULT_PRE_ROLL_MS,
+    "modelIdleUnloadMinutes": 10,
+    "modelMemoryWatermarkMb": 1024,
+    "decodingProfile": "preset",
+    "speechDetection": True,
+    "inferenceWorker": False,
+    "transcriptionServer": True,
+    "batchedInference": False,
+    "cascadeModelSize": "off",
+    "inferencePriority": "low",
+    "inferenceMaxThreads": 0,
+    "inferenceCpus": [],
+    "powerAwareInference": True,
+    "thermalLimitC": 85,
+    "latencySloSeconds": 0,
+    "latencySloPercentile": 95,
+    "modelPoolBudgetMb": 1024,
 }
 
-SUPPORTED_WHISPER_MODEL_SIZES = {"base", "small", "medium"}
+# Cheapest first, so constrained setups can step down the list.
+WHISPER_MODEL_SIZES = ("base", "small", "medium")
+SUPPORTED_WHISPER_MODEL_SIZES = set(WHISPER_MODEL_SIZES)
+
+MAX_PRE_ROLL_MS = 1000
 
 SUPPORTED_WHISPER_LANGUAGES = {
     "af", "am", "ar", "as", "az", "ba", "be", "bg", "bn", "bo", "br",
@@ -182,6 +229,77 @@ def _normalize_model_size(model_size):
     return model_size
 
 
+def _stored_model_size(model_size):
+    """Normalize the ``modelSize`` setting, which may also be "preset"."""
+    model_size = (model_size or "base").strip().lower()
+    if model_size == "preset":
+        return model_size
+    return _normalize_model_size(model_size)
+
+
+def _configured_model_size(config, preset):
+    """Resolve ``modelSize``; "preset" follows the game preset's ``model_size``."""
+    model_size = config.get("modelSize")
+    if model_size == "preset":
+        model_size = preset.get("model_size", "base")
+    return _normalize_model_size(model_size)
+
+
+def _normalize_cascade_model_size(model_size):
+    model_size = (model_size or "off").strip().lower()
+    if model_size == "off":
+        return model_size
+    return _normalize_model_size(model_size)
+
+
+def _cascade_pause_reason(config, configured_size, model_size, constrained):
+    """Return why the model cascade must not escalate now, or None."""
+    cascade_size = config.get("cascadeModelSize", "off")
+    if cascade_size == "off":
+        return None
+    if WHISPER_MODEL_SIZES.index(cascade_size) <= WHISPER_MODEL_SIZES.index(configured_size):
+        return "not_larger"
+    if constrained or model_size != configured_size:
+        # Loading a larger model would undo what the power or latency policy did.
+        return "constrained"
+    return None
+
+
+def _inference_scheduling(config):
+    cpu_count = os.cpu_count() or 1
+    max_threads = int(config.get("inferenceMaxThreads") or 0)
+    if not 0 <= max_threads <= cpu_count:
+        raise ValueError(f"Inference thread cap must be between 0 and {cpu_count}")
+    cpus = [int(cpu) for cpu in config.get("inferenceCpus") or []]
+    if any(not 0 <= cpu < cpu_count for cpu in cpus):
+        raise ValueError(f"Inference CPUs must be between 0 and {cpu_count - 1}")
+    return InferenceScheduling(
+        priority=config.get("inferencePriority", "low"),
+        max_threads=max_threads,
+        cpus=cpus,
+    )
+
+
+def _normalize_pre_roll_ms(milliseconds):
+    # Pre-roll only needs to cover speech that starts while the combo is being
+    # pressed; longer buffers mostly add room noise to every utterance.
+    milliseconds = int(milliseconds if milliseconds is not None else DEFAULT_PRE_ROLL_MS)
+    if not 0 <= milliseconds <= MAX_PRE_ROLL_MS:
+        raise ValueError(f"Pre-roll must be between 0 and {MAX_PRE_ROLL_MS} ms")
+    return milliseconds
+
+
+def _stored_pre_roll_ms(milliseconds):
+    """Clamp a stored ``preRollMs``; a hand-edited value must not break config reads."""
+    if isinstance(milliseconds, bool):
+        return DEFAULT_PRE_ROLL_MS
+    try:
+        milliseconds = int(milliseconds)
+    except (TypeError, ValueError):
+        return DEFAULT_PRE_ROLL_MS
+    return max(0, min(MAX_PRE_ROLL_MS, milliseconds))
+
+
 def _read_button_config():
     config = dict(DEFAULT_BUTTON_CONFIG)
     if os.path.exists(BUTTON_CONFIG_FILE):
@@ -193,7 +311,8 @@ def _read_button_config():
     config["transcriptionLanguage"] = _normalize_transcription_language(
         config.get("transcriptionLanguage")
     )
-    config["modelSize"] = _normalize_model_size(config.get("modelSize"))
+    config["modelSize"] = _stored_model_size(config.get("modelSize"))
+    config["preRollMs"] = _stored_pre_roll_ms(config.get("preRollMs"))
     config["translateToEnglish"] = False
     return config
 
@@ -204,9 +323,8 @@ def _write_button_config(config):
     normalized_config["transcriptionLanguage"] = _normalize_transcription_language(
         normalized_config.get("transcriptionLanguage")
     )
-    normalized_config["modelSize"] = _normalize_model_size(
-        normalized_config.get("modelSize")
-    )
+    normalized_config["modelSize"] = _stored_model_size(normalized_config.get("modelSize"))
+    normalized_config["preRollMs"] = _stored_pre_roll_ms(normalized_config.get("preRollMs"))
     normalized_config["translateToEnglish"] = False
     with open(BUTTON_CONFIG_FILE, "w") as config_file:
         json.dump(normalized_config, config_file)
@@ -234,6 +352,15 @@ class Plugin:
     recording_start_count = 0  # Increments each time recording starts
     active_preset = "wow"
     dictation_transaction = None
+    model_residency = None
+    inference_worker = None
+    inference_worker_status = None
+    transcription_server = None
+    cpu_tuner = None
+    calibration_scheduled = False
+    power_policy = None
+    latency_slo = None
+    inference_limits_lock = threading.Lock()
 
     @staticmethod
     def _controller_type():
@@ -257,6 +384,208 @@ class Plugin:
             telemetry_finish_dictation(Plugin.dictation_transaction, success)
         Plugin.dictation_transaction = None
 
+    @staticmethod
+    def _dictation_trace_callback():
+        """Hand the current dictation trace to the job that finishes it."""
+        transaction = Plugin.dictation_transaction
+        Plugin.dictation_transaction = None
+
+        def finish(success):
+            if telemetry_available:
+                telemetry_finish_dictation(transaction, success)
+
+        return finish
+
+    @staticmethod
+    def _apply_inference_limits(config=None):
+        """Apply the configured model size and scheduling, reduced while constrained."""
+        # The power policy thread and the settings RPCs all call this; each
+        # call compares against and updates the service's current policy.
+        with Plugin.inference_limits_lock:
+            service = Plugin.voice_service
+            if service is None:
+                return
+            config = config or _read_button_config()
+            configured_size = _configured_model_size(config, _game_presets.get(Plugin.active_preset, {}))
+            scheduling = _inference_scheduling(config)
+            profile = config.get("decodingProfile", "preset")
+            decoding_profile = None if profile == "preset" else profile
+
+            steps = 0
+            if Plugin.power_policy and Plugin.power_policy.constrained:
+                steps += 1
+                scheduling.max_threads = scheduling.cap_threads(max(1, (os.cpu_count() or 1) // 2))
+            if Plugin.latency_slo:
+                # Tiers below the configured size: each smaller model, then the fast profile.
+                Plugin.latency_slo.set_max_level(WHISPER_MODEL_SIZES.index(configured_size) + 1)
+                level = Plugin.latency_slo.level
+                if level and steps + level > WHISPER_MODEL_SIZES.index(configured_size):
+                    decoding_profile = "fast"
+                steps += level
+            model_size = smaller_model_size(configured_size, WHISPER_MODEL_SIZES, steps)
+            service.decoding_profile = decoding_profile
+            service.set_cascade_paused(
+                _cascade_pause_reason(config, configured_size, model_size, constrained=steps > 0)
+            )
+
+            current = service.scheduling
+            if (scheduling.priority, scheduling.max_threads, scheduling.cpus) != (
+                current.priority, current.max_threads, current.cpus
+            ):
+                # A model size change swaps the model anyway, under the new policy.
+                service.set_scheduling(scheduling, rebuild=model_size == service.model_size)
+                worker_pid = (Plugin.inference_worker_status or {}).get("pid")
+                if worker_pid:
+                    scheduling.apply_to_process(worker_pid)
+            service.set_model_size(model_size)
+
+    @staticmethod
+    def _on_power_change(constrained, reasons):
+        try:
+            Plugin._apply_inference_limits()
+        except Exception as e:
+            logger.error(f"Error applying inference limits: {traceback.format_exc()}")
+            return
+        if constrained:
+            logger.info(
+                f"Inference constrained ({', '.join(reasons)}): "
+                f"using {Plugin.voice_service.model_size} model"
+            )
+        else:
+            logger.info("Inference restored to the configured setup")
+        if telemetry:
+            telemetry_breadcrumb(
+                "power_policy.constrained" if constrained else "power_policy.recovered",
+                reasons=",".join(reasons),
+                model_size=Plugin.voice_service.model_size if Plugin.voice_service else None,
+            )
+
+    @staticmethod
+    def _on_latency_slo_change(level, percentile_seconds):
+        try:
+            Plugin._apply_inference_limits()
+        except Exception as e:
+            logger.error(f"Error applying inference limits: {traceback.format_exc()}")
+            return
+        service = Plugin.voice_service
+        last_change = Plugin.latency_slo.last_change if Plugin.latency_slo else None
+        downgraded = last_change is not None and last_change["to"] > last_change["from"]
+        logger.info(
+            f"Latency SLO {'downgraded' if downgraded else 'upgraded'} to level {level}: "
+            f"{service.model_size} model, {service.get_decoding_profile()} profile"
+        )
+        if telemetry:
+            telemetry_breadcrumb(
+                "latency_slo.downgraded" if downgraded else "latency_slo.upgraded",
+                level=level,
+                model_size=service.model_size,
+                decoding_profile=service.get_decoding_profile(),
+                percentile_seconds=percentile_seconds,
+            )
+
+    @staticmethod
+    def _start_cpu_calibration():
+        """Calibrate model settings for this CPU in the background.
+
+        Calibration loads several extra models and keeps cores busy for a
+        while, so it runs from ``calibrate_cpu`` or, once per device, at an
+        idle moment after dictation is first enabled.
+        """
+        service = Plugin.voice_service
+        if service is None:
+            return False
+        if Plugin.cpu_tuner is not None and Plugin.cpu_tuner.state == "running":
+            return False
+
+        # Each candidate model is loaded next to the one in use; a budget of
+        # 0 only limits the pool, so then available memory alone decides.
+        limits = [service.model_pool.budget_mb or None]
+        mem_available = read_mem_available()
+        if mem_available is not None:
+            limits.append(mem_available // (1024 * 1024))
+        max_mb = min((limit for limit in limits if limit), default=None)
+        tuner = CpuTuner(
+            service.calibration_model,
+            service._load_wav(CALIBRATION_CLIP),
+            model_size=service.model_size,
+            max_mb=max_mb,
+        )
+        Plugin.cpu_tuner = tuner
+        threading.Thread(target=Plugin._run_cpu_calibration, args=(tuner,), daemon=True).start()
+        return True
+
+    @staticmethod
+    def _schedule_first_calibration():
+        """Calibrate once when idle if the settings have no tuning file yet."""
+        if Plugin.calibration_scheduled or Plugin.voice_service is None:
+            return False
+        if os.path.exists(os.path.join(CONFIG_DIR, TUNING_FILE)):
+            return False
+        Plugin.calibration_scheduled = True
+        threading.Thread(target=Plugin._calibrate_when_idle, daemon=True).start()
+        logger.info("CPU calibration scheduled for the next idle moment")
+        return True
+
+    @staticmethod
+    def _calibrate_when_idle():
+        while True:
+            time.sleep(CALIBRATION_IDLE_CHECK_SECONDS)
+            service = Plugin.voice_service
+            if service is None:
+                return
+            if service.is_recording or time.monotonic() - service.last_used < CALIBRATION_IDLE_SECONDS:
+                continue
+            if Plugin.power_policy and Plugin.power_policy.constrained:
+                continue
+            try:
+                Plugin._start_cpu_calibration()
+            except Exception as e:
+                logger.error(f"Error starting CPU calibration: {e}")
+            return
+
+    @staticmethod
+    def _run_cpu_calibration(tuner):
+        logger.info(f"Calibrating {tuner.model_size} model settings for this CPU")
+        try:
+            # Timed decodes run on the policy's threads, like dictation.
+            result = Plugin.voice_service.scheduling.run(tuner.run)
+        except Exception as e:
+            logger.error(f"CPU calibration failed: {traceback.format_exc()}")
+            if telemetry:
+                telemetry_capture_error("model.calibration_failed", e)
+            return
+        logger.info(f"CPU calibration chose {result}")
+        Plugin.voice_service.apply_cpu_tuning(save_tuning(CONFIG_DIR, tuner.model_size, result))
+        if telemetry:
+            telemetry_breadcrumb(
+                "model.calibrated",
+                compute_type=result["compute_type"],
+                cpu_threads=result["cpu_threads"],
+                speedup=result["speedup"],
+            )
+
+    @staticmethod
+    def _update_warm_stream():
+        """Keep the warm input stream open only while dictation is enabled."""
+        service = Plugin.voice_service
+        if service is None:
+            return
+        if service.warm_mic and Plugin.controller_enabled:
+            try:
+                service.start_warm_stream()
+            except Exception as e:
+                # Recording still works by opening a stream per press.
+                logger.error(f"Failed to open warm input stream: {e}")
+                if telemetry:
+                    telemetry_capture_error(
+                        "recording.warm_stream_failed",
+                        e,
+                        preset=Plugin.active_preset,
+                        controller_type=Plugin._controller_type(),
+                    )
+        else:
+            service.stop_warm_stream()
+
     @staticmethod
     def start_ydotoold():
         """Start Decktation's private virtual-keyboard daemon."""
@@ -346,6 +675,140 @@ class Plugin:
         except Exception as e:
             logger.warning(f"Stopped reading child-process output: {e}")
 
+    @staticmethod
+    def _system_python():
+        # Note: sys.executable is the PyInstaller frozen Decky binary, not a Python interpreter
+        python_bin = "/usr/bin/python3"
+        if os.path.exists(python_bin):
+            return python_bin
+        # Fallback to finding python3 in PATH
+        return shutil.which("python3")
+
+    @staticmethod
+    def _attach_inference_worker():
+        """Reattach to, or start, the worker process that owns the model."""
+        service = Plugin.voice_service
+        python_bin = Plugin._system_python()
+        if not python_bin:
+            raise RuntimeError("No python3 found in system")
+
+        # The worker imports the same bundled runtime as this backend.
+        python_paths = [path for path in reversed(dependency_paths) if os.path.exists(path)]
+        python_paths.append(os.path.join(plugin_path, "bin"))
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(python_paths)}
+
+        client = InferenceWorkerClient()
+
+        def spawn():
+            return spawn_worker(python_bin, client.socket_path, plugin_version, env=env)
+
+        hello, reattached = connect_worker(client, plugin_version, spawn)
+        if reattached:
+            # Keep only the model this backend is configured for.
+            hello = client.request(
+                "retain",
+                models=[{"model_size": service.model_size, **service.model_options(service.model_size)}],
+            )
+
+        # The worker runs nothing but inference, so the whole process yields.
+        service.scheduling.apply_to_process(hello["pid"])
+
+        def reconnect():
+            # The worker exits after being idle; start (or find) a new one.
+            replacement, _ = connect_worker(client, plugin_version, spawn)
+            Plugin.voice_service.scheduling.apply_to_process(replacement["pid"])
+            if Plugin.inference_worker_status:
+                Plugin.inference_worker_status["pid"] = replacement["pid"]
+                Plugin.inference_worker_status["restarts"] += 1
+            logger.info(f"Inference worker restarted (PID {replacement['pid']})")
+            if telemetry:
+                telemetry_breadcrumb("inference_worker.restarted")
+
+        client.reconnect = reconnect
+        Plugin.inference_worker = client
+        # Thread counts are forwarded, so calibration and the thread cap
+        # apply inside the worker too.
+        service.model_factory = lambda model_size: RemoteWhisperModel(
+            client, model_size, **service.model_options(model_size)
+        )
+        # An in-process model loaded before worker mode was enabled moves over
+        # on its next load.
+        if service.model is not None and not isinstance(service.model, RemoteWhisperModel):
+            service.unload_model()
+        if hello["models"]:
+            service._preload_model()
+
+        Plugin.inference_worker_status = {
+            "pid": hello["pid"],
+            "reattached": reattached,
+            "socket": client.socket_path,
+            "models": hello["models"],
+            "restarts": 0,
+            "error": None,
+        }
+        logger.info(
+            f"{'Reattached to' if reattached else 'Started'} inference worker "
+            f"(PID {hello['pid']}, models {hello['models']})"
+        )
+        if telemetry:
+            telemetry_breadcrumb("inference_worker.attached", reattached=reattached)
+
+    @staticmethod
+    def _detach_inference_worker():
+        """Return inference to this process and stop the worker."""
+        client = Plugin.inference_worker
+        Plugin.inference_worker = None
+        Plugin.inference_worker_status = None
+        service = Plugin.voice_service
+        if service:
+            service.model_factory = None
+            if not service.unload_model() and service.model is not None:
+                # A dictation is still using the worker; it exits when idle.
+                return
+        if client:
+            client.shutdown()
+
+    @staticmethod
+    def _start_inference_worker():
+        try:
+            Plugin._attach_inference_worker()
+        except Exception as e:
+            logger.error(f"Inference worker unavailable, using in-process model: {traceback.format_exc()}")
+            Plugin.inference_worker_status = {"error": str(e)}
+            if telemetry:
+                telemetry_capture_error("inference_worker.start_failed", e)
+
+    @staticmethod
+    def _start_transcription_server():
+        """Share the plugin's model with the CLI and desktop clients."""
+        if Plugin.transcription_server is not None or Plugin.voice_service is None:
+            return
+        try:
+            TranscriptionClient(TRANSCRIPTION_SOCKET_PATH, timeout=2).status()
+        except (OSError, ValueError):
+            pass
+        else:
+            # A standalone server owns the socket; taking it over would cut
+            # off its clients.
+            logger.info("Transcription server already running in another process")
+            return
+        try:
+            Plugin.transcription_server = TranscriptionServer(
+                Plugin.voice_service, socket_path=TRANSCRIPTION_SOCKET_PATH
+            ).start()
+            logger.info(f"Transcription server listening on {TRANSCRIPTION_SOCKET_PATH}")
+        except Exception as e:
+            logger.error(f"Transcription server unavailable: {traceback.format_exc()}")
+            if telemetry:
+                telemetry_capture_error("transcription_server.start_failed", e)
+
+    @staticmethod
+    def _stop_transcription_server():
+        server = Plugin.transcription_server
+        Plugin.transcription_server = None
+        if server is not None:
+            server.close()
+
     @staticmethod
     def start_controller_listener():
         """Start the external controller listener process"""
@@ -359,15 +822,10 @@ class Plugin:
                 return False
 
             # Start the listener as a subprocess using system Python
-            # Note: sys.executable is the PyInstaller frozen Decky binary, not a Python interpreter
-            python_bin = "/usr/bin/python3"
-            if not os.path.exists(python_bin):
-                # Fallback to finding python3 in PATH
-                import shutil
-                python_bin = shutil.which("python3")
-                if not python_bin:
-                    logger.error("No python3 found in system")
-                    return False
+            python_bin = Plugin._system_python()
+            if not python_bin:
+                logger.error("No python3 found in system")
+                return False
 
             Plugin.listener_process = subprocess.Popen(
                 [python_bin, listener_script],
@@ -449,11 +907,18 @@ class Plugin:
 
                     # Detect state change
                     if state and not last_state:
-                        # Button pressed - cancel pending send if one is waiting
-                        if Plugin.voice_service and Plugin.voice_service.pending_text:
-                            cancelled = Plugin.voice_service.cancel_pending()
+                        # Button pressed - in confirm mode, cancel a pending send
+                        # or a dictation that is still being transcribed
+                        if Plugin.voice_service and (
+                            Plugin.voice_service.pending_text
+                            or (
+                                Plugin.voice_service.confirm_delay > 0
+                                and Plugin.voice_service.dictations.depth()
+                            )
+                        ):
+                            cancelled = Plugin.voice_service.cancel_transcription()
                             if cancelled:
-                                logger.info("Pending send cancelled by button press")
+                                logger.info(f"Cancelled {cancelled} dictation(s) by button press")
                         elif Plugin.voice_service and not Plugin.voice_service.is_recording:
                             logger.info("Button combo pressed - starting recording")
                             Plugin._start_dictation_trace()
@@ -474,10 +939,13 @@ class Plugin:
                         # Button released
                         logger.info("Button combo released - stopping recording")
                         if Plugin.voice_service and Plugin.voice_service.is_recording:
+                            # Only queues the recording; transcription and
+                            # sending continue while the next press is polled.
+                            finish_trace = Plugin._dictation_trace_callback()
                             try:
-                                Plugin.voice_service.stop_recording()
+                                Plugin.voice_service.stop_recording(on_done=finish_trace)
                             except Exception as e:
-                                Plugin._finish_dictation_trace(False)
+                                finish_trace(False)
                                 if telemetry:
                                     telemetry_capture_error(
                                         "recording.stop_failed",
@@ -486,8 +954,6 @@ class Plugin:
                                         controller_type=Plugin._controller_type(),
                                     )
                                 raise
-                            else:
-                                Plugin._finish_dictation_trace(True)
 
                     last_state = state
 
@@ -547,8 +1013,15 @@ class Plugin:
 
             confirm_mode = saved_config.get("confirmMode", False)
             manual_send = saved_config.get("manualSend", False)
-            model_size = saved_config.get("modelSize", "base")
+            model_size = _configured_model_size(saved_config, active_preset)
             transcription_language = saved_config.get("transcriptionLanguage", "auto")
+            streaming_transcription = saved_config.get("streamingTranscription", False)
+            warm_mic = saved_config.get("warmMic", False)
+            pre_roll_ms = saved_config.get("preRollMs", 400)
+            decoding_profile = saved_config.get("decodingProfile", "preset")
+            speech_detection = saved_config.get("speechDetection", True)
+            batched_inference = saved_config.get("batchedInference", False)
+            cascade_model_size = saved_config.get("cascadeModelSize", "off")
 
             # Initialize the voice service with lazy model loading
             context_file = f"{plugin_path}/wow_context.json"
@@ -574,19 +1047,64 @@ class Plugin:
                     )
                     if telemetry else None
                 ),
+                streaming_transcription=streaming_transcription,
+                warm_mic=warm_mic,
+                pre_roll_ms=pre_roll_ms,
+                decoding_profile=None if decoding_profile == "preset" else decoding_profile,
+                speech_detection=speech_detection,
+                batched_inference=batched_inference,
+                cascade_model_size=None if cascade_model_size == "off" else cascade_model_size,
+                cpu_tuning=load_tuning(CONFIG_DIR),
+                scheduling=_inference_scheduling(saved_config),
+                latency_reporter=lambda seconds: (
+                    Plugin.latency_slo.record(seconds) if Plugin.latency_slo else None
+                ),
+                model_pool_mb=saved_config.get("modelPoolBudgetMb", 1024),
+                event_reporter=lambda name, **data: (
+                    telemetry_breadcrumb(name, **data) if telemetry else None
+                ),
             )
             logger.info("Voice service initialized (model will load on first use)")
             if telemetry:
                 telemetry_breadcrumb("voice_service.initialized")
 
+            if saved_config.get("inferenceWorker", False):
+                await asyncio.to_thread(Plugin._start_inference_worker)
+            if saved_config.get("transcriptionServer", True):
+                await asyncio.to_thread(Plugin._start_transcription_server)
+
+            Plugin.model_residency = ModelResidency(
+                Plugin.voice_service,
+                idle_seconds=saved_config.get("modelIdleUnloadMinutes", 10) * 60,
+                min_available_bytes=saved_config.get("modelMemoryWatermarkMb", 1024) * 1024 * 1024,
+            )
+            Plugin.model_residency.start()
+
+            if saved_config.get("powerAwareInference", True):
+                Plugin.power_policy = PowerPolicy(
+                    Plugin._on_power_change,
+                    hot_celsius=saved_config.get("thermalLimitC", 85),
+                )
+                Plugin.power_policy.start()
+
+            if saved_config.get("latencySloSeconds", 0) > 0:
+                Plugin.latency_slo = LatencySlo(
+                    Plugin._on_latency_slo_change,
+                    target_seconds=saved_config["latencySloSeconds"],
+                    percentile=saved_config.get("latencySloPercentile", 95),
+                )
+            Plugin._apply_inference_limits(saved_config)
+
             # Restore enabled state from config
             try:
                 if os.path.exists(BUTTON_CONFIG_FILE):
                     Plugin.controller_enabled = saved_config.get("enabled", False)
                     if Plugin.controller_enabled:
                         logger.info("Restored enabled state from config")
+                        Plugin._schedule_first_calibration()
             except Exception as e:
                 logger.error(f"Error restoring enabled state: {e}")
+            await asyncio.to_thread(Plugin._update_warm_stream)
 
             # Start the external controller listener
             if Plugin.start_controller_listener():
@@ -618,6 +1136,15 @@ class Plugin:
             if Plugin.voice_service and Plugin.voice_service.is_recording:
                 Plugin.voice_service.stop_recording()
                 Plugin._finish_dictation_trace(False)
+            if Plugin.voice_service:
+                Plugin.voice_service.stop_warm_stream()
+            Plugin._stop_transcription_server()
+            if Plugin.model_residency:
+                Plugin.model_residency.stop()
+            if Plugin.power_policy:
+                Plugin.power_policy.stop()
+            # The inference worker keeps running so a reload reattaches to
+            # its loaded model; it exits on its own once left idle.
         except Exception as e:
             logger.error(f"Error during unload: {traceback.format_exc()}")
             if telemetry:
@@ -631,6 +1158,8 @@ class Plugin:
         Plugin.poll_running = False
         Plugin.stop_controller_listener()
         Plugin.stop_ydotoold()
+        if WoWVoiceChat is not None:
+            InferenceWorkerClient().shutdown()
 
     async def _migration(self):
         """Move settings created by pre-store releases into Decky's settings."""
@@ -654,6 +1183,9 @@ class Plugin:
             _write_button_config(config)
         except Exception as e:
             logger.error(f"Error saving enabled state: {e}")
+        await asyncio.to_thread(Plugin._update_warm_stream)
+        if enabled:
+            Plugin._schedule_first_calibration()
         return {"success": True}
 
     async def get_button_config(self):
@@ -750,6 +1282,261 @@ class Plugin:
             logger.error(f"Error setting manual send mode: {traceback.format_exc()}")
             return {"success": False, "error": str(e)}
 
+    async def set_streaming_transcription(self, enabled: bool):
+        """Enable or disable decoding audio chunks while the combo is held"""
+        try:
+            config = _read_button_config()
+            config["streamingTranscription"] = enabled
+            _write_button_config(config)
+
+            if Plugin.voice_service:
+                Plugin.voice_service.streaming_transcription = enabled
+
+            logger.info(f"Streaming transcription {'enabled' if enabled else 'disabled'}")
+            return {"success": True}
+        except Exception as e:
+            logger.error(f"Error setting streaming transcription: {traceback.format_exc()}")
+            return {"success": False, "error": str(e)}
+
+    async def set_speech_detection(self, enabled: bool):
+        """Enable or disable trimming recordings to the detected speech"""
+        try:
+            config = _read_button_config()
+            config["speechDetection"] = enabled
+            _write_button_config(config)
+
+            if Plugin.voice_service:
+                Plugin.voice_service.speech_detection = enabled
+
+            logger.info(f"Speech detection {'enabled' if enabled else 'disabled'}")
+            return {"success": True}
+        except Exception as e:
+            logger.error(f"Error setting speech detection: {traceback.format_exc()}")
+            return {"success": False, "error": str(e)}
+
+    async def set_batched_inference(self, enabled: bool):
+        """Decode long recordings as a batch of VAD chunks"""
+        try:
+            config = _read_button_config()
+            config["batchedInference"] = enabled
+            _write_button_config(config)
+
+            if Plugin.voice_service:
+                Plugin.voice_service.batched_inference = enabled
+
+            logger.info(f"Batched inference {'enabled' if enabled else 'disabled'}")
+            return {"success": True}
+        except Exception as e:
+            logger.error(f"Error setting batched inference: {traceback.format_exc()}")
+            return {"success": False, "error": str(e)}
+
+    async def set_warm_mic(self, enabled: bool):
+        """Keep the microphone stream open while dictation is enabled"""
+        try:
+            config = _read_button_config()
+            config["warmMic"] = enabled
+            _write_button_config(config)
+
+            if Plugin.voice_service:
+                Plugin.voice_service.warm_mic = enabled
+                await asyncio.to_thread(Plugin._update_warm_stream)
+
+            logger.info(f"Warm mic {'enabled' if enabled else 'disabled'}")
+            return {"success": True}
+        except Exception as e:
+            logger.error(f"Error setting warm mic: {traceback.format_exc()}")
+            return {"success": False, "error": str(e)}
+
+    async def set_pre_roll(self, milliseconds: int = 400):
+        """Set how much audio from before the combo press the warm mic keeps"""
+        try:
+            milliseconds = _normalize_pre_roll_ms(milliseconds)
+            config = _read_button_config()
+            config["preRollMs"] = milliseconds
+            _write_button_config(config)
+
+            if Plugin.voice_service:
+                Plugin.voice_service.set_pre_roll(milliseconds)
+
+            logger.info(f"Pre-roll set to {milliseconds} ms")
+            return {"success": True, "preRollMs": milliseconds}
+        except Exception as e:
+            logger.error(f"Error setting pre-roll: {traceback.format_exc()}")
+            return {"success": False, "error": str(e)}
+
+    async def set_inference_worker(self, enabled: bool):
+        """Run the Whisper model in a separate long-lived worker process"""
+        try:
+            config = _read_button_config()
+            config["inferenceWorker"] = enabled
+            _write_button_config(config)
+
+            if Plugin.voice_service:
+                if enabled and Plugin.inference_worker is None:
+                    await asyncio.to_thread(Plugin._start_inference_worker)
+                elif not enabled:
+                    await asyncio.to_thread(Plugin._detach_inference_worker)
+
+            logger.info(f"Inference worker {'enabled' if enabled else 'disabled'}")
+            return {"success": True, "worker": Plugin.inference_worker_status}
+        except Exception as e:
+            logger.error(f"Error setting inference worker: {traceback.format_exc()}")
+            return {"success": False, "error": str(e)}
+
+    async def set_transcription_server(self, enabled: bool):
+        """Serve the plugin's model to local clients on the transcription socket"""
+        try:
+            config = _read_button_config()
+            config["transcriptionServer"] = enabled
+            _write_button_config(config)
+
+            if enabled:
+                await asyncio.to_thread(Plugin._start_transcription_server)
+            else:
+                await asyncio.to_thread(Plugin._stop_transcription_server)
+
+            logger.info(f"Transcription server {'enabled' if enabled else 'disabled'}")
+            return {"success": True, "serving": Plugin.transcription_server is not None}
+        except Exception as e:
+            logger.error(f"Error setting transcription server: {traceback.format_exc()}")
+            return {"success": False, "error": str(e)}
+
+    async def set_model_residency(self, idleMinutes: float = 10, memoryWatermarkMb: int = 1024):
+        """Configure when an unused model is unloaded (0 disables a rule)"""
+        try:
+            if idleMinutes < 0 or memoryWatermarkMb < 0:
+                return {"success": False, "error": "Residency limits must not be negative"}
+            config = _read_button_config()
+            config["modelIdleUnloadMinutes"] = idleMinutes
+            config["modelMemoryWatermarkMb"] = memoryWatermarkMb
+            _write_button_config(config)
+
+            if Plugin.model_residency:
+                Plugin.model_residency.configure(
+                    idleMinutes * 60,
+                    memoryWatermarkMb * 1024 * 1024,
+                )
+
+            logger.info(
+                f"Model residency updated: idle={idleMinutes}min, "
+                f"watermark={memoryWatermarkMb}MB"
+            )
+            return {"success": True}
+        except Exception as e:
+            logger.error(f"Error setting model residency: {traceback.format_exc()}")
+            return {"success": False, "error": str(e)}
+
+    async def set_power_policy(self, enabled: bool = True, thermalLimitC: float = 85):
+        """Use a smaller model and fewer threads while hot, on battery or CPU-capped"""
+        try:
+            if not 50 <= thermalLimitC <= 105:
+                return {"success": False, "error": "Thermal limit must be between 50 and 105 °C"}
+            config = _read_button_config()
+            config["powerAwareInference"] = enabled
+            config["thermalLimitC"] = thermalLimitC
+            _write_button_config(config)
+
+            if enabled and Plugin.power_policy:
+                Plugin.power_policy.configure(thermalLimitC)
+            elif enabled and Plugin.voice_service:
+                Plugin.power_policy = PowerPolicy(Plugin._on_power_change, hot_celsius=thermalLimitC)
+                Plugin.power_policy.start()
+            elif Plugin.power_policy:
+                Plugin.power_policy.stop()
+                Plugin.power_policy = None
+                Plugin._apply_inference_limits(config)
+
+            logger.info(f"Power-aware inference set to: enabled={enabled}, thermal_limit={thermalLimitC}°C")
+            return {"success": True}
+        except Exception as e:
+            logger.error(f"Error setting power policy: {traceback.format_exc()}")
+            return {"success": False, "error": str(e)}
+
+    async def set_latency_slo(self, targetSeconds: float = 0, percentile: float = 95):
+        """Downgrade the model when dictation latency misses a target (0 disables)"""
+        try:
+            if targetSeconds < 0:
+                return {"success": False, "error": "Latency target must not be negative"}
+            if not 50 <= percentile < 100:
+                return {"success": False, "error": "Percentile must be between 50 and 100"}
+            config = _read_button_config()
+            config["latencySloSeconds"] = targetSeconds
+            config["latencySloPercentile"] = percentile
+            _write_button_config(config)
+
+            if not targetSeconds:
+                Plugin.latency_slo = None
+            elif Plugin.latency_slo:
+                Plugin.latency_slo.configure(targetSeconds, percentile)
+            else:
+                Plugin.latency_slo = LatencySlo(
+                    Plugin._on_latency_slo_change,
+                    target_seconds=targetSeconds,
+                    percentile=percentile,
+                )
+            Plugin._apply_inference_limits(config)
+
+            logger.info(f"Latency SLO set to: p{percentile} <= {targetSeconds}s" if targetSeconds else "Latency SLO disabled")
+            return {"success": True}
+        except Exception as e:
+            logger.error(f"Error setting latency SLO: {traceback.format_exc()}")
+            return {"success": False, "error": str(e)}
+
+    async def get_model_pool(self):
+        """Return the resident models and their estimated memory use"""
+        try:
+            if Plugin.voice_service is None:
+                return {"success": False, "error": "Service not initialized"}
+            rss = read_rss()
+            return {
+                "success": True,
+                **Plugin.voice_service.model_pool.get_status(),
+                "process_rss_mb": round(rss / (1024 * 1024)) if rss is not None else None,
+            }
+        except Exception as e:
+            logger.error(f"Error getting model pool: {traceback.format_exc()}")
+            return {"success": False, "error": str(e)}
+
+    async def set_model_pool(self, budgetMb: int = 1024):
+        """Set the memory budget for models kept resident (0 keeps only the active ones)"""
+        try:
+            if budgetMb < 0:
+                return {"success": False, "error": "Model pool budget must not be negative"}
+            config = _read_button_config()
+            config["modelPoolBudgetMb"] = budgetMb
+            _write_button_config(config)
+
+            if Plugin.voice_service:
+                Plugin.voice_service.model_pool.configure(budgetMb)
+
+            logger.info(f"Model pool budget set to: {budgetMb}MB")
+            return {"success": True}
+        except Exception as e:
+            logger.error(f"Error setting model pool: {traceback.format_exc()}")
+            return {"success": False, "error": str(e)}
+
+    async def set_decoding_profile(self, profile: str = "preset"):
+        """Override the preset's decoding profile ("preset" restores it)"""
+        try:
+            profile = (profile or "preset").strip().lower()
+            if profile != "preset" and profile not in SUPPORTED_DECODING_PROFILES:
+                return {"success": False, "error": f"Unsupported decoding profile: {profile}"}
+            config = _read_button_config()
+            config["decodingProfile"] = profile
+            _write_button_config(config)
+
+            effective = profile
+            if Plugin.voice_service:
+                # A latency SLO downgrade keeps the fast profile until it recovers.
+                Plugin._apply_inference_limits(config)
+                effective = Plugin.voice_service.get_decoding_profile()
+
+            logger.info(f"Decoding profile set to {profile} (effective: {effective})")
+            return {"success": True, "decodingProfile": profile, "effective": effective}
+        except Exception as e:
+            logger.error(f"Error setting decoding profile: {traceback.format_exc()}")
+            return {"success": False, "error": str(e)}
+
     async def set_transcription_options(self, language: str = "auto", translateToEnglish: bool = False):
         """Set Faster Whisper language selection."""
         try:
@@ -778,32 +1565,114 @@ class Plugin:
             return {"success": False, "error": str(e)}
 
     async def set_model_size(self, modelSize: str = "base"):
-        """Set the Faster Whisper model size and reload the model if needed."""
+        """Set the Faster Whisper model size and hot-swap the model if needed.
+
+        Returns immediately; when a model is active the new size loads in the
+        background while the old one keeps serving. Poll ``get_model_swap``
+        with the returned swap id for progress.
+        """
         try:
-            model_size = _normalize_model_size(modelSize)
+            model_size = _stored_model_size(modelSize)
             config = _read_button_config()
             config["modelSize"] = model_size
+            # Rejects a preset whose own model_size is unsupported.
+            _configured_model_size(config, _game_presets.get(Plugin.active_preset, {}))
             _write_button_config(config)
 
             reloaded = False
+            swap = None
             if Plugin.voice_service:
-                reloaded = Plugin.voice_service.model is not None
-                success = await asyncio.to_thread(
-                    Plugin.voice_service.set_model_size,
-                    model_size,
-                )
-                if not success:
-                    return {"success": False, "error": Plugin.voice_service.model_load_error}
+                previous_swap = Plugin.voice_service.model_swap
+                # While constrained, the size takes effect once conditions recover.
+                Plugin._apply_inference_limits(config)
+                if Plugin.voice_service.model_swap is not previous_swap:
+                    swap = dict(Plugin.voice_service.model_swap)
+                    reloaded = True
 
             logger.info(
                 f"Whisper model size updated: {model_size}"
-                f"{' (reloaded active model)' if reloaded else ''}"
+                f"{' (hot-swapping active model)' if reloaded else ''}"
             )
-            return {"success": True, "modelSize": model_size, "reloaded": reloaded}
+            return {"success": True, "modelSize": model_size, "reloaded": reloaded, "swap": swap}
         except Exception as e:
             logger.error(f"Error setting model size: {traceback.format_exc()}")
             return {"success": False, "error": str(e)}
 
+    async def set_model_cascade(self, modelSize: str = "off"):
+        """Re-decode low-confidence results with a larger model ("off" disables)"""
+        try:
+            model_size = _normalize_cascade_model_size(modelSize)
+            config = _read_button_config()
+            if model_size != "off":
+                configured_size = _configured_model_size(
+                    config, _game_presets.get(Plugin.active_preset, {})
+                )
+                if WHISPER_MODEL_SIZES.index(model_size) <= WHISPER_MODEL_SIZES.index(configured_size):
+                    raise ValueError(
+                        f"Cascade model must be larger than the selected {configured_size} model"
+                    )
+            config["cascadeModelSize"] = model_size
+            _write_button_config(config)
+
+            if Plugin.voice_service:
+                Plugin.voice_service.set_cascade_model_size(None if model_size == "off" else model_size)
+                Plugin._apply_inference_limits(config)
+
+            logger.info(f"Model cascade set to: {model_size}")
+            return {"success": True, "modelSize": model_size}
+        except Exception as e:
+            logger.error(f"Error setting model cascade: {traceback.format_exc()}")
+            return {"success": False, "error": str(e)}
+
+    async def set_inference_scheduling(self, priority: str = "low", maxThreads: int = 0, cpus: list = None):
+        """Set the CPU priority, thread cap and cores used for inference"""
+        try:
+            config = _read_button_config()
+            config["inferencePriority"] = priority
+            config["inferenceMaxThreads"] = maxThreads
+            config["inferenceCpus"] = cpus or []
+            scheduling = _inference_scheduling(config)
+            _write_button_config(config)
+
+            Plugin._apply_inference_limits(config)
+            if Plugin.voice_service:
+                scheduling = Plugin.voice_service.scheduling
+
+            logger.info(
+                f"Inference scheduling set to: priority={priority}, "
+                f"max_threads={maxThreads}, cpus={cpus or 'all'}"
+            )
+            return {"success": True, "scheduling": scheduling.get_status()}
+        except Exception as e:
+            logger.error(f"Error setting inference scheduling: {traceback.format_exc()}")
+            return {"success": False, "error": str(e)}
+
+    async def calibrate_cpu(self):
+        """Run CPU calibration for the selected model size in the background"""
+        try:
+            if Plugin.voice_service is None:
+                return {"success": False, "error": "Service not initialized"}
+
+            started = Plugin._start_cpu_calibration()
+            if not started:
+                return {"success": False, "error": "Calibration is already running"}
+            logger.info("CPU calibration started")
+            return {"success": True}
+        except Exception as e:
+            logger.error(f"Error starting CPU calibration: {traceback.format_exc()}")
+            return {"success": False, "error": str(e)}
+
+    async def get_model_swap(self, swapId: int = None):
+        """Report progress of a background model size change"""
+        try:
+            swap = Plugin.voice_service.model_swap if Plugin.voice_service else None
+            if swap is None or (swapId is not None and swap["id"] != swapId):
+                return {"success": False, "error": "Unknown or superseded model swap"}
+            return {"success": True, "swap": dict(swap)}
+        except Exception as e:
+            logger.error(f"Error getting model swap: {traceback.format_exc()}")
+            return {"success": False, "error": str(e)}
+
     async def get_presets(self):
         """Get all available game presets"""
         try:
@@ -834,9 +1703,11 @@ class Plugin:
             _write_button_config(config)
 
             # Update running voice service
+            Plugin.active_preset = game
             if Plugin.voice_service:
                 Plugin.voice_service.set_preset(_game_presets[game])
-            Plugin.active_preset = game
+                # A preset with its own model size reuses it from the pool if resident.
+                Plugin._apply_inference_limits(config)
 
             logger.info(f"Switched game preset to: {game}")
             return {"success": True}
@@ -881,10 +1752,13 @@ class Plugin:
             # Stream shutdown happens promptly in the worker, while Decky's
             # event loop remains available for status/UI requests during
             # transcription.
+            finish_trace = Plugin._dictation_trace_callback()
             try:
-                await asyncio.to_thread(Plugin.voice_service.stop_recording, send)
+                job = await asyncio.to_thread(
+                    Plugin.voice_service.stop_recording, send, finish_trace
+                )
             except Exception as e:
-                Plugin._finish_dictation_trace(False)
+                finish_trace(False)
                 if telemetry:
                     telemetry_capture_error(
                         "recording.stop_failed",
@@ -893,13 +1767,27 @@ class Plugin:
                         controller_type=Plugin._controller_type(),
                     )
                 raise
-            else:
-                Plugin._finish_dictation_trace(True)
+            # The panel's test recording reads the result once this returns.
+            if job is not None:
+                await asyncio.to_thread(job.wait)
             return {"success": True}
         except Exception as e:
             logger.error(f"Error stopping recording: {traceback.format_exc()}")
             return {"success": False, "error": str(e)}
 
+    async def cancel_transcription(self):
+        """Cancel queued and in-flight transcriptions and any pending send"""
+        try:
+            if Plugin.voice_service is None:
+                return {"success": False, "error": "Service not initialized"}
+
+            cancelled = Plugin.voice_service.cancel_transcription()
+            logger.info(f"Cancelled {cancelled} dictation(s)")
+            return {"success": True, "cancelled": cancelled}
+        except Exception as e:
+            logger.error(f"Error cancelling transcription: {traceback.format_exc()}")
+            return {"success": False, "error": str(e)}
+
     async def is_recording(self):
         """Check if currently recording"""
         try:
@@ -929,9 +1817,11 @@ class Plugin:
         try:
             model_ready = False
             model_loading = False
+            model_warm = False
             if Plugin.voice_service:
                 model_ready = Plugin.voice_service.is_model_ready()
                 model_loading = Plugin.voice_service.model_loading
+                model_warm = Plugin.voice_service.model_warm
 
             detected_button = "None"
             try:
@@ -946,6 +1836,9 @@ class Plugin:
                 "service_ready": Plugin.voice_service is not None,
                 "model_ready": model_ready,
                 "model_loading": model_loading,
+                "model_warm": model_warm,
+                "warm_up_seconds": Plugin.voice_service.warm_up_seconds if Plugin.voice_service else None,
+                "model_load": Plugin.voice_service.get_model_load_status() if Plugin.voice_service else None,
                 "recording": Plugin.voice_service.is_recording if Plugin.voice_service else False,
                 "recording_start_count": Plugin.recording_start_count,
                 "detected_button": detected_button,
@@ -953,6 +1846,37 @@ class Plugin:
                 "pending_delay": Plugin.voice_service._confirm_delay_for(Plugin.voice_service.pending_text) if Plugin.voice_service and Plugin.voice_service.pending_text else 0,
                 "confirm_mode": Plugin.voice_service.confirm_delay > 0 if Plugin.voice_service else False,
                 "input_ready": Plugin.ydotoold_ready,
+                "streaming_transcription": Plugin.voice_service.streaming_transcription if Plugin.voice_service else False,
+                "last_streaming_stats": Plugin.voice_service.last_streaming_stats if Plugin.voice_service else None,
+                "capture_stats": Plugin.voice_service.get_capture_stats() if Plugin.voice_service else None,
+                "model_residency": Plugin.model_residency.get_status() if Plugin.model_residency else None,
+                "decoding_profile": Plugin.voice_service.get_decoding_profile() if Plugin.voice_service else None,
+                "last_decoding_profile": Plugin.voice_service.last_decoding_profile if Plugin.voice_service else None,
+                "decode_guard": Plugin.voice_service.decode_guard_stats if Plugin.voice_service else None,
+                "batched_inference": Plugin.voice_service.batched_inference if Plugin.voice_service else False,
+                "last_decode_batched": Plugin.voice_service.last_decode_batched if Plugin.voice_service else False,
+                "language_cache": Plugin.voice_service.language_cache.get_status() if Plugin.voice_service else None,
+                "model_cascade": Plugin.voice_service.get_cascade_status() if Plugin.voice_service else None,
+                "cpu_tuning": {
+                    "calibration": Plugin.cpu_tuner.get_status() if Plugin.cpu_tuner else None,
+                    "settings": Plugin.voice_service.cpu_tuning.get(Plugin.voice_service.model_size),
+                } if Plugin.voice_service else None,
+                "inference_scheduling": Plugin.voice_service.scheduling.get_status() if Plugin.voice_service else None,
+                "power_policy": Plugin.power_policy.get_status() if Plugin.power_policy else None,
+                "latency_slo": {
+                    **Plugin.latency_slo.get_status(),
+                    "model_size": Plugin.voice_service.model_size,
+                    "decoding_profile": Plugin.voice_service.get_decoding_profile(),
+                } if Plugin.latency_slo and Plugin.voice_service else None,
+                "last_dictation_latency": Plugin.voice_service.last_dictation_latency if Plugin.voice_service else None,
+                "model_pool": Plugin.voice_service.model_pool.get_status() if Plugin.voice_service else None,
+                "speech_detection": Plugin.voice_service.speech_detection if Plugin.voice_service else True,
+                "inference_worker": Plugin.inference_worker_status,
+                "transcription_server": Plugin.transcription_server.get_status() if Plugin.transcription_server else None,
+                "dictation_queue": Plugin.voice_service.dictations.get_status() if Plugin.voice_service else None,
+                "last_speech_detection": Plugin.voice_service.last_speech_detection if Plugin.voice_service else None,
+                "no_speech_count": Plugin.voice_service.no_speech_count if Plugin.voice_service else 0,
+                "model_swap": dict(Plugin.voice_service.model_swap) if Plugin.voice_service and Plugin.voice_service.model_swap else None,
             }
         except Exception as e:
             logger.error(f"Error getting status: {traceback.format_exc()}")
@@ -968,6 +1892,7 @@ class Plugin:
             # Model construction and first-time download are blocking. Keep
             # Decky's RPC event loop responsive so status calls can report
             # progress instead of leaving the frontend stuck initializing.
+            # The warm-up pass that follows runs on its own thread.
             success = await asyncio.to_thread(Plugin.voice_service._load_model)
             if success:
                 logger.info("Model loaded successfully")
@@ -0,0 +1,129 @@
+"""Named faster-whisper decoding profiles trading accuracy for latency.
+
+Chat callouts are usually one to three seconds long, where greedy decoding is
+much faster than beam search with almost identical output. Presets choose a
+profile in ``game_presets.json``; users can override it at runtime.
+"""
+
+import math
+import zlib
+
+# faster-whisper's default temperature fallback ladder.
+_FULL_FALLBACK = [0.0, 0.2, 0.4, 0.6, 0.8, 1.0]
+
+DECODING_PROFILES = {
+    "fast": {
+        "beam_size": 1,
+        "best_of": 1,
+        "temperature": [0.0, 0.4, 0.8],
+        "compression_ratio_threshold": 2.4,
+        "log_prob_threshold": -1.0,
+        "no_speech_threshold": 0.6,
+    },
+    "balanced": {
+        "beam_size": 3,
+        "best_of": 3,
+        "temperature": [0.0, 0.3, 0.6, 1.0],
+        "compression_ratio_threshold": 2.4,
+        "log_prob_threshold": -1.0,
+        "no_speech_threshold": 0.6,
+    },
+    # Matches the decoding Decktation used before profiles existed.
+    "accurate": {
+        "beam_size": 5,
+        "best_of": 5,
+        "temperature": _FULL_FALLBACK,
+        "compression_ratio_threshold": 2.4,
+        "log_prob_threshold": -1.0,
+        "no_speech_threshold": 0.6,
+    },
+}
+
+AUTO_PROFILE = "auto"
+DEFAULT_DECODING_PROFILE = AUTO_PROFILE
+SUPPORTED_DECODING_PROFILES = set(DECODING_PROFILES) | {AUTO_PROFILE}
+
+# "auto" decodes utterances up to this long greedily and longer ones with
+# beam search, where the extra hypotheses start to pay off.
+AUTO_SHORT_UTTERANCE_SECONDS = 4.0
+
+
+def resolve_decoding_profile(name, duration):
+    """Return (profile name, transcribe kwargs) for an utterance duration."""
+    if name not in SUPPORTED_DECODING_PROFILES:
+        name = DEFAULT_DECODING_PROFILE
+    if name == AUTO_PROFILE:
+        name = "fast" if duration <= AUTO_SHORT_UTTERANCE_SECONDS else "accurate"
+    options = dict(DECODING_PROFILES[name])
+    options["temperature"] = list(options["temperature"])
+    return name, options
+
+
+# Whisper's native window. faster-whisper keeps the last ``chunk_length`` it
+# was given on the shared feature extractor, so it is always passed explicitly.
+FULL_ENCODER_WINDOW_SECONDS = 30
+
+# Same threshold Whisper uses to reject repetitive temperature fallbacks.
+DEGENERATE_COMPRESSION_RATIO = 2.4
+
+
+# faster-whisper's batched pipeline decodes the speech chunks of one
+# recording side by side, which only helps when VAD finds several of them,
+# e.g. phrases separated by pauses in a 5 s continuous-mode recording.
+BATCHED_MIN_CHUNKS = 2
+# One chunk per Steam Deck core; larger batches only add memory.
+DEFAULT_BATCH_SIZE = 4
+
+
+# Fast speech runs at about four words, or six tokens, per second.
+DECODE_TOKENS_PER_SECOND = 6
+DECODE_TOKEN_HEADROOM = 16
+# Leaves room for the context prompt and hotwords in Whisper's 448 tokens.
+MAX_DECODE_TOKENS = 160
+
+
+def decode_token_budget(duration):
+    """Return ``max_new_tokens`` for an utterance of ``duration`` seconds."""
+    budget = DECODE_TOKEN_HEADROOM + math.ceil(duration * DECODE_TOKENS_PER_SECOND)
+    return min(MAX_DECODE_TOKENS, budget)
+
+
+def compression_ratio(text):
+    encoded = text.encode("utf-8")
+    return len(encoded) / len(zlib.compress(encoded))
+
+
+class LoopBreaker:
+    """Spot a hallucination loop while segments are still being generated.
+
+    faster-whisper decodes lazily, so rejecting a segment and no longer
+    iterating stops the remaining decoder work as well.
+    """
+
+    def __init__(self, max_repeats=2, min_chars=24):
+        self.max_repeats = max_repeats  # identical segments allowed in a row
+        self.min_chars = min_chars  # short text compresses poorly either way
+        self.reason = None
+        self._accepted = ""
+        self._last = None
+        self._repeats = 0
+
+    def accept(self, text):
+        """Return False, and set ``reason``, if ``text`` continues a loop."""
+        normalized = " ".join(text.lower().split())
+        if not normalized:
+            return True
+
+        self._repeats = self._repeats + 1 if normalized == self._last else 1
+        self._last = normalized
+        if self._repeats > self.max_repeats:
+            self.reason = "repeated_segment"
+            return False
+
+        candidate = f"{self._accepted} {normalized}".strip()
+        if len(candidate) >= self.min_chars and compression_ratio(candidate) > DEGENERATE_COMPRESSION_RATIO:
+            self.reason = "compression_ratio"
+            return False
+
+        self._accepted = candidate
+        return True
@@ -0,0 +1,130 @@
+"""Ordered hand-off from finished recordings to transcription and sending.
+
+Releasing the combo only has to package the recording as a job, so the
+microphone and the button poller are free for the next press while earlier
+messages are still being decoded and typed. A single worker runs the jobs,
+which keeps messages in the order they were spoken.
+
+Each job carries a cancellation token. Cancelling skips a job that has not
+started, stops an in-flight decode between segments and drops its text
+before anything is typed.
+"""
+
+import threading
+import time
+from collections import deque
+
+
+class DictationJob:
+    """One released recording waiting to be transcribed and sent."""
+
+    def __init__(self, audio=None, streamer=None, send=True, on_done=None, cancelled=None):
+        self.audio = audio  # owned copy of the speech span
+        self.streamer = streamer  # or a stopped StreamingTranscriber
+        self.send = send
+        self.on_done = on_done  # called with True/False once processed
+        # Shared with the streamer, so its chunk decodes see it as well.
+        self.cancelled = cancelled or threading.Event()
+        self.id = None
+        self.queued_at = time.monotonic()
+        self.done = threading.Event()
+
+    def cancel(self):
+        self.cancelled.set()
+
+    def wait(self, timeout=None):
+        """Block until the job has been transcribed and sent."""
+        return self.done.wait(timeout)
+
+
+class DictationQueue:
+    """Run dictation jobs one at a time, oldest first."""
+
+    def __init__(self, process):
+        self.process = process
+        self.completed = 0
+        self.failed = 0
+        self.cancelled = 0
+        self._jobs = deque()
+        self._active = None
+        self._next_id = 1
+        self._condition = threading.Condition()
+        self._thread = None
+
+    def submit(self, job):
+        with self._condition:
+            job.id = self._next_id
+            self._next_id += 1
+            self._jobs.append(job)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+            self._condition.notify_all()
+        return job
+
+    def depth(self):
+        """Jobs not yet finished, including the one being processed."""
+        with self._condition:
+            return len(self._jobs) + (self._active is not None)
+
+    def cancel_all(self):
+        """Cancel queued and in-flight jobs; returns how many were cancelled."""
+        with self._condition:
+            jobs = list(self._jobs)
+            if self._active is not None:
+                jobs.insert(0, self._active)
+        for job in jobs:
+            job.cancel()
+        return len(jobs)
+
+    def wait_idle(self, timeout=None):
+        """Block until every submitted job has finished; False on timeout."""
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._jobs and self._active is None, timeout
+            )
+
+    def _run(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._jobs)
+                job = self._active = self._jobs.popleft()
+
+            success = True
+            if job.cancelled.is_set():
+                print(f"Dictation job {job.id} cancelled before it started")
+            else:
+                try:
+                    self.process(job)
+                except Exception as e:
+                    success = False
+                    print(f"Dictation job {job.id} failed: {e}")
+            if job.on_done:
+                try:
+                    job.on_done(success)
+                except Exception as e:
+                    print(f"Dictation job {job.id} callback failed: {e}")
+
+            with self._condition:
+                self._active = None
+                if not success:
+                    self.failed += 1
+                elif job.cancelled.is_set():
+                    self.cancelled += 1
+                else:
+                    self.completed += 1
+                self._condition.notify_all()
+            job.done.set()
+
+    def get_status(self):
+        with self._condition:
+            return {
+                "depth": len(self._jobs) + (self._active is not None),
+                "in_progress": self._active.id if self._active else None,
+                "oldest_wait_seconds": (
+                    round(time.monotonic() - self._jobs[0].queued_at, 3) if self._jobs else None
+                ),
+                "completed": self.completed,
+                "failed": self.failed,
+                "cancelled": self.cancelled,
+            }
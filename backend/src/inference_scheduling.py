@@ -0,0 +1,137 @@
+"""Keep Whisper inference from competing with the game for CPU time.
+
+A transcription burst can use every core right when the player is in combat
+and talking, which shows up as stutter in the game's frame pacing. The policy
+here makes inference yield instead:
+
+- inference threads run at a lower nice value and under ``SCHED_BATCH``, so
+  the kernel prefers the game's threads whenever both are runnable;
+- CTranslate2 gets at most ``max_threads`` threads;
+- optionally, inference threads are pinned to a subset of cores.
+
+Linux applies nice values, scheduling policy and CPU affinity per thread, and
+new threads inherit them. Lowering a thread's priority cannot be undone
+without CAP_SYS_NICE, so the policy is only ever applied to threads it owns:
+models are built and decoded on the policy's own threads, and the threads
+CTranslate2 starts while a model is constructed inherit it from there. The
+caller's thread, such as an asyncio executor thread, is never changed. The
+out-of-process inference worker is additionally moved into a cgroup with a
+low ``cpu.weight`` when the cgroup filesystem allows it.
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+LOW_PRIORITY_NICE = 10
+CGROUP_ROOT = "/sys/fs/cgroup"
+CGROUP_NAME = "decktation-inference"
+# cgroup v2 default is 100; the game's cgroup keeps five times the share.
+LOW_CPU_WEIGHT = 20
+PRIORITIES = ("low", "normal")
+# Policy threads for model construction and decoding; CTranslate2 runs the
+# heavy work on its own threads, so a few suffice for concurrent callers.
+POLICY_THREADS = 4
+
+
+class InferenceScheduling:
+    """CPU scheduling policy for threads and processes that run inference."""
+
+    def __init__(self, priority="low", max_threads=0, cpus=None, cgroup_root=CGROUP_ROOT):
+        if priority not in PRIORITIES:
+            raise ValueError(f"Unsupported inference priority: {priority}")
+        self.priority = priority
+        self.max_threads = max_threads  # 0 leaves the thread count alone
+        self.cpus = sorted(set(cpus or ()))  # empty leaves affinity alone
+        self.cgroup_root = cgroup_root
+        # Outcome of the last attempt per mechanism: True, False or None (unused).
+        self.outcome = {"nice": None, "sched_batch": None, "affinity": None, "cgroup": None}
+        self._local = threading.local()
+        self._executor = None
+        self._executor_lock = threading.Lock()
+
+    def cap_threads(self, cpu_threads):
+        """Return ``cpu_threads`` (0 = CTranslate2's default) under the cap."""
+        if not self.max_threads:
+            return cpu_threads
+        return min(cpu_threads, self.max_threads) if cpu_threads else self.max_threads
+
+    def _set(self, name, action):
+        try:
+            action()
+            self.outcome[name] = True
+        except (OSError, AttributeError, ValueError) as e:
+            if self.outcome[name] is not False:
+                print(f"Inference scheduling: {name} unavailable ({e})")
+            self.outcome[name] = False
+
+    def _apply(self, pid):
+        """Apply the policy to thread or process ``pid`` (0 = calling thread)."""
+        tid = pid or threading.get_native_id()
+        nice = LOW_PRIORITY_NICE if self.priority == "low" else 0
+        policy = "SCHED_BATCH" if self.priority == "low" else "SCHED_OTHER"
+        # Going back to nice 0 needs CAP_SYS_NICE; without it the thread
+        # simply stays at the lower priority.
+        self._set("nice", lambda: os.setpriority(os.PRIO_PROCESS, tid, nice))
+        self._set("sched_batch", lambda: os.sched_setscheduler(
+            pid, getattr(os, policy), os.sched_param(0)
+        ))
+        if self.cpus:
+            def pin():
+                cpus = set(self.cpus) & os.sched_getaffinity(0)
+                if not cpus:
+                    raise ValueError(f"none of CPUs {self.cpus} are available")
+                os.sched_setaffinity(pid, cpus)
+            self._set("affinity", pin)
+
+    def _start_policy_thread(self):
+        self._local.policy_thread = True
+        self._apply(0)
+
+    def run(self, function, *args, **kwargs):
+        """Call ``function`` on one of the policy's threads and return its result.
+
+        Threads it starts, such as CTranslate2's workers, inherit the policy,
+        while the caller's own thread is left untouched. Calls made from a
+        policy thread run directly.
+        """
+        if getattr(self._local, "policy_thread", False):
+            return function(*args, **kwargs)
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=POLICY_THREADS,
+                    thread_name_prefix="inference",
+                    initializer=self._start_policy_thread,
+                )
+            executor = self._executor
+        return executor.submit(function, *args, **kwargs).result()
+
+    def close(self):
+        """Let the policy threads exit once their current work is done."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def apply_to_process(self, pid):
+        """Schedule another process, e.g. the inference worker, by the policy."""
+        self._apply(pid)
+        if self.priority == "low":
+            self._set("cgroup", lambda: self._join_cgroup(pid))
+
+    def _join_cgroup(self, pid):
+        path = os.path.join(self.cgroup_root, CGROUP_NAME)
+        os.makedirs(path, exist_ok=True)
+        with open(os.path.join(path, "cpu.weight"), "w") as f:
+            f.write(str(LOW_CPU_WEIGHT))
+        with open(os.path.join(path, "cgroup.procs"), "w") as f:
+            f.write(str(pid))
+
+    def get_status(self):
+        return {
+            "priority": self.priority,
+            "max_threads": self.max_threads,
+            "cpus": self.cpus,
+            **self.outcome,
+        }
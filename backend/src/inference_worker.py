@@ -0,0 +1,506 @@
+#!/usr/bin/env python3
+"""Long-lived Whisper inference worker and the client the plugin uses.
+
+In worker mode the Whisper model lives in a helper process started outside
+Decky Loader's process group, so reloading or updating the plugin reattaches
+to an already loaded model instead of paying the full load again, and
+inference no longer shares the loader's GIL and heap.
+
+Control messages are JSON lines over a Unix socket. Audio is never pickled or
+serialized: the client copies the float32 samples into a file in /dev/shm and
+the worker maps the same pages. Segments are produced on demand, one per
+``next`` request, so a caller that stops iterating (the hallucination loop
+breaker) also stops the decoder in the worker.
+"""
+
+import argparse
+import mmap
+import os
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from types import SimpleNamespace
+
+import numpy as np
+
+from local_socket import connect, listen, receive, send
+
+PROTOCOL_VERSION = 2
+SOCKET_PATH = "/tmp/decktation-inference.sock"
+SHARED_AUDIO_DIR = "/dev/shm"
+# Exit when no client has used the worker for this long, so an uninstalled or
+# disabled plugin never leaves a model resident.
+IDLE_EXIT_SECONDS = 30 * 60
+
+
+def write_shared_audio(audio, directory=SHARED_AUDIO_DIR):
+    """Copy float32 samples into a new shared-memory file and return its path."""
+    audio = np.ascontiguousarray(audio, dtype=np.float32)
+    path = os.path.join(directory, f"decktation-audio-{os.getpid()}-{uuid.uuid4().hex}")
+    fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_RDWR, 0o600)
+    try:
+        os.ftruncate(fd, max(audio.nbytes, 1))
+        with mmap.mmap(fd, max(audio.nbytes, 1)) as shared:
+            shared[: audio.nbytes] = memoryview(audio).cast("B")
+    except BaseException:
+        os.unlink(path)
+        raise
+    finally:
+        os.close(fd)
+    return path
+
+
+def read_shared_audio(path, samples):
+    """Map a shared-memory audio file as a read-only float32 array."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        shared = mmap.mmap(fd, max(samples * 4, 1), prot=mmap.PROT_READ)
+    finally:
+        os.close(fd)
+    return np.frombuffer(shared, dtype=np.float32, count=samples)
+
+
+def _model_key(model_size, compute_type, cpu_threads=0, num_workers=1):
+    key = f"{model_size}:{compute_type}"
+    if cpu_threads or num_workers != 1:
+        key += f":{cpu_threads}t:{num_workers}w"
+    return key
+
+
+def _request_key(request):
+    return _model_key(
+        request["model_size"],
+        request["compute_type"],
+        request.get("cpu_threads", 0),
+        request.get("num_workers", 1),
+    )
+
+
+class InferenceWorker:
+    """Owns Whisper models on behalf of one plugin backend at a time."""
+
+    def __init__(self, version, idle_exit_seconds=IDLE_EXIT_SECONDS):
+        self.version = version
+        self.idle_exit_seconds = idle_exit_seconds
+        # key -> {"model", "model_size", "compute_type", "cpu_threads", "num_workers", "refs"}
+        self.models = {}
+        self._models_lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._active = 0
+        self._last_activity = time.monotonic()
+        self._stop = threading.Event()
+
+    def hello(self):
+        with self._models_lock:
+            models = [
+                {
+                    "model_size": entry["model_size"],
+                    "compute_type": entry["compute_type"],
+                    "cpu_threads": entry.get("cpu_threads", 0),
+                    "num_workers": entry.get("num_workers", 1),
+                }
+                for entry in self.models.values()
+            ]
+        return {
+            "protocol": PROTOCOL_VERSION,
+            "version": self.version,
+            "pid": os.getpid(),
+            "models": models,
+        }
+
+    def load(self, model_size, compute_type, cpu_threads=0, num_workers=1):
+        key = _model_key(model_size, compute_type, cpu_threads, num_workers)
+        with self._load_lock:
+            with self._models_lock:
+                entry = self.models.get(key)
+                if entry is not None:
+                    entry["refs"] += 1
+                    return {"cached": True, "load_seconds": 0.0}
+
+            from faster_whisper import WhisperModel
+
+            started = time.monotonic()
+            # The backend sends calibrated and capped thread counts.
+            model = WhisperModel(
+                model_size,
+                device="cpu",
+                compute_type=compute_type,
+                cpu_threads=cpu_threads,
+                num_workers=num_workers,
+            )
+            with self._models_lock:
+                self.models[key] = {
+                    "model": model,
+                    "model_size": model_size,
+                    "compute_type": compute_type,
+                    "cpu_threads": cpu_threads,
+                    "num_workers": num_workers,
+                    "refs": 1,
+                }
+        return {"cached": False, "load_seconds": round(time.monotonic() - started, 3)}
+
+    def release(self, model_size, compute_type, cpu_threads=0, num_workers=1):
+        key = _model_key(model_size, compute_type, cpu_threads, num_workers)
+        with self._models_lock:
+            entry = self.models.get(key)
+            if entry is None:
+                return {"released": False}
+            entry["refs"] -= 1
+            if entry["refs"] > 0:
+                return {"released": False}
+            del self.models[key]
+        from model_residency import release_freed_memory
+
+        release_freed_memory()
+        return {"released": True}
+
+    def retain(self, keep):
+        """Drop models a previous backend left behind, except ``keep``.
+
+        Kept models stay loaded without references until the reattached
+        backend loads them again.
+        """
+        keep = {_request_key(model) for model in keep}
+        with self._models_lock:
+            for key in list(self.models):
+                if key in keep:
+                    self.models[key]["refs"] = 0
+                else:
+                    del self.models[key]
+        from model_residency import release_freed_memory
+
+        release_freed_memory()
+        return self.hello()
+
+    def transcribe(self, stream, request):
+        key = _request_key(request)
+        with self._models_lock:
+            entry = self.models.get(key)
+        if entry is None:
+            raise RuntimeError(f"model {key} is not loaded in the inference worker")
+
+        audio = read_shared_audio(request["audio"], request["samples"])
+        segments, info = entry["model"].transcribe(audio, **request["options"])
+        send(stream, {
+            "ok": True,
+            "info": {
+                "language": info.language,
+                "language_probability": info.language_probability,
+                "duration": info.duration,
+            },
+        })
+        # Decode one segment per request; a closed connection stops decoding.
+        segments = iter(segments)
+        while receive(stream).get("op") == "next":
+            segment = next(segments, None)
+            if segment is None:
+                send(stream, {"done": True})
+                return
+            send(stream, {
+                "segment": {
+                    "text": segment.text,
+                    "start": segment.start,
+                    "end": segment.end,
+                    "avg_logprob": segment.avg_logprob,
+                    "no_speech_prob": segment.no_speech_prob,
+                    "compression_ratio": segment.compression_ratio,
+                }
+            })
+
+    def handle(self, stream):
+        with self._models_lock:
+            self._active += 1
+        try:
+            while True:
+                try:
+                    request = receive(stream)
+                except (ConnectionError, OSError):
+                    return
+                op = request.get("op")
+                try:
+                    if op == "transcribe":
+                        self.transcribe(stream, request)
+                        return
+                    if op == "hello":
+                        reply = self.hello()
+                    elif op == "load":
+                        reply = self.load(
+                            request["model_size"], request["compute_type"],
+                            request.get("cpu_threads", 0), request.get("num_workers", 1),
+                        )
+                    elif op == "release":
+                        reply = self.release(
+                            request["model_size"], request["compute_type"],
+                            request.get("cpu_threads", 0), request.get("num_workers", 1),
+                        )
+                    elif op == "retain":
+                        reply = self.retain(request["models"])
+                    elif op == "shutdown":
+                        self._stop.set()
+                        reply = {}
+                    else:
+                        raise ValueError(f"unknown inference worker op: {op}")
+                    send(stream, {"ok": True, **reply})
+                except (ConnectionError, BrokenPipeError):
+                    return
+                except Exception as e:
+                    print(f"Inference worker {op} failed: {e}", flush=True)
+                    send(stream, {"ok": False, "error": str(e)})
+        finally:
+            with self._models_lock:
+                self._active -= 1
+                self._last_activity = time.monotonic()
+
+    def serve(self, socket_path):
+        server = listen(
+            lambda rfile, wfile: self.handle(_Stream(rfile, wfile)), socket_path=socket_path
+        )
+        server.timeout = 1
+        print(f"Inference worker {os.getpid()} listening on {socket_path}", flush=True)
+        try:
+            while not self._stop.is_set():
+                server.handle_request()
+                idle = time.monotonic() - self._last_activity
+                if not self._active and self.idle_exit_seconds and idle >= self.idle_exit_seconds:
+                    print("Inference worker idle, exiting", flush=True)
+                    break
+        finally:
+            # Unlink before closing: clients only see the worker gone once the
+            # path is free for a replacement to bind.
+            if os.path.exists(socket_path):
+                os.unlink(socket_path)
+            server.server_close()
+
+
+class _Stream:
+    """Join a request handler's read and write files into one stream."""
+
+    def __init__(self, rfile, wfile):
+        self.readline = rfile.readline
+        self.write = wfile.write
+        self.flush = wfile.flush
+
+
+class InferenceWorkerClient:
+    """Talks to the inference worker; each request uses its own connection.
+
+    With a ``reconnect`` callable, a worker that has exited (it does after
+    being idle) is replaced on the next request instead of failing every
+    later load. ``generation`` counts the replacements so models loaded in
+    an earlier worker know to load again.
+    """
+
+    def __init__(self, socket_path=SOCKET_PATH, shared_audio_dir=SHARED_AUDIO_DIR, timeout=300,
+                 reconnect=None):
+        self.socket_path = socket_path
+        self.shared_audio_dir = shared_audio_dir
+        self.timeout = timeout
+        self.reconnect = reconnect  # () -> None; respawns or reattaches
+        self.generation = 0
+        self._reconnect_lock = threading.Lock()
+
+    def _connect(self):
+        try:
+            return self._open()
+        except OSError:
+            if self.reconnect is None:
+                raise
+        generation = self.generation
+        with self._reconnect_lock:
+            # Another caller may have replaced the worker meanwhile.
+            if generation == self.generation:
+                print("Inference worker is gone, starting it again")
+                self.reconnect()
+                self.generation += 1
+        return self._open()
+
+    def _open(self):
+        return connect(socket_path=self.socket_path, timeout=self.timeout)
+
+    def request(self, op, **fields):
+        sock, stream = self._connect()
+        try:
+            send(stream, {"op": op, **fields})
+            reply = receive(stream, "inference worker")
+        finally:
+            stream.close()
+            sock.close()
+        if not reply.pop("ok", False):
+            raise RuntimeError(reply.get("error", f"inference worker {op} failed"))
+        return reply
+
+    def hello(self):
+        """Return the worker's hello, or None when no worker is listening."""
+        try:
+            sock, stream = self._open()
+        except OSError:
+            return None
+        try:
+            send(stream, {"op": "hello"})
+            reply = receive(stream, "inference worker")
+        except (OSError, ValueError):
+            return None
+        finally:
+            stream.close()
+            sock.close()
+        return reply if reply.pop("ok", False) else None
+
+    def wait_for_hello(self, timeout):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            hello = self.hello()
+            if hello is not None:
+                return hello
+            time.sleep(0.1)
+        return None
+
+    def shutdown(self):
+        # Never spawn a worker just to stop it.
+        reconnect, self.reconnect = self.reconnect, None
+        try:
+            self.request("shutdown")
+        except (OSError, RuntimeError, ValueError):
+            pass
+        finally:
+            self.reconnect = reconnect
+
+    def transcribe(self, settings, audio, options):
+        sock, stream = self._connect()
+        path = write_shared_audio(audio, self.shared_audio_dir)
+        try:
+            send(stream, {
+                "op": "transcribe",
+                **settings,
+                "audio": path,
+                "samples": len(audio),
+                "options": options,
+            })
+            reply = receive(stream, "inference worker")
+        except BaseException:
+            stream.close()
+            sock.close()
+            raise
+        finally:
+            # The worker has mapped the pages by the time it replies.
+            os.unlink(path)
+        if not reply.get("ok"):
+            stream.close()
+            sock.close()
+            raise RuntimeError(reply.get("error", "inference worker transcribe failed"))
+        return self._segments(sock, stream), SimpleNamespace(**reply["info"])
+
+    @staticmethod
+    def _segments(sock, stream):
+        try:
+            while True:
+                send(stream, {"op": "next"})
+                reply = receive(stream, "inference worker")
+                if reply.get("ok") is False:
+                    raise RuntimeError(reply.get("error", "inference worker transcribe failed"))
+                if "segment" not in reply:
+                    return
+                yield SimpleNamespace(**reply["segment"])
+        finally:
+            # Closing early tells the worker to stop decoding.
+            stream.close()
+            sock.close()
+
+
+class RemoteWhisperModel:
+    """Stand-in for ``WhisperModel`` whose weights live in the worker."""
+
+    def __init__(self, client, model_size, compute_type="int8", cpu_threads=0, num_workers=1):
+        self.client = client
+        self.model_size = model_size
+        self.compute_type = compute_type
+        self.settings = {
+            "model_size": model_size,
+            "compute_type": compute_type,
+            "cpu_threads": cpu_threads,
+            "num_workers": num_workers,
+        }
+        self._load()
+
+    def _load(self):
+        reply = self.client.request("load", **self.settings)
+        # A reconnect during the load already counts as this generation.
+        self.generation = self.client.generation
+        self.cached = reply["cached"]
+        self.load_seconds = reply["load_seconds"]
+
+    def transcribe(self, audio, **options):
+        for attempt in range(2):
+            if self.generation != self.client.generation:
+                print(f"Loading {self.model_size} model into the restarted inference worker")
+                self._load()
+            try:
+                return self.client.transcribe(self.settings, audio, options)
+            except RuntimeError:
+                # The worker was replaced while connecting; load and retry once.
+                if attempt or self.generation == self.client.generation:
+                    raise
+
+    def release(self):
+        if self.generation != self.client.generation:
+            return  # the worker that held it has exited
+        try:
+            self.client.request("release", **self.settings)
+        except (OSError, RuntimeError, ValueError) as e:
+            print(f"Could not release {self.model_size} model in the inference worker: {e}")
+
+
+def is_compatible(hello, version):
+    return hello.get("protocol") == PROTOCOL_VERSION and hello.get("version") == version
+
+
+def connect_worker(client, version, spawn, timeout=15):
+    """Reattach to a compatible running worker or start a new one.
+
+    Returns (hello, reattached). An incompatible worker left behind by an
+    older plugin version is shut down and replaced.
+    """
+    hello = client.hello()
+    if hello is not None:
+        if is_compatible(hello, version):
+            return hello, True
+        print(f"Replacing inference worker {hello.get('pid')} from version {hello.get('version')}")
+        client.shutdown()
+        deadline = time.monotonic() + timeout
+        while client.hello() is not None and time.monotonic() < deadline:
+            time.sleep(0.1)
+
+    spawn()
+    hello = client.wait_for_hello(timeout)
+    if hello is None:
+        raise RuntimeError("inference worker did not start")
+    return hello, False
+
+
+def spawn_worker(python_bin, socket_path, version, env=None, log_path="/tmp/decktation-inference.log"):
+    """Start a worker in its own session so it outlives plugin reloads."""
+    with open(log_path, "ab") as log:
+        return subprocess.Popen(
+            [python_bin, os.path.abspath(__file__), "--socket", socket_path, "--version", version],
+            stdin=subprocess.DEVNULL,
+            stdout=log,
+            stderr=subprocess.STDOUT,
+            env=env,
+            start_new_session=True,
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Decktation Whisper inference worker")
+    parser.add_argument("--socket", default=SOCKET_PATH)
+    parser.add_argument("--version", default="unknown")
+    parser.add_argument("--idle-exit-seconds", type=float, default=IDLE_EXIT_SECONDS)
+    args = parser.parse_args()
+
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    InferenceWorker(args.version, args.idle_exit_seconds).serve(args.socket)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Session cache for the language Whisper detects in auto mode.
+
+With ``transcriptionLanguage`` set to auto, faster-whisper runs language
+detection before every utterance, and on one-second callouts it is not
+always right. Once a few utterances in a row were detected confidently as the
+same language, the cache hands that language to the decoder instead, and
+drops it again as soon as a decode with it looks unsure.
+"""
+
+CONFIDENT_STREAK = 3
+MIN_DETECTION_PROBABILITY = 0.8
+# Whisper's own log_prob_threshold for rejecting a decode.
+MIN_CACHED_AVG_LOGPROB = -1.0
+
+
+class LanguageCache:
+    """Track detections and decide when language detection can be skipped."""
+
+    def __init__(
+        self,
+        streak=CONFIDENT_STREAK,
+        min_probability=MIN_DETECTION_PROBABILITY,
+        min_avg_logprob=MIN_CACHED_AVG_LOGPROB,
+    ):
+        self.streak = streak
+        self.min_probability = min_probability
+        self.min_avg_logprob = min_avg_logprob
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.last_invalidation = None
+        self.detected_language = None
+        self.detected_probability = None
+        self.clear()
+
+    def clear(self, reason=None):
+        """Forget the cached language; ``reason`` counts as an invalidation."""
+        self.language = None
+        self._candidate = None
+        self._streak = 0
+        if reason is not None:
+            self.invalidations += 1
+            self.last_invalidation = reason
+
+    def lookup(self):
+        """Return the language to decode with, or None to detect it."""
+        if self.language is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return self.language
+
+    def observe(self, language, probability, avg_logprob, cached):
+        """Record the outcome of a decode that used ``lookup``'s answer."""
+        if cached:
+            # Decoding in the wrong language shows up as unsure tokens.
+            if avg_logprob is not None and avg_logprob < self.min_avg_logprob:
+                print(f"Low confidence with cached language {self.language}, detecting again")
+                self.clear("low_confidence")
+            return
+
+        self.detected_language = language
+        self.detected_probability = probability
+        if language is None or probability is None or probability < self.min_probability:
+            self._candidate = None
+            self._streak = 0
+            return
+        if language == self._candidate:
+            self._streak += 1
+        else:
+            self._candidate = language
+            self._streak = 1
+        if self._streak >= self.streak and self.language is None:
+            print(f"Caching detected language {language} for this session")
+            self.language = language
+
+    def get_status(self):
+        lookups = self.hits + self.misses
+        return {
+            "language": self.language,
+            "detected_language": self.detected_language,
+            "detected_probability": (
+                round(self.detected_probability, 3) if self.detected_probability is not None else None
+            ),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+            "invalidations": self.invalidations,
+            "last_invalidation": self.last_invalidation,
+        }
@@ -0,0 +1,162 @@
+"""Hold dictation latency to a target by trading model quality for speed.
+
+The player sets a release-to-chat target such as "p95 under 1.5 s". Every
+delivered dictation adds its latency to a rolling window; when the window's
+percentile stays over the target, the policy steps down one tier (a smaller
+model, and finally the fast decoding profile), and when it stays well under
+the target it steps back up. Each step needs a fresh window and a sustained
+signal, so one slow dictation never changes the model.
+"""
+
+import bisect
+import time
+from collections import deque
+
+WINDOW = 50
+MIN_SAMPLES = 10
+SUSTAIN_SECONDS = 60
+# A tier is restored only when the slower setup would likely still fit: the
+# percentile has to stay under this share of the target.
+HEADROOM = 0.6
+# Histogram bucket upper bounds in seconds, for the status display.
+BUCKETS = (0.5, 1.0, 1.5, 2.0, 3.0, 5.0)
+
+
+class LatencyHistogram:
+    """Latencies of the most recent dictations."""
+
+    def __init__(self, window=WINDOW):
+        self.samples = deque(maxlen=window)
+
+    def add(self, seconds):
+        self.samples.append(seconds)
+
+    def clear(self):
+        self.samples.clear()
+
+    def __len__(self):
+        return len(self.samples)
+
+    def percentile(self, percent):
+        """Nearest-rank percentile, or None without samples."""
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        rank = max(1, -(-len(ordered) * percent // 100))
+        return ordered[int(rank) - 1]
+
+    def buckets(self):
+        counts = [0] * (len(BUCKETS) + 1)
+        for seconds in self.samples:
+            counts[bisect.bisect_left(BUCKETS, seconds)] += 1
+        labels = [f"<={bound}s" for bound in BUCKETS] + [f">{BUCKETS[-1]}s"]
+        return dict(zip(labels, counts))
+
+
+class LatencySlo:
+    """Pick a downgrade level from measured latencies (0 = configured setup)."""
+
+    def __init__(
+        self,
+        on_change,
+        target_seconds=1.5,
+        percentile=95,
+        max_level=1,
+        min_samples=MIN_SAMPLES,
+        sustain_seconds=SUSTAIN_SECONDS,
+        headroom=HEADROOM,
+        clock=time.monotonic,
+    ):
+        self.on_change = on_change  # (level, percentile_seconds) -> None
+        self.target_seconds = target_seconds
+        self.percentile = percentile
+        self.max_level = max_level
+        self.min_samples = min_samples
+        self.sustain_seconds = sustain_seconds
+        self.headroom = headroom
+        self.clock = clock
+
+        self.histogram = LatencyHistogram()
+        self.level = 0
+        self.changes = 0
+        self.last_change = None
+        self._state = None  # "violated" or "headroom" while sustained
+        self._since = None
+
+    def configure(self, target_seconds, percentile):
+        self.target_seconds = target_seconds
+        self.percentile = percentile
+        self._reset()
+
+    def set_max_level(self, max_level):
+        """Bound the level, e.g. after the configured model size changed."""
+        self.max_level = max_level
+        if self.level > max_level:
+            self._change(max_level, self.histogram.percentile(self.percentile))
+
+    def _reset(self):
+        self.histogram.clear()
+        self._state = None
+        self._since = None
+
+    def state(self):
+        value = self.histogram.percentile(self.percentile)
+        if len(self.histogram) < self.min_samples or value is None:
+            return "measuring"
+        if value > self.target_seconds:
+            return "violated"
+        if value < self.target_seconds * self.headroom:
+            return "headroom"
+        return "ok"
+
+    def record(self, seconds):
+        """Add one dictation's latency; returns the level afterwards."""
+        self.histogram.add(seconds)
+        state = self.state()
+        if state not in ("violated", "headroom"):
+            self._state = self._since = None
+            return self.level
+        if state != self._state:
+            self._state, self._since = state, self.clock()
+            return self.level
+        if self.clock() - self._since < self.sustain_seconds:
+            return self.level
+
+        value = self.histogram.percentile(self.percentile)
+        if state == "violated" and self.level < self.max_level:
+            self._change(self.level + 1, value)
+        elif state == "headroom" and self.level > 0:
+            self._change(self.level - 1, value)
+        return self.level
+
+    def _change(self, level, value):
+        previous, self.level = self.level, level
+        self.changes += 1
+        self.last_change = {
+            "from": previous,
+            "to": level,
+            "percentile_seconds": round(value, 3) if value is not None else None,
+            "at": time.time(),
+        }
+        # Latencies measured on the previous tier say nothing about this one.
+        self._reset()
+        print(
+            f"Latency SLO: p{self.percentile} {value}s vs {self.target_seconds}s target, "
+            f"level {previous} -> {level}"
+        )
+        self.on_change(level, value)
+
+    def get_status(self):
+        value = self.histogram.percentile(self.percentile)
+        return {
+            "target_seconds": self.target_seconds,
+            "percentile": self.percentile,
+            "state": self.state(),
+            "percentile_seconds": round(value, 3) if value is not None else None,
+            "samples": len(self.histogram),
+            "histogram": self.histogram.buckets(),
+            "level": self.level,
+            "max_level": self.max_level,
+            "changes": self.changes,
+            "last_change": self.last_change,
+        }
@@ -0,0 +1,71 @@
+"""JSON-line messages over local stream sockets.
+
+The inference worker and the transcription server share this plumbing. Each
+message is one JSON object per line; a message may announce raw bytes that
+follow it on the same stream. Servers listen on a Unix socket only the
+current user can open, or on a loopback TCP port, so audio never leaves the
+machine.
+"""
+
+import json
+import os
+import socket
+import socketserver
+
+
+def send(stream, message):
+    stream.write(json.dumps(message).encode("utf-8") + b"\n")
+    stream.flush()
+
+
+def receive(stream, peer="peer"):
+    line = stream.readline()
+    if not line:
+        raise ConnectionError(f"{peer} connection closed")
+    return json.loads(line)
+
+
+def connect(socket_path=None, port=None, timeout=None):
+    """Open a connection and return ``(sock, stream)``; close both when done."""
+    if socket_path is not None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        address = socket_path
+    else:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        address = ("127.0.0.1", port)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(address)
+    except OSError:
+        sock.close()
+        raise
+    return sock, sock.makefile("rwb")
+
+
+class _UnixServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+
+class _LocalTCPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+def listen(handle, socket_path=None, port=None):
+    """Return a threading server calling ``handle(rfile, wfile)`` per connection.
+
+    A stale socket file left by a process that died is replaced. Pass
+    ``port=0`` for any free loopback port; it is in ``server_address``.
+    """
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            handle(self.rfile, self.wfile)
+
+    if socket_path is not None:
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        server = _UnixServer(socket_path, Handler)
+        os.chmod(socket_path, 0o600)
+        return server
+    return _LocalTCPServer(("127.0.0.1", port), Handler)
@@ -0,0 +1,73 @@
+"""Re-decode low-confidence results on a larger second-tier model.
+
+Most callouts decode well on ``base``, so every utterance goes through the
+selected model first. Only when faster-whisper's own segment statistics say
+the result is unsure is the same audio decoded again with ``small`` or
+``medium``, which keeps the common path fast without giving up quality on
+hard utterances.
+"""
+
+from collections import deque
+
+# Tighter than Whisper's -1.0 rejection threshold: a decode this unsure is
+# usually wrong on a word or two rather than wholly wrong.
+MIN_AVG_LOGPROB = -0.8
+# Text over audio Whisper itself thinks is silence is often hallucinated.
+MAX_NO_SPEECH_PROB = 0.5
+MAX_COMPRESSION_RATIO = 2.0
+
+
+def escalation_reason(quality, loop_reason=None):
+    """Return why a decode should be escalated, or None when it is confident."""
+    if loop_reason is not None:
+        return "loop_breaker"
+    if not quality.get("text_present"):
+        return None
+    avg_logprob = quality.get("avg_logprob")
+    if avg_logprob is not None and avg_logprob < MIN_AVG_LOGPROB:
+        return "avg_logprob"
+    no_speech_prob = quality.get("no_speech_prob")
+    if no_speech_prob is not None and no_speech_prob > MAX_NO_SPEECH_PROB:
+        return "no_speech_prob"
+    if quality.get("compression_ratio", 0) > MAX_COMPRESSION_RATIO:
+        return "compression_ratio"
+    return None
+
+
+class CascadeStats:
+    """Escalation rate and the latency escalations added."""
+
+    def __init__(self, window=100):
+        self.transcriptions = 0
+        self.escalations = 0
+        # Escalations wanted while the second tier was still loading.
+        self.skipped = 0
+        self.last_reason = None
+        self.added_latencies = deque(maxlen=window)
+
+    def record(self, reason, added_seconds=None):
+        self.transcriptions += 1
+        if reason is None:
+            return
+        self.last_reason = reason
+        if added_seconds is None:
+            self.skipped += 1
+        else:
+            self.escalations += 1
+            self.added_latencies.append(added_seconds)
+
+    def get_status(self):
+        latencies = list(self.added_latencies)
+        return {
+            "transcriptions": self.transcriptions,
+            "escalations": self.escalations,
+            "skipped": self.skipped,
+            "escalation_rate": (
+                round(self.escalations / self.transcriptions, 3) if self.transcriptions else None
+            ),
+            "last_reason": self.last_reason,
+            "mean_added_latency_seconds": (
+                round(sum(latencies) / len(latencies), 3) if latencies else None
+            ),
+            "last_added_latency_seconds": round(latencies[-1], 3) if latencies else None,
+        }
@@ -0,0 +1,161 @@
+"""Keep recently used Whisper models resident within a memory budget.
+
+Switching the model size, whether by hand, through a game preset or through
+the power and latency policies, used to drop the previous model, so
+switching back meant another multi-second load. The pool keeps models keyed
+by (size, compute type) and evicts the least recently used ones once their
+estimated memory exceeds the budget. Models the service is using right now
+are never evicted, even when they alone exceed it.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+# Estimated resident memory of an int8 model including CTranslate2's buffers.
+ESTIMATED_MB = {"base": 250, "small": 500, "medium": 1100}
+# Weight size relative to int8.
+COMPUTE_TYPE_SCALE = {"int8": 1.0, "int8_float32": 1.0, "int16": 1.8, "float32": 3.5}
+DEFAULT_BUDGET_MB = 1024
+
+
+def estimate_mb(model_size, compute_type):
+    return round(ESTIMATED_MB.get(model_size, 500) * COMPUTE_TYPE_SCALE.get(compute_type, 1.0))
+
+
+class ModelPool:
+    """LRU map of (model_size, compute_type) -> loaded model."""
+
+    def __init__(self, release, in_use=lambda: (), budget_mb=DEFAULT_BUDGET_MB, clock=time.monotonic):
+        self.release = release  # frees one evicted model
+        self.in_use = in_use  # models that must stay loaded
+        self.budget_mb = budget_mb  # 0 keeps only the models in use
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()  # key -> {"model", "options", "memory_mb", "used_at"}
+        self._lock = threading.Lock()
+
+    def get(self, key, options):
+        """Return the pooled model for ``key`` built with ``options``, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry["options"] != options:
+                # Built with other threads or settings; a fresh one replaces it.
+                del self._entries[key]
+                stale, entry = entry, None
+            else:
+                stale = None
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                entry["used_at"] = self.clock()
+                self._entries.move_to_end(key)
+        if stale is not None and not self._is_in_use(stale["model"]):
+            self.release(stale["model"])
+        return entry["model"] if entry else None
+
+    def put(self, key, model, options):
+        """Add a newly created model, evicting others to fit the budget.
+
+        Returns the model to use: an equivalent one loaded concurrently wins.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry["options"] == options:
+                duplicate, model = model, entry["model"]
+            else:
+                duplicate = entry["model"] if entry is not None else None
+                self._entries[key] = {
+                    "model": model,
+                    "options": options,
+                    "memory_mb": estimate_mb(*key),
+                    "used_at": self.clock(),
+                }
+            self._entries.move_to_end(key)
+        if duplicate is not None and not self._is_in_use(duplicate):
+            self.release(duplicate)
+        # The caller is about to start using the model.
+        self.trim(keep=key)
+        return model
+
+    def retire(self, model):
+        """Hand back a model the service stopped using.
+
+        A pooled model stays resident until it is evicted; one that is not
+        pooled, e.g. replaced by a rebuild while in use, is released now.
+        """
+        if self._is_in_use(model):
+            return
+        with self._lock:
+            pooled = any(entry["model"] is model for entry in self._entries.values())
+        if pooled:
+            self.trim()
+        else:
+            self.release(model)
+
+    def _is_in_use(self, model):
+        return any(model is used for used in self.in_use())
+
+    def trim(self, keep=None):
+        """Evict least recently used idle models until the pool fits the budget."""
+        evicted = []
+        with self._lock:
+            in_use = list(self.in_use())
+            for key in list(self._entries):
+                if self._used_mb() <= self.budget_mb:
+                    break
+                entry = self._entries[key]
+                if key == keep or any(entry["model"] is used for used in in_use):
+                    continue
+                del self._entries[key]
+                evicted.append((key, entry["model"]))
+        for key, model in evicted:
+            self.evictions += 1
+            print(f"Evicting {key[0]} ({key[1]}) model from the pool")
+            self.release(model)
+        return [key for key, _ in evicted]
+
+    def clear(self):
+        """Drop every model, e.g. to give the memory back to the game."""
+        with self._lock:
+            entries, self._entries = list(self._entries.values()), OrderedDict()
+        for entry in entries:
+            self.release(entry["model"])
+        return len(entries)
+
+    def configure(self, budget_mb):
+        self.budget_mb = budget_mb
+        self.trim()
+
+    def _used_mb(self):
+        return sum(entry["memory_mb"] for entry in self._entries.values())
+
+    def get_status(self):
+        with self._lock:
+            now = self.clock()
+            in_use = list(self.in_use())
+            models = [
+                {
+                    "model_size": key[0],
+                    "compute_type": key[1],
+                    "memory_mb": entry["memory_mb"],
+                    "in_use": any(entry["model"] is used for used in in_use),
+                    "idle_seconds": round(now - entry["used_at"], 1),
+                }
+                # Most recently used first.
+                for key, entry in reversed(self._entries.items())
+            ]
+            used_mb = self._used_mb()
+        lookups = self.hits + self.misses
+        return {
+            "models": models,
+            "used_mb": used_mb,
+            "budget_mb": self.budget_mb,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+            "evictions": self.evictions,
+        }
@@ -0,0 +1,147 @@
+"""Unload the Whisper model when it is idle or the game needs the memory.
+
+The model is reloaded through ``WoWVoiceChat``'s lazy loading path on the next
+combo press, so an unload only costs one slower dictation.
+"""
+
+import ctypes
+import gc
+import threading
+import time
+
+MEMINFO_PATH = "/proc/meminfo"
+STATUS_PATH = "/proc/self/status"
+
+
+def _read_kib_field(path, field):
+    try:
+        with open(path) as f:
+            for line in f:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def read_mem_available(path=MEMINFO_PATH):
+    """Return MemAvailable in bytes, or None when it cannot be read."""
+    return _read_kib_field(path, "MemAvailable")
+
+
+def read_rss(path=STATUS_PATH):
+    """Return this process's resident set size in bytes."""
+    return _read_kib_field(path, "VmRSS")
+
+
+def release_freed_memory():
+    """Return freed heap pages to the OS so the unload shows up in RSS."""
+    gc.collect()
+    try:
+        ctypes.CDLL("libc.so.6").malloc_trim(0)
+    except (OSError, AttributeError):
+        pass
+
+
+class ModelResidency:
+    """Background policy deciding when the loaded model should be dropped."""
+
+    def __init__(
+        self,
+        service,
+        idle_seconds=600,
+        min_available_bytes=1024 * 1024 * 1024,
+        check_interval=15,
+        meminfo_path=MEMINFO_PATH,
+        status_path=STATUS_PATH,
+        clock=time.monotonic,
+    ):
+        self.service = service
+        self.idle_seconds = idle_seconds  # 0 disables idle unloading
+        self.min_available_bytes = min_available_bytes  # 0 disables the watermark
+        self.check_interval = check_interval
+        self.meminfo_path = meminfo_path
+        self.status_path = status_path
+        self.clock = clock
+
+        self.unloaded_reason = None
+        self.unloaded_at = None
+        self.reclaimed_rss_bytes = None
+        self.mem_available_bytes = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def configure(self, idle_seconds, min_available_bytes):
+        self.idle_seconds = idle_seconds
+        self.min_available_bytes = min_available_bytes
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.check_interval):
+            try:
+                self.check()
+            except Exception as e:
+                print(f"Model residency check failed: {e}")
+
+    def unload_reason(self):
+        """Return why the model should be unloaded now, or None to keep it."""
+        self.mem_available_bytes = read_mem_available(self.meminfo_path)
+        if not self.service.is_model_ready():
+            return None
+        if (
+            self.min_available_bytes
+            and self.mem_available_bytes is not None
+            and self.mem_available_bytes < self.min_available_bytes
+        ):
+            return "memory_pressure"
+        if self.idle_seconds and self.clock() - self.service.last_used >= self.idle_seconds:
+            return "idle"
+        return None
+
+    def check(self):
+        """Unload the model if the policy says so; returns the reason."""
+        reason = self.unload_reason()
+        if reason is None:
+            return None
+
+        rss_before = read_rss(self.status_path)
+        if not self.service.unload_model():
+            return None  # a dictation is in progress; try again later
+        release_freed_memory()
+        rss_after = read_rss(self.status_path)
+
+        self.unloaded_reason = reason
+        self.unloaded_at = time.time()
+        if rss_before is not None and rss_after is not None:
+            self.reclaimed_rss_bytes = max(0, rss_before - rss_after)
+        print(f"Unloaded Whisper model ({reason}), reclaimed {self.reclaimed_rss_bytes} bytes RSS")
+        return reason
+
+    def get_status(self):
+        resident = self.service.is_model_ready()
+        return {
+            "resident": resident,
+            "unloaded_reason": None if resident else self.unloaded_reason,
+            "unloaded_at": None if resident else self.unloaded_at,
+            "reclaimed_rss_mb": (
+                round(self.reclaimed_rss_bytes / (1024 * 1024), 1)
+                if self.reclaimed_rss_bytes is not None else None
+            ),
+            "idle_seconds": round(self.clock() - self.service.last_used, 1),
+            "mem_available_mb": (
+                round(self.mem_available_bytes / (1024 * 1024))
+                if self.mem_available_bytes is not None else None
+            ),
+        }
@@ -0,0 +1,203 @@
+"""Drop to a cheaper model setup while the Deck is hot or on battery.
+
+A medium-model dictation that takes a second on a cool, plugged-in Deck can
+take several when the APU is thermally limited or the Deck is saving battery.
+This policy watches the thermal zones, the power supplies and the cpufreq
+limits in sysfs. While any of them says the CPU is constrained, the backend
+runs the next smaller model with fewer threads; the normal setup comes back
+once conditions have stayed good for a while.
+"""
+
+import glob
+import os
+import threading
+import time
+
+SYSFS_ROOT = "/sys"
+HOT_CELSIUS = 85
+# A hot APU has to cool down this far below the limit before it counts as
+# recovered, so the model is not swapped back and forth around the limit.
+COOL_MARGIN_CELSIUS = 10
+# A scaling_max_freq below this share of the hardware maximum means the CPU
+# has been capped, e.g. by a power profile or a frequency limit.
+MIN_FREQ_RATIO = 0.75
+RECOVER_SECONDS = 60
+
+
+def _read(path):
+    try:
+        with open(path) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def _read_int(path):
+    value = _read(path)
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def smaller_model_size(model_size, model_sizes, steps=1):
+    """Return the size ``steps`` below ``model_size`` in ``model_sizes`` (cheapest first)."""
+    return model_sizes[max(0, model_sizes.index(model_size) - steps)]
+
+
+class PowerPolicy:
+    """Background monitor deciding when inference should run constrained."""
+
+    def __init__(
+        self,
+        on_change,
+        sysfs_root=SYSFS_ROOT,
+        hot_celsius=HOT_CELSIUS,
+        min_freq_ratio=MIN_FREQ_RATIO,
+        recover_seconds=RECOVER_SECONDS,
+        check_interval=15,
+        clock=time.monotonic,
+    ):
+        self.on_change = on_change  # (constrained, reasons) -> None
+        self.sysfs_root = sysfs_root
+        self.hot_celsius = hot_celsius
+        self.min_freq_ratio = min_freq_ratio
+        self.recover_seconds = recover_seconds
+        self.check_interval = check_interval
+        self.clock = clock
+
+        self.constrained = False
+        self.reasons = []
+        self.conditions = {}
+        self.transitions = 0
+        self.changed_at = None
+        self._clear_since = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def configure(self, hot_celsius):
+        self.hot_celsius = hot_celsius
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+            self._thread = None
+
+    def _run(self):
+        while True:
+            try:
+                self.check()
+            except Exception as e:
+                print(f"Power policy check failed: {e}")
+            if self._stop.wait(self.check_interval):
+                return
+
+    def _glob(self, *parts):
+        return sorted(glob.glob(os.path.join(self.sysfs_root, *parts)))
+
+    def read_temperature(self):
+        """Return the hottest thermal zone in degrees Celsius, or None."""
+        temperatures = [
+            _read_int(os.path.join(zone, "temp"))
+            for zone in self._glob("class", "thermal", "thermal_zone*")
+        ]
+        temperatures = [t for t in temperatures if t is not None and t > 0]
+        return max(temperatures) / 1000 if temperatures else None
+
+    def read_on_battery(self):
+        """Return whether a battery is discharging, or None without a battery."""
+        statuses = [
+            _read(os.path.join(supply, "status"))
+            for supply in self._glob("class", "power_supply", "*")
+            if _read(os.path.join(supply, "type")) == "Battery"
+        ]
+        if not statuses:
+            return None
+        return "Discharging" in statuses
+
+    def read_freq_ratio(self):
+        """Return the lowest scaling_max_freq / cpuinfo_max_freq, or None."""
+        ratios = []
+        for policy in self._glob("devices", "system", "cpu", "cpufreq", "policy*"):
+            limit = _read_int(os.path.join(policy, "scaling_max_freq"))
+            hardware = _read_int(os.path.join(policy, "cpuinfo_max_freq"))
+            if limit and hardware:
+                ratios.append(limit / hardware)
+        return min(ratios) if ratios else None
+
+    def read_conditions(self):
+        return {
+            "temperature_c": self.read_temperature(),
+            "on_battery": self.read_on_battery(),
+            "freq_ratio": self.read_freq_ratio(),
+        }
+
+    def constraint_reasons(self, conditions):
+        """Return why inference should be constrained under ``conditions``."""
+        reasons = []
+        temperature = conditions["temperature_c"]
+        limit = self.hot_celsius - (COOL_MARGIN_CELSIUS if self.constrained else 0)
+        if temperature is not None and temperature >= limit:
+            reasons.append("thermal")
+        if conditions["on_battery"]:
+            reasons.append("battery")
+        freq_ratio = conditions["freq_ratio"]
+        if freq_ratio is not None and freq_ratio < self.min_freq_ratio:
+            reasons.append("cpufreq")
+        return reasons
+
+    def check(self):
+        """Re-read sysfs and notify ``on_change`` on a transition; returns the state."""
+        self.conditions = self.read_conditions()
+        reasons = self.constraint_reasons(self.conditions)
+        if reasons:
+            self._clear_since = None
+            changed = not self.constrained or reasons != self.reasons
+            self.reasons = reasons
+            if not self.constrained:
+                self._transition(True)
+            elif changed:
+                print(f"Inference still constrained: {', '.join(reasons)}")
+            return self.constrained
+
+        if self.constrained:
+            now = self.clock()
+            if self._clear_since is None:
+                self._clear_since = now
+            if now - self._clear_since >= self.recover_seconds:
+                self._clear_since = None
+                self.reasons = []
+                self._transition(False)
+        return self.constrained
+
+    def _transition(self, constrained):
+        self.constrained = constrained
+        self.transitions += 1
+        self.changed_at = time.time()
+        if constrained:
+            print(f"Constraining inference: {', '.join(self.reasons)}")
+        else:
+            print("Conditions recovered, restoring the normal inference setup")
+        self.on_change(constrained, list(self.reasons))
+
+    def get_status(self):
+        freq_ratio = self.conditions.get("freq_ratio")
+        return {
+            "constrained": self.constrained,
+            "reasons": self.reasons,
+            "temperature_c": self.conditions.get("temperature_c"),
+            "on_battery": self.conditions.get("on_battery"),
+            "freq_ratio": round(freq_ratio, 2) if freq_ratio is not None else None,
+            "hot_celsius": self.hot_celsius,
+            "transitions": self.transitions,
+            "changed_at": self.changed_at,
+            "recovering": self._clear_since is not None,
+        }
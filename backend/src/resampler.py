@@ -0,0 +1,71 @@
+"""Band-limited polyphase resampling to Whisper's 16 kHz input rate.
+
+Linear interpolation folds everything above 8 kHz back into the speech band
+and needs float64 index arrays as long as the recording. A windowed-sinc
+polyphase filter removes those components first and, by computing the output
+in fixed-size blocks, keeps temporary memory independent of the hold length.
+"""
+
+from functools import lru_cache
+from math import gcd
+
+import numpy as np
+
+
+class PolyphaseResampler:
+    """Rational-ratio FIR resampler working in float32."""
+
+    def __init__(self, source_rate, target_rate, taps_per_phase=64, kaiser_beta=5.65, block_size=4096):
+        divisor = gcd(int(source_rate), int(target_rate))
+        self.up = int(target_rate) // divisor
+        self.down = int(source_rate) // divisor
+        self.taps_per_phase = taps_per_phase
+        self.block_size = block_size
+
+        # Prototype low-pass at the virtual upsampled rate, cut off at the
+        # lower of the two Nyquist frequencies. Centering it on an integer
+        # delay keeps the output aligned with the input sample grid.
+        length = taps_per_phase * self.up
+        self._delay = (length - 1) // 2
+        cutoff = 0.5 / max(self.up, self.down)
+        n = np.arange(length) - self._delay
+        prototype = 2 * cutoff * np.sinc(2 * cutoff * n) * np.kaiser(length, kaiser_beta)
+        prototype *= self.up  # restore the gain lost to zero-stuffing
+
+        # bank[phase, tap] = prototype[phase + tap * up]
+        self._bank = np.ascontiguousarray(
+            prototype.reshape(taps_per_phase, self.up).T, dtype=np.float32
+        )
+        self._taps = np.arange(taps_per_phase)
+
+    def output_length(self, input_length):
+        return input_length * self.up // self.down
+
+    def __call__(self, audio):
+        audio = np.asarray(audio, dtype=np.float32).reshape(-1)
+        if self.up == self.down:
+            return audio
+        output_length = self.output_length(len(audio))
+        output = np.empty(output_length, dtype=np.float32)
+        if output_length == 0:
+            return output
+
+        # Zero padding lets every output sample use the full filter.
+        pad = self.taps_per_phase
+        padded = np.zeros(len(audio) + 2 * pad + 1, dtype=np.float32)
+        padded[pad:pad + len(audio)] = audio
+
+        for start in range(0, output_length, self.block_size):
+            stop = min(start + self.block_size, output_length)
+            position = np.arange(start, stop) * self.down + self._delay
+            base = position // self.up + pad
+            phase = position % self.up
+            windows = padded[base[:, None] - self._taps[None, :]]
+            output[start:stop] = np.einsum("ij,ij->i", windows, self._bank[phase])
+        return output
+
+
+@lru_cache(maxsize=8)
+def get_resampler(source_rate, target_rate):
+    """Return a shared resampler; filter design is the expensive part."""
+    return PolyphaseResampler(source_rate, target_rate)
@@ -0,0 +1,132 @@
+"""Streaming energy-based speech detection over captured audio.
+
+The detector follows ``CaptureBuffer`` as the PortAudio callback fills it and
+records where speech starts and ends, so the transcriber can be handed only
+the speech span and a press without speech never touches the Whisper model.
+It is deliberately cheaper and more permissive than faster-whisper's Silero
+VAD, which still runs inside the model call to drop pauses within the span.
+
+``update`` runs in the PortAudio callback, so levels are computed into
+buffers allocated once per recording rather than per block.
+"""
+
+import numpy as np
+
+FRAME_SECONDS = 0.02
+# -40 dBFS; until a quiet frame has been seen the press may have started
+# mid-word, so speech has to clear this.
+MIN_SPEECH_LEVEL = 0.01
+# -54 dBFS; once the noise floor is known, speech only has to stand out from
+# it, so a quiet microphone still registers. Quieter frames are never speech.
+MIN_RELATIVE_SPEECH_LEVEL = 0.002
+# Speech must be this much louder than the tracked noise floor (about 10 dB).
+NOISE_FLOOR_RATIO = 3.0
+# Frames measured per pass over the preallocated buffers (0.5 s).
+FRAMES_PER_PASS = 25
+
+
+def frame_levels(samples, frame_length, frames=None, levels=None):
+    """Return the RMS level of each whole int16 frame in ``samples``.
+
+    ``frames`` (float32, ``(n, frame_length)``) and ``levels`` (float32,
+    ``(n,)``) are scratch buffers to reuse; the result is a view of
+    ``levels`` when they hold at least as many frames as ``samples``.
+    """
+    count = len(samples) // frame_length
+    if count == 0:
+        return []
+    if frames is None or len(frames) < count:
+        frames = np.empty((count, frame_length), dtype=np.float32)
+        levels = np.empty(count, dtype=np.float32)
+    frames, levels = frames[:count], levels[:count]
+    np.copyto(frames, samples[: count * frame_length].reshape(count, frame_length), casting="unsafe")
+    np.square(frames, out=frames)
+    np.sum(frames, axis=1, out=levels)
+    levels *= 1.0 / (frame_length * 32768.0 * 32768.0)
+    return np.sqrt(levels, out=levels)
+
+
+class SpeechDetector:
+    """Track speech start and end offsets, in samples, of one recording."""
+
+    def __init__(
+        self,
+        min_speech_seconds=0.1,
+        pad_before_seconds=0.3,
+        pad_after_seconds=0.4,
+        on_speech=None,
+    ):
+        self.min_speech_seconds = min_speech_seconds
+        self.pad_before_seconds = pad_before_seconds
+        self.pad_after_seconds = pad_after_seconds
+        self.on_speech = on_speech  # called once, on the audio thread
+        self._frames = None
+        self._levels = None
+        self.reset(16000)
+
+    def reset(self, sample_rate):
+        self.sample_rate = sample_rate
+        self.frame_length = max(1, int(sample_rate * FRAME_SECONDS))
+        if self._frames is None or self._frames.shape[1:] != (self.frame_length,):
+            self._frames = np.empty((FRAMES_PER_PASS, self.frame_length), dtype=np.float32)
+            self._levels = np.empty(FRAMES_PER_PASS, dtype=np.float32)
+        self._min_speech_frames = max(1, round(self.min_speech_seconds / FRAME_SECONDS))
+        self._offset = 0
+        self._noise_floor = None
+        self._run_start = None
+        self._run_frames = 0
+        self.speech_start = None
+        self.speech_end = None
+        self.peak_level = 0.0
+
+    @property
+    def detected(self):
+        return self.speech_start is not None
+
+    def update(self, buffer):
+        """Classify whole frames captured since the previous update."""
+        samples = buffer.view(self._offset)
+        pass_length = FRAMES_PER_PASS * self.frame_length
+        for start in range(0, len(samples) - self.frame_length + 1, pass_length):
+            chunk = samples[start:start + pass_length]
+            for level in frame_levels(chunk, self.frame_length, self._frames, self._levels):
+                self._observe(level)
+                self._offset += self.frame_length
+
+    def _observe(self, level):
+        # Until a quiet frame is seen the press may have started mid-word, so
+        # the floor is only learned from frames below the current threshold.
+        if level > self.peak_level:
+            self.peak_level = level
+        threshold = MIN_SPEECH_LEVEL
+        if self._noise_floor is not None:
+            threshold = max(MIN_RELATIVE_SPEECH_LEVEL, self._noise_floor * NOISE_FLOOR_RATIO)
+
+        if level < threshold:
+            self._run_start = None
+            self._run_frames = 0
+            if self._noise_floor is None:
+                self._noise_floor = level
+            else:
+                # Falls at once and rises slowly, so speech cannot lift it.
+                self._noise_floor = min(level, 0.95 * self._noise_floor + 0.05 * level)
+            return
+
+        if self._run_start is None:
+            self._run_start = self._offset
+        self._run_frames += 1
+        if self._run_frames < self._min_speech_frames:
+            return
+        if self.speech_start is None:
+            self.speech_start = self._run_start
+            if self.on_speech:
+                self.on_speech()
+        self.speech_end = self._offset + self.frame_length
+
+    def span(self, total):
+        """Return padded (start, end) sample offsets, or None without speech."""
+        if self.speech_start is None:
+            return None
+        start = self.speech_start - int(self.pad_before_seconds * self.sample_rate)
+        end = self.speech_end + int(self.pad_after_seconds * self.sample_rate)
+        return max(0, start), min(total, end)
@@ -0,0 +1,154 @@
+"""Incremental transcription while the push-to-talk combo is still held.
+
+A background worker decodes stable prefixes of the recording so that, on
+release, only the final tail still has to go through faster-whisper. Chunks are
+cut at the quietest point before the most recent audio, which keeps words from
+being split between two decoder calls.
+"""
+
+import threading
+import time
+
+import numpy as np
+
+
+def find_quiet_split(audio, sample_rate, earliest, latest, frame_seconds=0.02):
+    """Return the sample index of the lowest-energy frame in [earliest, latest)."""
+    frame = max(1, int(sample_rate * frame_seconds))
+    window = np.asarray(audio[earliest:latest]).reshape(-1).astype(np.float32)
+    count = len(window) // frame
+    if count == 0:
+        return latest
+    energy = np.square(window[: count * frame].reshape(count, frame)).mean(axis=1)
+    return earliest + int(np.argmin(energy)) * frame + frame // 2
+
+
+class StreamingTranscriber:
+    """Decode committed audio chunks in a worker thread during recording."""
+
+    def __init__(
+        self,
+        transcribe,
+        read_blocks,
+        sample_rate,
+        ready=None,
+        min_chunk_seconds=4.0,
+        guard_seconds=0.6,
+        poll_interval=0.25,
+        cancelled=None,
+    ):
+        self.transcribe = transcribe
+        self.read_blocks = read_blocks  # returns newly captured PCM blocks
+        self.sample_rate = sample_rate
+        self.ready = ready or (lambda: True)
+        self.min_chunk_seconds = min_chunk_seconds
+        # Audio this close to the live edge may still end mid-word.
+        self.guard_seconds = guard_seconds
+        self.poll_interval = poll_interval
+        self.cancelled = cancelled or threading.Event()
+
+        self._pending = []
+        self._pending_samples = 0
+        self._texts = []
+        self._committed_samples = 0
+        self._decode_spans = []
+        self._stop = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()  # guards _pending against stop()
+        self._detached = False
+        self._released = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self.step()
+            except Exception as e:
+                # The release path decodes whatever was not committed, so a
+                # failed chunk only costs the latency it was meant to save.
+                print(f"Streaming chunk failed: {e}")
+
+    def _collect(self):
+        """Take newly captured blocks unless the recording has been released."""
+        with self._lock:
+            if self._detached:
+                return
+            for block in self.read_blocks():
+                # Copied because the capture buffer is reused by the next press.
+                self._pending.append(np.array(block))
+                self._pending_samples += len(block)
+
+    def step(self):
+        """Commit one stable chunk if enough audio has accumulated."""
+        self._collect()
+
+        guard = int(self.guard_seconds * self.sample_rate)
+        earliest = int(self.min_chunk_seconds * self.sample_rate)
+        if self._pending_samples < earliest + guard or not self.ready():
+            return False
+
+        with self._lock:
+            blocks = list(self._pending)
+        audio = np.concatenate(blocks, axis=0)
+        split = find_quiet_split(audio, self.sample_rate, earliest, len(audio) - guard)
+
+        started = time.monotonic()
+        text = self.transcribe(audio[:split])
+        self._decode_spans.append((started, time.monotonic()))
+
+        self._texts.append(text)
+        self._committed_samples += split
+        with self._lock:
+            # Keep blocks that stop() collected while this chunk was decoding.
+            self._pending = [audio[split:]] + self._pending[len(blocks):]
+            self._pending_samples -= split
+        return True
+
+    def stop(self):
+        """Take the rest of the recording on release without waiting.
+
+        A chunk that is still decoding finishes in the background; ``finish``
+        waits for it.
+        """
+        if self._released is None:
+            self._released = time.monotonic()
+        self._stop.set()
+        self._collect()
+        with self._lock:
+            self._detached = True
+
+    def cancel(self):
+        """Stop streaming without decoding anything that is left."""
+        self.cancelled.set()
+        self._stop.set()
+        with self._lock:
+            self._detached = True
+
+    def finish(self):
+        """Stop streaming, decode the uncommitted tail and return (text, stats)."""
+        self.stop()
+        released = self._released
+        if self._thread:
+            self._thread.join()
+
+        tail_started = time.monotonic()
+        if self._pending_samples and not self.cancelled.is_set():
+            self._texts.append(self.transcribe(np.concatenate(self._pending, axis=0)))
+        finished = time.monotonic()
+
+        # Only decode work that overlapped the hold was taken off the
+        # release-to-text path; a chunk still running at release is clipped.
+        saved = sum(max(0.0, min(end, released) - start) for start, end in self._decode_spans)
+        stats = {
+            "chunks": len(self._decode_spans),
+            "streamed_audio_seconds": round(self._committed_samples / self.sample_rate, 3),
+            "tail_audio_seconds": round(self._pending_samples / self.sample_rate, 3),
+            "tail_decode_seconds": round(finished - tail_started, 3),
+            "release_latency_seconds": round(finished - released, 3),
+            "latency_saved_seconds": round(saved, 3),
+        }
+        text = " ".join(part.strip() for part in self._texts if part and part.strip())
+        return text, stats
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""Serve one resident Whisper model to several local clients.
+
+``wow_voice_chat.py --mode server`` exposes ``transcribe_audio`` on a Unix
+socket or a localhost TCP port so command-line tools and a desktop session
+can share a single loaded model. Each request is a JSON header line followed
+by raw PCM bytes of at most ``MAX_AUDIO_SECONDS``; requests queue for the
+model in arrival order, and the queue is bounded so a busy server rejects
+work instead of piling it up.
+
+The Decky plugin hosts a server on the same socket for its own model unless
+a standalone one already answers there, so the CLI and a desktop session
+transcribe with the model the plugin has loaded. Its own dictations keep
+calling the model directly, since they stream partial results and can be
+cancelled, which a whole-clip request cannot do.
+
+Run this module directly to transcribe WAV files through a running server.
+"""
+
+import argparse
+import json
+import os
+import queue
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+from local_socket import connect, listen, receive, send
+
+SOCKET_PATH = "/tmp/decktation-transcribe.sock"
+DEFAULT_MAX_QUEUE = 8
+# Longer than any dictation; bounds what a client can make the server buffer.
+MAX_AUDIO_SECONDS = 120
+MAX_SAMPLE_RATE = 192000
+_DTYPES = {"int16": 2, "float32": 4}
+
+
+def _percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class _Job:
+    def __init__(self, audio, sample_rate):
+        self.audio = audio
+        self.sample_rate = sample_rate
+        self.received = time.monotonic()
+        self.started = None
+        self.finished = None
+        self.text = None
+        self.error = None
+        self.done = threading.Event()
+
+
+class TranscriptionServer:
+    """Queue transcription requests from many connections onto one model."""
+
+    def __init__(self, service, socket_path=SOCKET_PATH, port=None, max_queue=DEFAULT_MAX_QUEUE):
+        self.service = service
+        self.socket_path = None if port is not None else socket_path
+        self.port = port
+        self.max_queue = max_queue
+        self.jobs = queue.Queue(maxsize=max_queue)
+        self.served = 0
+        self.rejected = 0
+        self.failed = 0
+        self.latencies = deque(maxlen=100)
+        self._stats_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._server = None
+        self._inference_thread = None
+
+    def start(self):
+        self._server = listen(self._handle, socket_path=self.socket_path, port=self.port)
+        if self.socket_path is None:
+            self.port = self._server.server_address[1]
+
+        self._inference_thread = threading.Thread(target=self._run_inference, daemon=True)
+        self._inference_thread.start()
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def close(self):
+        self._stop.set()
+        # Fail queued requests so their clients are not left waiting.
+        while True:
+            try:
+                job = self.jobs.get_nowait()
+            except queue.Empty:
+                break
+            if job is not None:
+                job.error = "transcription server is shutting down"
+                job.finished = time.monotonic()
+                job.done.set()
+        self.jobs.put(None)
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self.socket_path is not None and os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+    def serve_forever(self):
+        self.start()
+        address = self.socket_path or f"127.0.0.1:{self.port}"
+        print(f"Transcription server listening on {address} (queue depth {self.max_queue})")
+        self._stop.wait()
+
+    def _run_inference(self):
+        while True:
+            job = self.jobs.get()
+            if job is None or self._stop.is_set():
+                return
+            job.started = time.monotonic()
+            try:
+                job.text = self.service.transcribe_audio(job.audio, sample_rate=job.sample_rate)
+            except Exception as e:
+                job.error = str(e)
+            job.finished = time.monotonic()
+            job.done.set()
+
+    def _handle(self, rfile, wfile):
+        try:
+            request = receive(rfile)
+        except (ConnectionError, ValueError):
+            return
+        op = request.get("op") if isinstance(request, dict) else None
+        if op == "status":
+            send(wfile, {"ok": True, **self.get_status()})
+        elif op == "transcribe":
+            send(wfile, self._transcribe(rfile, request))
+        else:
+            send(wfile, {"ok": False, "error": f"unknown op: {op}"})
+
+    def _transcribe(self, rfile, request):
+        dtype = request.get("dtype")
+        if dtype not in _DTYPES:
+            return {"ok": False, "error": f"unsupported dtype: {dtype}"}
+        samples = request.get("samples")
+        sample_rate = request.get("sample_rate")
+        if not isinstance(sample_rate, int) or not 0 < sample_rate <= MAX_SAMPLE_RATE:
+            return {"ok": False, "error": f"unsupported sample_rate: {sample_rate}"}
+        if not isinstance(samples, int) or samples < 0:
+            return {"ok": False, "error": f"invalid samples: {samples}"}
+        if samples > MAX_AUDIO_SECONDS * sample_rate:
+            # The payload is not read, so the connection is not reusable.
+            return {"ok": False, "error": f"audio longer than {MAX_AUDIO_SECONDS} seconds"}
+        payload = rfile.read(samples * _DTYPES[dtype])
+        if len(payload) != samples * _DTYPES[dtype]:
+            return {"ok": False, "error": "truncated audio payload"}
+        audio = np.frombuffer(payload, dtype=np.int16 if dtype == "int16" else np.float32)
+
+        job = _Job(audio, sample_rate)
+        try:
+            self.jobs.put_nowait(job)
+        except queue.Full:
+            with self._stats_lock:
+                self.rejected += 1
+            return {"ok": False, "rejected": True, "error": "transcription queue is full"}
+        job.done.wait()
+
+        latency = job.finished - job.received
+        if job.error is not None:
+            with self._stats_lock:
+                self.failed += 1
+            return {"ok": False, "error": job.error}
+        with self._stats_lock:
+            self.served += 1
+            self.latencies.append(latency)
+        return {
+            "ok": True,
+            "text": job.text,
+            "queue_seconds": round(job.started - job.received, 3),
+            "transcribe_seconds": round(job.finished - job.started, 3),
+            "latency_seconds": round(latency, 3),
+        }
+
+    def get_status(self):
+        with self._stats_lock:
+            latencies = list(self.latencies)
+        return {
+            "queue_depth": self.jobs.qsize(),
+            "max_queue": self.max_queue,
+            "served": self.served,
+            "rejected": self.rejected,
+            "failed": self.failed,
+            "model_ready": self.service.is_model_ready(),
+            "latency_p50_seconds": round(_percentile(latencies, 0.5), 3) if latencies else None,
+            "latency_p95_seconds": round(_percentile(latencies, 0.95), 3) if latencies else None,
+        }
+
+
+class TranscriptionClient:
+    """Send audio to a running transcription server."""
+
+    def __init__(self, socket_path=SOCKET_PATH, port=None, timeout=120):
+        self.socket_path = None if port is not None else socket_path
+        self.port = port
+        self.timeout = timeout
+
+    def _request(self, header, payload=b""):
+        sock, stream = connect(self.socket_path, self.port, self.timeout)
+        try:
+            with stream:
+                stream.write(json.dumps(header).encode("utf-8") + b"\n")
+                stream.write(payload)
+                stream.flush()
+                return receive(stream, "transcription server")
+        finally:
+            sock.close()
+
+    def transcribe(self, audio, sample_rate):
+        """Transcribe int16 or float32 mono samples; returns the reply dict."""
+        audio = np.ascontiguousarray(audio)
+        dtype = "int16" if audio.itemsize == 2 else "float32"
+        header = {
+            "op": "transcribe",
+            "samples": len(audio),
+            "sample_rate": sample_rate,
+            "dtype": dtype,
+        }
+        return self._request(header, memoryview(audio).cast("B"))
+
+    def status(self):
+        return self._request({"op": "status"})
+
+
+def main():
+    import wave
+
+    parser = argparse.ArgumentParser(description="Transcribe WAV files with a running Decktation server")
+    parser.add_argument("files", nargs="*", help="16-bit mono WAV files")
+    parser.add_argument("--socket", default=SOCKET_PATH, help=f"Unix socket path (default: {SOCKET_PATH})")
+    parser.add_argument("--port", type=int, help="Localhost TCP port instead of the Unix socket")
+    parser.add_argument("--status", action="store_true", help="Print server status")
+    args = parser.parse_args()
+
+    client = TranscriptionClient(socket_path=args.socket, port=args.port)
+    for path in args.files:
+        with wave.open(path, "rb") as wav:
+            audio = np.frombuffer(wav.readframes(wav.getnframes()), dtype=np.int16)
+            reply = client.transcribe(audio, wav.getframerate())
+        print(f"{path}: {json.dumps(reply)}")
+    if args.status or not args.files:
+        print(json.dumps(client.status()))
+
+
+if __name__ == "__main__":
+    main()
@@ -6,21 +6,55 @@ Captures voice input, transcribes with faster-whisper, and sends to WoW chat
 
 import os
 import json
+import functools
+import math
 import time
-import queue
+import tempfile
 import threading
 import subprocess
 from pathlib import Path
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
 from faster_whisper import WhisperModel
+try:
+    from faster_whisper import BatchedInferencePipeline
+    from faster_whisper.vad import get_speech_timestamps
+except ImportError:  # faster-whisper < 1.1
+    BatchedInferencePipeline = None
+    get_speech_timestamps = None
 import sounddevice as sd
 import numpy as np
 import wave
+from collections import deque
+
+from audio_capture import CaptureBuffer, PreRollBuffer
+from decoding_profiles import (
+    AUTO_PROFILE,
+    BATCHED_MIN_CHUNKS,
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_DECODING_PROFILE,
+    FULL_ENCODER_WINDOW_SECONDS,
+    LoopBreaker,
+    compression_ratio,
+    decode_token_budget,
+    resolve_decoding_profile,
+)
+from dictation_jobs import DictationJob, DictationQueue
+from inference_scheduling import InferenceScheduling
+from model_pool import DEFAULT_BUDGET_MB, ModelPool
+from language_cache import LanguageCache
+from model_cascade import CascadeStats, escalation_reason
+from resampler import get_resampler
+from speech_detection import SpeechDetector
+from streaming_transcription import StreamingTranscriber
+from transcription_server import DEFAULT_MAX_QUEUE, SOCKET_PATH, TranscriptionServer
 
 
 class WoWVoiceChat:
-    def __init__(self, context_file="wow_context.json", sample_rate=44100, default_channel="say", lazy_load=False, test_mode=False, test_audio_file=None, preset=None, confirm_delay=0, manual_send=False, transcription_language=None, model_size="base", diagnostic_reporter=None):
+    def __init__(self, context_file="wow_context.json", sample_rate=44100, default_channel="say", lazy_load=False, test_mode=False, test_audio_file=None, preset=None, confirm_delay=0, manual_send=False, transcription_language=None, model_size="base", diagnostic_reporter=None, streaming_transcription=False, warm_mic=False, pre_roll_ms=0, decoding_profile=None, speech_detection=True, model_factory=None, batched_inference=False, batch_size=DEFAULT_BATCH_SIZE, cascade_model_size=None, cpu_tuning=None, scheduling=None, latency_reporter=None, model_pool_mb=DEFAULT_BUDGET_MB, event_reporter=None):
         self.preset = preset or {}
         self.diagnostic_reporter = diagnostic_reporter
+        self.latency_reporter = latency_reporter  # called with release-to-chat seconds
+        self.event_reporter = event_reporter  # called with (name, **data) for non-failures
         self.context_file = Path(context_file)
         self.sample_rate = sample_rate  # Recording sample rate
         self.whisper_sample_rate = 16000  # Whisper expects 16kHz
@@ -28,33 +62,127 @@ class WoWVoiceChat:
         self.confirm_delay = confirm_delay  # seconds to wait before auto-sending (0 = disabled)
         self.manual_send = manual_send  # if True, skip final Enter press (user sends manually)
         self.transcription_language = None if transcription_language in (None, "", "auto") else transcription_language
+        # Auto mode stops detecting once the session's language is clear
+        self.language_cache = LanguageCache()
         self.model_size = model_size
+        # Low-confidence results are decoded again on this larger model
+        self.cascade_model_size = cascade_model_size
+        self.cascade_stats = CascadeStats()
+        # Why escalation is off for now, e.g. while the power policy holds the
+        # model below its configured size; None while it is allowed.
+        self.cascade_paused = None
+        self._cascade = None  # (model size, model)
+        self._cascade_loading = False
+        self._cascade_lock = threading.Lock()
+        # None follows the preset's decoding_profile
+        self.decoding_profile = decoding_profile
+        self.last_decoding_profile = None
+        # Long recordings can decode their VAD chunks as one batch
+        self.batched_inference = batched_inference
+        self.batch_size = batch_size
+        self.last_decode_batched = False
+        self.decode_guard_stats = {
+            "transcriptions": 0,
+            "breaker_fired": 0,
+            "last_reason": None,
+            "last_token_budget": None,
+        }
         self.pending_text = None
         self._pending_timer = None
         self._pending_lock = threading.Lock()
+        self._pending_clear = threading.Event()  # set while nothing awaits confirmation
+        self._pending_clear.set()
 
         # Test mode: use static audio file instead of recording
         self.test_mode = test_mode
         self.test_audio_file = test_audio_file
 
-        # Lazy model loading - only load when needed
+        # Lazy model loading - only load when needed. model_factory replaces
+        # the in-process WhisperModel, e.g. with one owned by a worker process.
+        self.model_factory = model_factory
+        # Calibrated WhisperModel settings by model size (see cpu_tuner.py)
+        self.cpu_tuning = cpu_tuning or {}
+        # Inference yields the CPU to the game (see inference_scheduling.py)
+        self.scheduling = scheduling or InferenceScheduling()
         self.model = None
-        self.model_loading = False
+        # Models replaced by a size change stay resident for switching back.
+        self.model_pool = ModelPool(
+            self._release_model, in_use=self._models_in_use, budget_mb=model_pool_mb
+        )
         self.model_load_error = None
+        # Concurrent loads share one future instead of building the model twice
+        self._load_lock = threading.Lock()
+        self._load_future = None
+        self._load_started = None
+        self._load_waiters = 0
+        self._load_count = 0
+        self._load_seconds = {}  # last successful load time per model size
+
+        # The first transcribe call pays for lazy CTranslate2 allocations, the
+        # VAD ONNX session and tokenizer setup; a warm-up pass absorbs that.
+        self.model_warm = False
+        self.warm_up_seconds = None
+        self.last_used = time.monotonic()  # for idle unloading
+        # Decodes in progress on any thread; the model is never unloaded under them.
+        self._active_decodes = 0
+        self._decode_lock = threading.Lock()
+
+        # Size changes load the new model beside the one that keeps serving.
+        self.model_swap = None
+        self._model_swap_thread = None
+        self._model_swap_count = 0
 
         # Last transcription result (for UI display)
         self.last_transcription = None
         self.last_transcription_time = None
+        self.last_dictation_latency = None
+
+        # Streaming mode decodes stable chunks while the combo is still held
+        self.streaming_transcription = streaming_transcription
+        self._streamer = None
+        self.last_streaming_stats = None
 
         if not lazy_load:
             self._load_model()
 
-        # Audio recording
-        self.audio_queue = queue.Queue()
+        # Audio recording: the callback writes int16 frames into a
+        # preallocated buffer instead of queueing a copy of every block.
+        self.capture_buffer = CaptureBuffer()
+        self.capture_seconds = 30  # preallocated hold length before growing
+        self._capture_read_offset = 0
+        self._capturing = False  # gates callback frames into capture_buffer
         self.is_recording = False
         self.recording_stream = None
         self.recording_lock = threading.Lock()
 
+        # Warm mic keeps one input stream open while dictation is enabled so a
+        # press only has to open the gate instead of opening the device.
+        self.warm_mic = warm_mic
+        self.warm_stream = None
+        self._press_time = None
+        self.first_frame_latencies = {"warm": deque(maxlen=20), "cold": deque(maxlen=20)}
+
+        # Pre-roll keeps the last few hundred ms heard by the warm stream so
+        # speech that starts while the combo is still being pressed survives.
+        self.pre_roll_ms = pre_roll_ms
+        self.pre_roll = None
+        self._pre_roll_pending = False
+
+        # Released recordings are transcribed and sent in order by a worker
+        # so the microphone is free for the next press right away.
+        self.dictations = DictationQueue(self._process_dictation)
+
+        # Speech detection follows the capture so only the speech span is
+        # transcribed and a press without speech never loads the model.
+        self.speech_detection = speech_detection
+        self.speech_detector = SpeechDetector(on_speech=self._preload_model)
+        self.last_speech_detection = None
+        self.no_speech_count = 0  # presses dropped because nothing was heard
+        # The detector fires on the audio thread, which only signals this
+        # worker; it is started with the first recording.
+        self._preload_wanted = threading.Event()
+        self._preload_thread = None
+
         # Context cache
         self.context = {}
 
@@ -130,27 +258,298 @@ class WoWVoiceChat:
             for channel in self.default_channel_commands.keys():
                 self.channel_triggers[channel] = channel
 
-    def _load_model(self):
-        """Load the Whisper model (can be called lazily)"""
+    @property
+    def model_loading(self):
+        future = self._load_future
+        return future is not None and not future.done()
+
+    def _load_model(self, warm_up=True, timeout=None):
+        """Load the Whisper model, or wait for the load that is already running.
+
+        Concurrent callers share a single load, so a dictation that arrives
+        meanwhile waits for the model instead of failing. Returns True once a
+        model is ready, or False if loading failed or ``timeout`` expired.
+        """
         if self.model is not None:
             return True
-        if self.model_loading:
+
+        with self._load_lock:
+            if self.model is not None:
+                return True
+            future = self._load_future
+            leader = future is None or future.done()
+            if leader:
+                future = self._load_future = Future()
+                self._load_started = time.monotonic()
+                self._load_waiters = 0
+                self._load_count += 1
+            else:
+                self._load_waiters += 1
+
+        if leader:
+            try:
+                future.set_result(self._build_model(self.model_size, warm_up))
+            finally:
+                # Never strand waiters, even if the load was interrupted.
+                if not future.done():
+                    future.set_result(False)
+        try:
+            return future.result(timeout)
+        except FutureTimeoutError:
             return False
 
-        self.model_loading = True
+    def _build_model(self, model_size, warm_up):
+        """Create the model for a ``_load_model`` leader; returns success."""
         try:
             print("Loading Whisper model...")
-            self.model = WhisperModel(self.model_size, device="cpu", compute_type="int8")
+            model = self._create_model(model_size)
+            # A size change that finished meanwhile already installed a model.
+            if self.model is None:
+                self.model = model
+            else:
+                self.model_pool.retire(model)
             print("Model loaded!")
             self.model_load_error = None
+            self.model_warm = False
+            self.warm_up_seconds = None
+            self._load_seconds[model_size] = time.monotonic() - self._load_started
+            if warm_up:
+                threading.Thread(target=self.warm_up_model, daemon=True).start()
             return True
         except Exception as e:
             print(f"Failed to load model: {e}")
             self.model_load_error = str(e)
             self._report_diagnostic("model.load_failed", e)
             return False
+
+    def get_model_load_status(self):
+        """Report the current or last model load for the status panel."""
+        future = self._load_future
+        if future is not None and not future.done():
+            state = "loading"
+        elif self.model is not None:
+            state = "ready"
+        elif future is None:
+            state = "idle"
+        else:
+            state = "unloaded" if future.result() else "failed"
+
+        elapsed = None
+        progress = None
+        expected = self._load_seconds.get(self.model_size)
+        if state == "loading":
+            elapsed = time.monotonic() - self._load_started
+            # Estimated from the last load of this size; unknown on the first.
+            if expected:
+                progress = round(min(0.99, elapsed / expected), 2)
+        return {
+            "state": state,
+            "model_size": self.model_size,
+            "elapsed_seconds": round(elapsed, 3) if elapsed is not None else None,
+            "expected_seconds": round(expected, 3) if expected else None,
+            "progress": progress,
+            "waiters": self._load_waiters,
+            "loads": self._load_count,
+            "error": self.model_load_error,
+        }
+
+    def _create_model(self, model_size):
+        """Return a model for ``model_size``, reusing a resident one if possible."""
+        options = self.model_options(model_size)
+        key = (model_size, options["compute_type"])
+        built_with = dict(options)
+        if self.model_factory is None:
+            # In-process models keep the scheduling their threads started with.
+            built_with["scheduling"] = (self.scheduling.priority, self.scheduling.cpus)
+        model = self.model_pool.get(key, built_with)
+        if model is not None:
+            print(f"Reusing resident {model_size} model")
+            return model
+
+        if self.model_factory is not None:
+            model = self.model_factory(model_size)
+        else:
+            # CTranslate2's threads start here and inherit the policy.
+            model = self.scheduling.run(WhisperModel, model_size, device="cpu", **options)
+        return self.model_pool.put(key, model, built_with)
+
+    def _models_in_use(self):
+        cascade = self._cascade
+        return (self.model,) + ((cascade[1],) if cascade else ())
+
+    def model_options(self, model_size):
+        """Return the WhisperModel settings calibrated for ``model_size``."""
+        tuned = self.cpu_tuning.get(model_size)
+        if not tuned:
+            options = {"compute_type": "int8"}
+        else:
+            options = {
+                "compute_type": tuned["compute_type"],
+                "cpu_threads": tuned["cpu_threads"],
+                "num_workers": tuned["num_workers"],
+            }
+        cpu_threads = self.scheduling.cap_threads(options.get("cpu_threads", 0))
+        if cpu_threads:
+            options["cpu_threads"] = cpu_threads
+        return options
+
+    def calibration_model(self, model_size, **setting):
+        """Create an in-process model with explicit settings for the CPU tuner."""
+        return self.scheduling.run(WhisperModel, model_size, device="cpu", **setting)
+
+    def set_scheduling(self, scheduling, rebuild=True):
+        """Switch the inference scheduling policy, rebuilding an active model.
+
+        Pass ``rebuild=False`` when a model swap follows anyway.
+        """
+        previous, self.scheduling = self.scheduling, scheduling
+        if previous is not scheduling:
+            previous.close()
+        # CTranslate2's threads keep the policy they were created under.
+        if rebuild and self.model is not None and self.model_factory is None:
+            self._start_model_swap(self.model_size)
+
+    def apply_cpu_tuning(self, cpu_tuning):
+        """Use new calibrated settings, reloading an active model that changes."""
+        previous = self.model_options(self.model_size)
+        self.cpu_tuning = cpu_tuning or {}
+        if self.model is not None and self.model_options(self.model_size) != previous:
+            self._start_model_swap(self.model_size)
+
+    @staticmethod
+    def _release_model(model):
+        """Free a model held outside this process; in-process ones just drop."""
+        release = getattr(model, "release", None)
+        if release is not None:
+            release()
+
+    def _start_model_swap(self, model_size):
+        self._model_swap_count += 1
+        swap = {
+            "id": self._model_swap_count,
+            "model_size": model_size,
+            "state": "loading",
+            "started_at": time.time(),
+            "finished_at": None,
+            "error": None,
+        }
+        self.model_swap = swap
+        self._model_swap_thread = threading.Thread(
+            target=self._swap_model, args=(swap,), daemon=True
+        )
+        self._model_swap_thread.start()
+        return swap
+
+    def _swap_model(self, swap):
+        """Load a replacement model while the current one keeps serving."""
+        print(f"Loading {swap['model_size']} model in the background...")
+        try:
+            model = self._create_model(swap["model_size"])
+        except Exception as e:
+            print(f"Failed to load model: {e}")
+            swap.update(state="failed", error=str(e), finished_at=time.time())
+            if swap is self.model_swap:
+                self.model_load_error = str(e)
+            self._report_diagnostic("model.load_failed", e)
+            return
+
+        if swap is not self.model_swap:
+            # A newer size was selected while this one was loading.
+            swap.update(state="superseded", finished_at=time.time())
+            self.model_pool.retire(model)
+            return
+
+        # Attribute assignment is atomic: a dictation already decoding keeps
+        # its reference to the old model, which is freed once it finishes.
+        old_model = self.model
+        self.model = model
+        self.model_warm = False
+        self.warm_up_seconds = None
+        if old_model is not None and old_model is not model:
+            self.model_pool.retire(old_model)
+        del old_model
+        swap.update(state="ready", finished_at=time.time())
+        print(f"Switched to {swap['model_size']} model")
+        self.warm_up_model()
+
+    def wait_for_model_swap(self, timeout=None):
+        """Block until the pending size change finishes; True when it succeeded."""
+        thread = self._model_swap_thread
+        if thread is not None:
+            thread.join(timeout)
+        return self.model_swap is None or self.model_swap["state"] == "ready"
+
+    def _warm_up_clip(self):
+        """One second of voice-like audio: 140 Hz harmonics at syllable rate."""
+        t = np.arange(self.whisper_sample_rate, dtype=np.float32) / self.whisper_sample_rate
+        voice = sum(np.sin(2 * np.pi * 140 * k * t) / k for k in range(1, 6))
+        envelope = 0.5 * (1 - np.cos(2 * np.pi * 4 * t))
+        return (0.1 * voice * envelope).astype(np.float32)
+
+    def warm_up_model(self):
+        """Run a synthetic clip through the full transcribe path once."""
+        model = self.model
+        if model is None:
+            return False
+
+        def decode():
+            clip = self._warm_up_clip()
+            # With VAD the synthetic clip may be dropped before decoding, so
+            # also decode it unfiltered to initialize the encoder and decoder.
+            for vad_filter in (True, False):
+                segments, _ = model.transcribe(
+                    clip,
+                    beam_size=5,
+                    language=self.transcription_language,
+                    task="transcribe",
+                    vad_filter=vad_filter,
+                    condition_on_previous_text=False,
+                )
+                for _ in segments:
+                    pass
+
+        started = time.monotonic()
+        try:
+            self.scheduling.run(decode)
+        except Exception as e:
+            print(f"Model warm-up failed: {e}")
+            self._report_diagnostic("model.warm_up_failed", e)
+            return False
+
+        if model is self.model:
+            self.model_warm = True
+            self.warm_up_seconds = round(time.monotonic() - started, 3)
+            print(f"Model warm-up finished in {self.warm_up_seconds}s")
+        return True
+
+    def unload_model(self):
+        """Drop the loaded model unless a dictation is using it right now.
+
+        Recording, queued dictations and decodes on any thread all count as
+        using it.
+        """
+        if not self.recording_lock.acquire(blocking=False):
+            return False
+        try:
+            # Held while unloading, so no decode can start in between.
+            with self._decode_lock:
+                if (
+                    self.is_recording
+                    or self.model_loading
+                    or self.model is None
+                    or self._active_decodes
+                    or self.dictations.depth()
+                ):
+                    return False
+                model, self.model = self.model, None
+                self.model_pool.retire(model)
+                self._drop_cascade_model()
+                # Unloading is meant to give the memory back.
+                self.model_pool.clear()
+                self.model_warm = False
+                return True
         finally:
-            self.model_loading = False
+            self.recording_lock.release()
 
     def is_model_ready(self):
         """Check if model is loaded and ready"""
@@ -168,24 +567,99 @@ class WoWVoiceChat:
         self.preset = preset
         self.default_channel = preset.get("default_channel", "say")
         self.channel_commands = preset.get("channels") or {"say": "", "type": ""}
+        self.language_cache.clear("preset_changed")
+
+    def get_decoding_profile(self):
+        """Return the configured profile name, falling back to the preset's."""
+        return (
+            self.decoding_profile
+            or self.preset.get("decoding_profile")
+            or DEFAULT_DECODING_PROFILE
+        )
 
     def set_transcription_options(self, language=None):
         """Update faster-whisper transcription options without reloading the model."""
         self.transcription_language = language or None
+        self.language_cache.clear()
 
     def set_model_size(self, model_size):
-        """Update the selected model size and reload if a model is already active."""
+        """Update the selected model size, hot-swapping an active model.
+
+        The current model keeps serving dictations until the new one is loaded;
+        progress is reported through ``model_swap``.
+        """
         if model_size == self.model_size:
             return True
 
         self.model_size = model_size
         self.model_load_error = None
 
-        if self.model is None:
+        if self.model is None and not self.model_loading:
             return True
 
-        self.model = None
-        return self._load_model()
+        self._start_model_swap(model_size)
+        return True
+
+    def set_cascade_model_size(self, model_size):
+        """Select the second-tier model, or None to disable escalation."""
+        self.cascade_model_size = model_size
+        if self._cascade is not None and self._cascade[0] != model_size:
+            self._drop_cascade_model()
+
+    def set_cascade_paused(self, reason):
+        """Stop escalating for ``reason``, freeing the second tier, or resume with None."""
+        self.cascade_paused = reason
+        if reason is not None:
+            self._drop_cascade_model()
+
+    def _drop_cascade_model(self):
+        cascade, self._cascade = self._cascade, None
+        if cascade is not None:
+            self.model_pool.retire(cascade[1])
+
+    def _cascade_model(self):
+        """Return the second-tier model, starting a background load if needed.
+
+        The utterance that triggers the load keeps its first-tier result
+        rather than waiting seconds for a larger model.
+        """
+        cascade = self._cascade
+        if cascade is not None and cascade[0] == self.cascade_model_size:
+            return cascade[1]
+        with self._cascade_lock:
+            if not self._cascade_loading:
+                self._cascade_loading = True
+                threading.Thread(
+                    target=self._load_cascade_model, args=(self.cascade_model_size,), daemon=True
+                ).start()
+        return None
+
+    def _load_cascade_model(self, model_size):
+        print(f"Loading {model_size} model for low-confidence escalation...")
+        try:
+            model = self._create_model(model_size)
+        except Exception as e:
+            print(f"Failed to load cascade model: {e}")
+            self._report_diagnostic("model.cascade_load_failed", e)
+            return
+        finally:
+            self._cascade_loading = False
+        if model_size != self.cascade_model_size:
+            self.model_pool.retire(model)
+            return
+        self._drop_cascade_model()
+        self._cascade = (model_size, model)
+        print(f"Cascade model {model_size} loaded")
+
+    def get_cascade_status(self):
+        cascade = self._cascade
+        return {
+            "model_size": self.cascade_model_size,
+            "loaded": cascade[0] if cascade else None,
+            "loading": self._cascade_loading,
+            "paused": self.cascade_paused,
+            **self.cascade_stats.get_status(),
+        }
 
     def _confirm_delay_for(self, text: str) -> float:
         """Calculate how long to wait based on text length: 3s base + 0.4s per word, max 6s."""
@@ -198,19 +672,34 @@ class WoWVoiceChat:
             if self._pending_timer:
                 self._pending_timer.cancel()
                 self._pending_timer = None
+            self._pending_clear.set()
             if self.pending_text:
                 self.pending_text = None
                 return True
             return False
 
+    def cancel_transcription(self):
+        """Cancel queued and in-flight dictations and any pending send.
+
+        Returns how many dictations were dropped.
+        """
+        # Jobs first, so one waiting to become pending sees its cancellation.
+        cancelled = self.dictations.cancel_all()
+        if self.cancel_pending():
+            cancelled += 1
+        return cancelled
+
     def _send_pending(self):
         """Timer callback: auto-send the pending text after the delay."""
         with self._pending_lock:
             text = self.pending_text
             self.pending_text = None
             self._pending_timer = None
-        if text:
-            self.send_to_wow_chat(text)
+        try:
+            if text:
+                self.send_to_wow_chat(text)
+        finally:
+            self._pending_clear.set()
 
     def load_context(self):
         """Load WoW context from addon-generated file"""
@@ -288,26 +777,42 @@ class WoWVoiceChat:
         """Callback for audio recording"""
         if status:
             print(f"Audio status: {status}")
-        self.audio_queue.put(indata.copy())
+        if not self._capturing:
+            if self.pre_roll is not None:
+                self.pre_roll.write(indata)
+            return
+        if self._pre_roll_pending:
+            # Drained on the audio thread so no block falls between the ring
+            # and the capture buffer.
+            self._pre_roll_pending = False
+            pre_roll = self.pre_roll
+            if pre_roll is not None:
+                pre_roll.drain_into(self.capture_buffer)
+        if self._press_time is not None:
+            mode = "cold" if self.recording_stream is not None else "warm"
+            self.first_frame_latencies[mode].append(time.monotonic() - self._press_time)
+            self._press_time = None
+        self.capture_buffer.write(indata)
+        if self.speech_detection:
+            self.speech_detector.update(self.capture_buffer)
 
     def record_audio(self, duration=5):
         """Record audio for specified duration"""
         print(f"Recording for {duration} seconds...")
-        self.audio_queue = queue.Queue()
-
-        with sd.InputStream(samplerate=self.sample_rate, channels=1,
-                           callback=self.audio_callback, dtype='int16'):
-            time.sleep(duration)
+        self._reset_capture()
 
-        # Collect all audio
-        audio_data = []
-        while not self.audio_queue.empty():
-            audio_data.append(self.audio_queue.get())
+        self._capturing = True
+        try:
+            with sd.InputStream(samplerate=self.sample_rate, channels=1,
+                               callback=self.audio_callback, dtype='int16'):
+                time.sleep(duration)
+        finally:
+            self._capturing = False
 
-        if not audio_data:
+        if len(self.capture_buffer) == 0:
             return None
 
-        return np.concatenate(audio_data, axis=0)
+        return self.capture_buffer.view()
 
     def save_audio_to_wav(self, audio_data, filename):
         """Save audio data to WAV file, resampling to 16kHz for Whisper"""
@@ -322,12 +827,12 @@ class WoWVoiceChat:
 
     def _prepare_audio(self, audio_data, source_rate):
         """Return mono 16 kHz float32 samples for faster-whisper."""
-        audio_data = np.asarray(audio_data).flatten()
+        # reshape() keeps capture-buffer views zero-copy; flatten() would not.
+        audio_data = np.asarray(audio_data).reshape(-1)
 
         # sounddevice records int16 PCM, while faster-whisper expects float32
-        # PCM in [-1, 1]. Normalize before interpolation: np.interp promotes
-        # int16 to float64, which previously caused this integer check to be
-        # skipped and sent values up to 32768 directly to Whisper.
+        # PCM in [-1, 1]. Normalize before resampling so the integer check
+        # sees the original dtype; values up to 32768 must never reach Whisper.
         if np.issubdtype(audio_data.dtype, np.integer):
             max_value = float(max(abs(np.iinfo(audio_data.dtype).min), np.iinfo(audio_data.dtype).max))
             audio_data = audio_data.astype(np.float32) / max_value
@@ -335,9 +840,7 @@ class WoWVoiceChat:
             audio_data = audio_data.astype(np.float32)
 
         if source_rate != self.whisper_sample_rate and len(audio_data) > 0:
-            new_length = int(len(audio_data) * self.whisper_sample_rate / source_rate)
-            indices = np.linspace(0, len(audio_data) - 1, new_length)
-            audio_data = np.interp(indices, np.arange(len(audio_data)), audio_data).astype(np.float32)
+            audio_data = get_resampler(source_rate, self.whisper_sample_rate)(audio_data)
         return np.clip(audio_data, -1.0, 1.0)
 
     def _load_wav(self, audio_file):
@@ -355,10 +858,24 @@ class WoWVoiceChat:
             audio_data = audio_data.mean(axis=1) / 32768.0
         return self._prepare_audio(audio_data, source_rate)
 
-    def transcribe_audio(self, audio_input):
-        """Transcribe PCM samples or a 16-bit PCM WAV file."""
-        # Ensure model is loaded
-        if not self._load_model():
+    def transcribe_audio(self, audio_input, sample_rate=None, cancel=None):
+        """Transcribe PCM samples or a 16-bit PCM WAV file.
+
+        ``sample_rate`` defaults to the recording rate for in-memory samples.
+        Setting the ``cancel`` event stops decoding after the current segment.
+        """
+        with self._decode_lock:
+            self._active_decodes += 1
+        try:
+            return self._transcribe(audio_input, sample_rate, cancel)
+        finally:
+            with self._decode_lock:
+                self._active_decodes -= 1
+
+    def _transcribe(self, audio_input, sample_rate, cancel):
+        # Ensure model is loaded, joining a load a combo press already started;
+        # this dictation itself warms a lazy load.
+        if not self._load_model(warm_up=False):
             print("Model not ready, cannot transcribe")
             return ""
 
@@ -372,7 +889,7 @@ class WoWVoiceChat:
         if isinstance(audio_input, (str, os.PathLike, Path)):
             audio_input = self._load_wav(audio_input)
         else:
-            audio_input = self._prepare_audio(audio_input, self.sample_rate)
+            audio_input = self._prepare_audio(audio_input, sample_rate or self.sample_rate)
 
         if len(audio_input) == 0:
             print("No audio samples to transcribe")
@@ -386,29 +903,159 @@ class WoWVoiceChat:
             f"peak={peak:.4f}, rms={rms:.4f}, dtype={audio_input.dtype}"
         )
 
-        # Passing decoded samples avoids shipping PyAV and its full FFmpeg
-        # codec bundle for the WAV-only Decktation recording path.
+        profile, decode_options = resolve_decoding_profile(self.get_decoding_profile(), duration)
+        tuned_beam = self.cpu_tuning.get(self.model_size, {}).get("beam_size")
+        if tuned_beam and self.get_decoding_profile() == AUTO_PROFILE:
+            # Calibration found a narrower beam just as accurate on this CPU.
+            decode_options["beam_size"] = min(decode_options["beam_size"], tuned_beam)
+            decode_options["best_of"] = min(decode_options["best_of"], tuned_beam)
+        self.last_decoding_profile = profile
+        print(f"Decoding profile: {profile}")
+
+        decode_options["max_new_tokens"] = decode_token_budget(duration)
+        cached_language = None
+        if self.transcription_language is None:
+            cached_language = self.language_cache.lookup()
+        decode_options["language"] = self.transcription_language or cached_language
         try:
-            segments, info = self.model.transcribe(
-                audio_input,
-                beam_size=5,
-                initial_prompt=initial_prompt,
-                hotwords=hotwords,
-                language=self.transcription_language,
-                task="transcribe",
-                vad_filter=True,
-                condition_on_previous_text=False,
+            result = self._decode(
+                audio_input, initial_prompt, hotwords,
+                FULL_ENCODER_WINDOW_SECONDS, decode_options, cancel,
             )
-
-            # Segment generation is lazy and can fail during iteration.
-            full_text = []
-            for segment in segments:
-                full_text.append(segment.text)
-            return "".join(full_text).strip()
+            text, loop_reason, quality = result
+            self._record_decode_guard(decode_options["max_new_tokens"], loop_reason)
+            if self.cascade_model_size and not self.cascade_paused and not (cancel and cancel.is_set()):
+                text, loop_reason, quality = self._escalate(
+                    result, audio_input, initial_prompt, hotwords,
+                    FULL_ENCODER_WINDOW_SECONDS, decode_options, cancel,
+                )
+            if self.transcription_language is None:
+                self.language_cache.observe(
+                    quality["language"], quality["language_probability"],
+                    quality["avg_logprob"], cached=cached_language is not None,
+                )
+            self.model_warm = True
+            self.last_used = time.monotonic()
+            return text
         except Exception as e:
             self._report_diagnostic("transcription.failed", e)
             raise
 
+    def _escalate(self, result, audio_input, initial_prompt, hotwords, chunk_length, decode_options, cancel):
+        """Decode a low-confidence result again on the second-tier model."""
+        reason = escalation_reason(result[2], result[1])
+        model = self._cascade_model() if reason else None
+        if model is None:
+            self.cascade_stats.record(reason)
+            return result
+
+        print(f"Low-confidence decode ({reason}), escalating to {self.cascade_model_size}")
+        started = time.monotonic()
+        escalated = self._decode(
+            audio_input, initial_prompt, hotwords, chunk_length, decode_options, cancel, model=model
+        )
+        self.cascade_stats.record(reason, time.monotonic() - started)
+        # An empty second opinion does not overrule text the first tier heard.
+        return escalated if escalated[0] or not result[0] else result
+
+    def _speech_clips(self, audio_input, chunk_length):
+        """Return the speech chunks of ``audio_input`` as clip timestamps in seconds.
+
+        Uses the VAD settings faster-whisper's batched pipeline applies itself,
+        so no chunk is longer than the encoder window.
+        """
+        chunks = get_speech_timestamps(
+            audio_input, max_speech_duration_s=chunk_length, min_silence_duration_ms=160
+        )
+        rate = self.whisper_sample_rate
+        return [{"start": chunk["start"] / rate, "end": chunk["end"] / rate} for chunk in chunks]
+
+    def _decode(self, audio_input, initial_prompt, hotwords, chunk_length, decode_options, cancel=None, model=None):
+        """Return (text, loop breaker reason or None, quality).
+
+        ``quality`` holds the detected language and the segment confidence
+        faster-whisper reported for the decoded text.
+        """
+        # Feature extraction and the VAD session run on the decoding thread,
+        # so it has to be one of the policy's own.
+        return self.scheduling.run(
+            self._decode_on_policy_thread,
+            audio_input, initial_prompt, hotwords, chunk_length, decode_options, cancel, model,
+        )
+
+    def _decode_on_policy_thread(self, audio_input, initial_prompt, hotwords, chunk_length, decode_options, cancel, model):
+        model = model or self.model
+        transcribe = model.transcribe
+        self.last_decode_batched = False
+        # Worker models decode in their own process and cannot be wrapped.
+        if self.batched_inference and BatchedInferencePipeline is not None and self.model_factory is None:
+            clips = self._speech_clips(audio_input, chunk_length)
+            if len(clips) >= BATCHED_MIN_CHUNKS:
+                self.last_decode_batched = True
+                # The pipeline only wraps the model, so it is cheap to create.
+                # Given the clips it decodes each as one batch item, rather
+                # than merging them into encoder windows after its own VAD.
+                transcribe = functools.partial(
+                    BatchedInferencePipeline(model).transcribe,
+                    batch_size=self.batch_size,
+                    clip_timestamps=clips,
+                )
+
+        # Passing decoded samples avoids shipping PyAV and its full FFmpeg
+        # codec bundle for the WAV-only Decktation recording path.
+        segments, info = transcribe(
+            audio_input,
+            initial_prompt=initial_prompt,
+            hotwords=hotwords,
+            task="transcribe",
+            vad_filter=True,
+            condition_on_previous_text=False,
+            chunk_length=chunk_length,
+            **decode_options,
+        )
+
+        # Segment generation is lazy and can fail during iteration.
+        full_text = []
+        logprobs = []
+        no_speech_probs = []
+        breaker = LoopBreaker()
+        for segment in segments:
+            # Not pulling the next segment leaves the rest of the audio undecoded.
+            if cancel is not None and cancel.is_set():
+                print("Transcription cancelled")
+                break
+            if not breaker.accept(segment.text):
+                print(f"Stopped decoding a hallucination loop ({breaker.reason})")
+                break
+            full_text.append(segment.text)
+            if getattr(segment, "avg_logprob", None) is not None:
+                logprobs.append(segment.avg_logprob)
+            if getattr(segment, "no_speech_prob", None) is not None:
+                no_speech_probs.append(segment.no_speech_prob)
+        text = "".join(full_text).strip()
+        quality = {
+            "language": getattr(info, "language", None),
+            "language_probability": getattr(info, "language_probability", None),
+            "avg_logprob": sum(logprobs) / len(logprobs) if logprobs else None,
+            "no_speech_prob": max(no_speech_probs) if no_speech_probs else None,
+            "compression_ratio": compression_ratio(text) if text else 0.0,
+            "text_present": bool(text),
+        }
+        return text, breaker.reason, quality
+
+    def _record_decode_guard(self, token_budget, loop_reason):
+        stats = self.decode_guard_stats
+        stats["transcriptions"] += 1
+        stats["last_token_budget"] = token_budget
+        stats["last_reason"] = loop_reason
+        if loop_reason is not None:
+            stats["breaker_fired"] += 1
+            # Expected now and then, so it is not reported as a failure.
+            if self.event_reporter:
+                self.event_reporter(
+                    "transcription.loop_breaker", reason=loop_reason, token_budget=token_budget
+                )
+
     def parse_channel_and_text(self, text):
         """
         Parse channel prefix from text using multi-language triggers
@@ -615,27 +1262,172 @@ class WoWVoiceChat:
                 return
 
             print("Recording started...")
-            self.audio_queue = queue.Queue()
+            self._press_time = time.monotonic()
+            self.last_used = self._press_time
+            if self._preload_thread is None:
+                self._preload_thread = threading.Thread(target=self._run_preloads, daemon=True)
+                self._preload_thread.start()
+
+            # Reload an unloaded model while the user is still speaking; with
+            # speech detection that waits until speech is actually heard.
+            if not self.speech_detection:
+                self._preload_model()
+
+            if self.warm_stream is not None and not self.warm_stream.active:
+                print("Warm input stream stopped, reopening for this recording")
+                self.stop_warm_stream()
+
+            if self.warm_stream is not None:
+                self._reset_capture()
+                self._pre_roll_pending = self.pre_roll is not None
+                self._capturing = True
+            else:
+                self.sample_rate = self._negotiate_sample_rate()
+                print(f"Using sample rate: {self.sample_rate}")
+                self._reset_capture()
+                self._capturing = True
+
+                # Start audio stream
+                self.recording_stream = self._open_input_stream()
+                self.recording_stream.start()
+
+            if self.streaming_transcription:
+                cancelled = threading.Event()
+                self._streamer = StreamingTranscriber(
+                    lambda audio: self.transcribe_audio(audio, cancel=cancelled),
+                    self._read_captured_audio,
+                    self.sample_rate,
+                    ready=self.is_model_ready,
+                    cancelled=cancelled,
+                )
+                self._streamer.start()
+
+    def _preload_model(self):
+        """Ask the preload worker to load an unloaded model; safe on the audio thread."""
+        self._preload_wanted.set()
+
+    def _run_preloads(self):
+        while True:
+            self._preload_wanted.wait()
+            self._preload_wanted.clear()
+            if self.model is None and not self.model_loading:
+                try:
+                    self._load_model(warm_up=False)
+                except Exception as e:
+                    print(f"Error preloading model: {e}")
+
+    def _open_input_stream(self):
+        return sd.InputStream(
+            samplerate=self.sample_rate,
+            channels=1,
+            callback=self.audio_callback,
+            dtype='int16'
+        )
 
-            # Get default sample rate from device
-            device_info = sd.query_devices(sd.default.device[0], 'input')
-            self.sample_rate = int(device_info['default_samplerate'])
-            print(f"Using sample rate: {self.sample_rate}")
+    def start_warm_stream(self):
+        """Open the always-on input stream used by warm mic mode."""
+        with self.recording_lock:
+            if self.warm_stream is not None or self.test_mode:
+                return
+            self.sample_rate = self._negotiate_sample_rate()
+            self._allocate_pre_roll()
+            stream = self._open_input_stream()
+            stream.start()
+            self.warm_stream = stream
+            print(f"Warm input stream open at {self.sample_rate} Hz")
+
+    def _allocate_pre_roll(self):
+        capacity = int(self.sample_rate * self.pre_roll_ms / 1000)
+        self.pre_roll = PreRollBuffer(capacity) if capacity > 0 else None
+
+    def set_pre_roll(self, milliseconds):
+        """Change how much audio from before the press is kept."""
+        with self.recording_lock:
+            self.pre_roll_ms = milliseconds
+            if self.warm_stream is not None:
+                self._allocate_pre_roll()
+
+    def stop_warm_stream(self):
+        """Close the warm input stream; later recordings open their own."""
+        stream, self.warm_stream = self.warm_stream, None
+        self.pre_roll = None
+        if stream is not None:
+            try:
+                stream.stop()
+                stream.close()
+            except Exception as e:
+                print(f"Error closing warm input stream: {e}")
+
+    def get_capture_stats(self):
+        """Press-to-first-frame latency per mode and the warm stream's CPU cost."""
+        stats = {"warm_mic": self.warm_stream is not None}
+        for mode, latencies in self.first_frame_latencies.items():
+            stats[f"{mode}_first_frame_ms"] = (
+                round(1000 * sum(latencies) / len(latencies), 1) if latencies else None
+            )
+        # PortAudio's estimate of the share of CPU time spent in the callback.
+        stats["warm_stream_cpu_load"] = (
+            round(float(self.warm_stream.cpu_load), 4) if self.warm_stream is not None else None
+        )
+        return stats
 
-            # Start audio stream
-            self.recording_stream = sd.InputStream(
-                samplerate=self.sample_rate,
+    def _negotiate_sample_rate(self):
+        """Prefer native 16 kHz capture so _prepare_audio can skip resampling."""
+        device = sd.default.device[0]
+        try:
+            sd.check_input_settings(
+                device=device,
                 channels=1,
-                callback=self.audio_callback,
-                dtype='int16'
+                dtype='int16',
+                samplerate=self.whisper_sample_rate,
             )
-            self.recording_stream.start()
+            return self.whisper_sample_rate
+        except Exception:
+            # Fall back to the device's default rate and resample afterwards.
+            device_info = sd.query_devices(device, 'input')
+            return int(device_info['default_samplerate'])
+
+    def _reset_capture(self):
+        """Empty the capture buffer, preallocated for a typical hold."""
+        self.capture_buffer.reset(self.sample_rate * self.capture_seconds)
+        self._capture_read_offset = 0
+        self.speech_detector.reset(self.sample_rate)
+
+    def _read_captured_audio(self):
+        """Return zero-copy views of samples captured since the last read."""
+        end = len(self.capture_buffer)
+        start, self._capture_read_offset = self._capture_read_offset, end
+        return [self.capture_buffer.view(start, end)] if end > start else []
+
+    def _detect_speech_span(self):
+        """Return the padded speech span of the capture, or None if silent."""
+        detector = self.speech_detector
+        detector.update(self.capture_buffer)  # frames after the last callback
+        total = len(self.capture_buffer)
+        span = detector.span(total)
+        speech_samples = span[1] - span[0] if span else 0
+        self.last_speech_detection = {
+            "speech": span is not None,
+            "captured_seconds": round(total / self.sample_rate, 3),
+            "speech_seconds": round(speech_samples / self.sample_rate, 3),
+            "trimmed_seconds": round((total - speech_samples) / self.sample_rate, 3),
+            # Lets a too-quiet microphone be told apart from a silent press.
+            "peak_dbfs": (
+                round(20 * math.log10(detector.peak_level), 1) if detector.peak_level > 0 else None
+            ),
+        }
+        return span
 
-    def stop_recording(self, send=True):
-        """Stop recording and process audio (for push-to-talk)"""
+    def stop_recording(self, send=True, on_done=None):
+        """Stop recording and queue the audio for transcription (for push-to-talk)
+
+        Returns the queued DictationJob, or None when there was nothing to
+        transcribe. ``on_done`` is called with True/False once the job has
+        been transcribed and sent.
+        """
         with self.recording_lock:
             if not self.is_recording:
-                return
+                return None
 
             self.is_recording = False
 
@@ -648,58 +1440,114 @@ class WoWVoiceChat:
                         text = self.transcribe_audio(self.test_audio_file)
                         print(f"[TEST MODE] Transcribed: {text}")
                         if text and send:
-                            if self.confirm_delay > 0:
-                                with self._pending_lock:
-                                    self.pending_text = text
-                                    self._pending_timer = threading.Timer(self._confirm_delay_for(text), self._send_pending)
-                                    self._pending_timer.start()
-                            else:
-                                self.send_to_wow_chat(text)
+                            self._deliver(text)
                     except Exception as e:
                         print(f"[TEST MODE] Error: {e}")
                         self._report_diagnostic("transcription.failed", e)
                 else:
                     print(f"[TEST MODE] Test audio file not found: {self.test_audio_file}")
-                return
+                if on_done:
+                    on_done(True)
+                return None
 
             print("Recording stopped...")
+            self._capturing = False
+            self._press_time = None
+            self._pre_roll_pending = False
 
-            # Stop audio stream
+            # Stop audio stream (the warm stream stays open)
             if self.recording_stream:
                 self.recording_stream.stop()
                 self.recording_stream.close()
                 self.recording_stream = None
 
-            # Collect all audio
-            audio_data = []
-            while not self.audio_queue.empty():
-                audio_data.append(self.audio_queue.get())
-
-            if not audio_data:
+            streamer = self._streamer
+            self._streamer = None
+            span = self._detect_speech_span() if self.speech_detection else None
+            job = None
+            if self.speech_detection and span is None:
+                if streamer:
+                    streamer.cancel()
+                self.no_speech_count += 1
+                print("No speech detected, skipping transcription")
+            elif streamer:
+                streamer.stop()
+                job = DictationJob(
+                    streamer=streamer, send=send, on_done=on_done, cancelled=streamer.cancelled
+                )
+            elif len(self.capture_buffer) == 0:
                 print("No audio recorded")
-                return
+            else:
+                start, end = span or (0, None)
+                # Copied so the next press can reuse the capture buffer.
+                audio = self.capture_buffer.view(start, end).copy()
+                job = DictationJob(audio=audio, send=send, on_done=on_done)
+
+        if job is None:
+            if on_done:
+                on_done(True)
+            return None
+        self.dictations.submit(job)
+        print(f"Queued dictation {job.id} ({self.dictations.depth()} in queue)")
+        return job
 
-            audio = np.concatenate(audio_data, axis=0)
+    def _process_dictation(self, job):
+        """Transcribe and send one queued recording (dictation worker thread)."""
+        try:
+            if job.streamer:
+                print("Transcribing remaining audio...")
+                text, self.last_streaming_stats = job.streamer.finish()
+                print(f"Streaming stats: {self.last_streaming_stats}")
+            else:
+                print("Transcribing...")
+                text = self.transcribe_audio(job.audio, cancel=job.cancelled)
+        except Exception as e:
+            self._report_diagnostic("transcription.failed", e)
+            raise
+        if job.cancelled.is_set():
+            print(f"Dictation {job.id} cancelled, dropping its text")
+            return
+        print(f"Transcribed: {text}")
 
-            print("Transcribing...")
-            text = self.transcribe_audio(audio)
-            print(f"Transcribed: {text}")
+        # Store last transcription result
+        self.last_transcription = text
+        self.last_transcription_time = time.time()
 
-            # Store last transcription result
-            self.last_transcription = text
-            self.last_transcription_time = time.time()
+        if text and job.send:
+            self._deliver(text, job.cancelled, job.queued_at)
 
-            if text and send:
-                if self.confirm_delay > 0:
-                    with self._pending_lock:
-                        self.pending_text = text
-                        self._pending_timer = threading.Timer(self._confirm_delay_for(text), self._send_pending)
-                        self._pending_timer.start()
-                else:
-                    self.send_to_wow_chat(text)
+    def _record_latency(self, released_at):
+        latency = time.monotonic() - released_at
+        self.last_dictation_latency = round(latency, 3)
+        if self.latency_reporter:
+            self.latency_reporter(latency)
+
+    def _deliver(self, text, cancelled=None, released_at=None):
+        """Send text now, or after the confirmation delay."""
+        if self.confirm_delay <= 0:
+            self.send_to_wow_chat(text)
+            if released_at is not None:
+                self._record_latency(released_at)
+            return
+        # The confirmation delay is the player's, so latency ends at hand-off.
+        if released_at is not None:
+            self._record_latency(released_at)
+        # A queued message waits until the previous one was sent or cancelled
+        # so messages never overtake or replace each other.
+        self._pending_clear.wait()
+        with self._pending_lock:
+            if cancelled is not None and cancelled.is_set():
+                return
+            self.pending_text = text
+            self._pending_clear.clear()
+            self._pending_timer = threading.Timer(self._confirm_delay_for(text), self._send_pending)
+            self._pending_timer.start()
 
     def run_push_to_talk_keyboard(self, ptt_key='`'):
         """Run in push-to-talk mode with keyboard key"""
+        # Only this desktop mode needs pynput, so it is not a plugin dependency.
+        from pynput.keyboard import Listener
+
         print(f"Push-to-talk mode: Hold '{ptt_key}' to record, release to transcribe")
         print("Press Ctrl+C to stop")
 
@@ -723,6 +1571,19 @@ class WoWVoiceChat:
             except KeyboardInterrupt:
                 print("\nStopping service...")
 
+    def run_server(self, socket_path=SOCKET_PATH, port=None, max_queue=DEFAULT_MAX_QUEUE):
+        """Share this service's resident model with local clients"""
+        self._load_model(warm_up=False)
+        self.warm_up_model()
+        server = TranscriptionServer(self, socket_path=socket_path, port=port, max_queue=max_queue)
+        print("Press Ctrl+C to stop")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            print("\nStopping server...")
+        finally:
+            server.close()
+
     def run_daemon_mode(self, control_file="wow_voice_control.json"):
         """Run as daemon, controlled by external file (for Decky integration)"""
         control_path = Path(control_file)
@@ -764,7 +1625,7 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="WoW Voice-to-Chat Service")
     parser.add_argument("--context", default="wow_context.json",
                        help="Path to WoW context JSON file")
-    parser.add_argument("--mode", choices=["once", "continuous", "push-to-talk", "daemon"],
+    parser.add_argument("--mode", choices=["once", "continuous", "push-to-talk", "daemon", "server"],
                        default="once",
                        help="Recording mode (default: once)")
     parser.add_argument("--channel", choices=["say", "party", "raid", "guild", "officer", "yell", "instance", "auto"],
@@ -778,6 +1639,16 @@ if __name__ == "__main__":
                        help="Push-to-talk key for 'push-to-talk' mode (default: `)")
     parser.add_argument("--control-file", default="wow_voice_control.json",
                        help="Control file path for 'daemon' mode (default: wow_voice_control.json)")
+    parser.add_argument("--socket", default=SOCKET_PATH,
+                       help=f"Unix socket for 'server' mode (default: {SOCKET_PATH})")
+    parser.add_argument("--port", type=int,
+                       help="Serve on this localhost TCP port instead of the Unix socket in 'server' mode")
+    parser.add_argument("--max-queue", type=int, default=DEFAULT_MAX_QUEUE,
+                       help=f"Requests that may wait for the model in 'server' mode before new ones are rejected (default: {DEFAULT_MAX_QUEUE})")
+    parser.add_argument("--batched", action="store_true",
+                       help=f"Decode recordings with {BATCHED_MIN_CHUNKS} or more speech chunks as one batch")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+                       help=f"VAD chunks decoded together with --batched (default: {DEFAULT_BATCH_SIZE})")
 
     args = parser.parse_args()
 
@@ -787,7 +1658,10 @@ if __name__ == "__main__":
         # Will auto-detect per-message based on context
         default_channel = "say"  # Fallback
 
-    service = WoWVoiceChat(context_file=args.context, default_channel=default_channel)
+    # The server loads its model once before it starts listening.
+    service = WoWVoiceChat(context_file=args.context, default_channel=default_channel,
+                           lazy_load=args.mode == "server",
+                           batched_inference=args.batched, batch_size=args.batch_size)
 
     if args.mode == "once":
         service.run_once(duration=args.duration)
@@ -797,3 +1671,5 @@ if __name__ == "__main__":
         service.run_push_to_talk_keyboard(ptt_key=args.ptt_key)
     elif args.mode == "daemon":
         service.run_daemon_mode(control_file=args.control_file)
+    elif args.mode == "server":
+        service.run_server(socket_path=args.socket, port=args.port, max_queue=args.max_queue)
@@ -79,6 +79,7 @@ class DecktationLogic {
 	l5Held: boolean = false;
 	showNotifications: boolean = true;
 	prevRecordingStartCount: number = 0;
+	prevNoSpeechCount: number = 0;
 	prevPendingText: string = "";
 	lastPendingToastId: number = -1;
 
@@ -373,6 +374,8 @@ const DecktationPanel: VFC<{ logic: DecktationLogic }> = ({ logic }) => {
 	const [serviceReady, setServiceReady] = useState<boolean>(false);
 	const [modelReady, setModelReady] = useState<boolean>(false);
 	const [modelLoading, setModelLoading] = useState<boolean>(false);
+	// Size being hot-swapped in; the current model keeps serving meanwhile.
+	const [modelSwapping, setModelSwapping] = useState<string>("");
 	const [inputReady, setInputReady] = useState<boolean>(true);
 	const [buttonState, setButtonState] = useState<string>("None");
 	const [buttons, setButtons] = useState<string[]>(["L1", "R1"]);
@@ -463,6 +466,7 @@ const DecktationPanel: VFC<{ logic: DecktationLogic }> = ({ logic }) => {
 					setServiceReady(result.service_ready);
 					setModelReady(result.model_ready);
 					setModelLoading(result.model_loading);
+					setModelSwapping(result.model_swap && result.model_swap.state === "loading" ? result.model_swap.model_size : "");
 					setInputReady(result.input_ready !== false);
 					if (logic.enabled) {
 						setRecording(result.recording);
@@ -512,6 +516,19 @@ const DecktationPanel: VFC<{ logic: DecktationLogic }> = ({ logic }) => {
 						</div>
 					</PanelSectionRow>
 				)}
+				{serviceReady && !modelLoading && modelSwapping && (
+					<PanelSectionRow>
+						<div style={{
+							padding: '10px',
+							backgroundColor: '#2196f3',
+							borderRadius: '8px',
+							textAlign: 'center',
+							fontWeight: 'bold'
+						}}>
+							Switching to {modelSwapping} model...
+						</div>
+					</PanelSectionRow>
+				)}
 				{serviceReady && !inputReady && (
 					<PanelSectionRow>
 						<div style={{
@@ -664,12 +681,12 @@ const DecktationPanel: VFC<{ logic: DecktationLogic }> = ({ logic }) => {
 							const previousModelSize = modelSize;
 							setModelSize(nextModelSize);
 							if (enabled && modelReady) {
-								setModelLoading(true);
+								setModelSwapping(nextModelSize);
 							}
 							const result = await setModelSizeRpc(nextModelSize);
 							if (!result.success) {
 								setModelSize(previousModelSize);
-								setModelLoading(false);
+								setModelSwapping("");
 								setRpcError(result.error || "Could not update model size");
 							}
 						}}
@@ -925,6 +942,7 @@ export default definePlugin(() => {
 	getStatus().then((result) => {
 		if (result.success) {
 			logic.prevRecordingStartCount = result.recording_start_count || 0;
+			logic.prevNoSpeechCount = result.no_speech_count || 0;
 		}
 	});
 
@@ -944,6 +962,12 @@ export default definePlugin(() => {
 					}
 					logic.prevRecordingStartCount = startCount;
 
+					const noSpeechCount: number = result.no_speech_count || 0;
+					if (noSpeechCount > logic.prevNoSpeechCount) {
+						logic.notify("No speech heard", 2500, "Nothing was sent — check the microphone level");
+					}
+					logic.prevNoSpeechCount = noSpeechCount;
+
 					const pendingText: string = result.pending_text || "";
 					const pendingDelay: number = result.pending_delay || 0;
 					if (pendingText && !logic.prevPendingText) {
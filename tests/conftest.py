@@ -7,8 +7,12 @@ so tests can import wow_voice_chat without requiring ML/audio hardware.
 
 import sys
 import os
+import tempfile
+import types
 from unittest.mock import MagicMock
 
+import pytest
+
 # Point tests at the reviewable backend source directory.
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "backend", "src"))
 
@@ -18,3 +22,20 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "backend", "src
 sys.modules.setdefault("numpy", MagicMock())
 sys.modules.setdefault("faster_whisper", MagicMock())
 sys.modules.setdefault("sounddevice", MagicMock())
+
+
+@pytest.fixture
+def backend(tmp_path, monkeypatch):
+    """The Decky backend module with a stub loader and settings in ``tmp_path``."""
+    decky = types.ModuleType("decky")
+    decky.DECKY_SETTINGS_DIR = tempfile.mkdtemp(prefix="decktation-settings-")
+    sys.modules.setdefault("decky", decky)
+    os.environ.setdefault("DECKY_PLUGIN_DIR", os.path.join(os.path.dirname(__file__), ".."))
+    import decktation_backend
+
+    monkeypatch.setattr(decktation_backend, "CONFIG_DIR", str(tmp_path))
+    monkeypatch.setattr(decktation_backend, "BUTTON_CONFIG_FILE", str(tmp_path / "button_config.json"))
+    for name in ("voice_service", "power_policy", "latency_slo", "cpu_tuner", "inference_worker_status"):
+        monkeypatch.setattr(decktation_backend.Plugin, name, None)
+    monkeypatch.setattr(decktation_backend.Plugin, "calibration_scheduled", False)
+    return decktation_backend
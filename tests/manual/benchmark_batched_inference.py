@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Compare sequential and batched decoding of a multi-phrase recording.
+
+Builds a dictation by repeating tests/fixtures/test_audio.wav with short
+pauses between the repeats, transcribes it through WoWVoiceChat with and
+without batched inference, and reports median latency and throughput (audio
+seconds decoded per wall-clock second) for each. The default length matches
+a continuous-mode recording; pass a longer one to compare long dictations. CTranslate2 spreads a batch
+over its intra-op threads, so compare runs with different ``cpu_threads`` on
+multi-core machines. Requires numpy, faster-whisper and the Whisper model
+(downloaded on first use); run from the repository root:
+
+    python tests/manual/benchmark_batched_inference.py [model_size] [seconds] [runs]
+"""
+
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "backend", "src"))
+
+from wow_voice_chat import WoWVoiceChat  # noqa: E402
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "..", "fixtures", "test_audio.wav")
+PAUSE_SECONDS = 0.5
+
+
+def long_recording(service, seconds):
+    utterance = service._load_wav(FIXTURE)
+    pause = np.zeros(int(PAUSE_SECONDS * service.whisper_sample_rate), dtype=np.float32)
+    repeats = max(1, int(seconds / (len(utterance) / service.whisper_sample_rate + PAUSE_SECONDS)))
+    return np.concatenate([np.concatenate([utterance, pause])] * repeats)
+
+
+def measure(service, audio, runs):
+    timings = []
+    text = None
+    for _ in range(runs):
+        started = time.perf_counter()
+        text = service.transcribe_audio(audio, sample_rate=service.whisper_sample_rate)
+        timings.append(time.perf_counter() - started)
+    return text, statistics.median(timings)
+
+
+def main():
+    model_size = sys.argv[1] if len(sys.argv) > 1 else "base"
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 5
+    runs = int(sys.argv[3]) if len(sys.argv) > 3 else 3
+
+    service = WoWVoiceChat(lazy_load=True, model_size=model_size, decoding_profile="fast")
+    service.load_context = lambda: False
+    if not service._load_model(warm_up=False):
+        sys.exit(f"Could not load the {model_size} model: {service.model_load_error}")
+    service.warm_up_model()
+
+    audio = long_recording(service, seconds)
+    duration = len(audio) / service.whisper_sample_rate
+
+    service.batched_inference = False
+    sequential_text, sequential_time = measure(service, audio, runs)
+    service.batched_inference = True
+    batched_text, batched_time = measure(service, audio, runs)
+    if not service.last_decode_batched:
+        sys.exit("Batched decoding was not used; faster-whisper >= 1.1 and several speech chunks are required")
+
+    print(f"model={model_size} audio={duration:.1f}s runs={runs} cpus={os.cpu_count()} batch_size={service.batch_size}")
+    print(f"sequential {sequential_time * 1000:8.1f} ms  {duration / sequential_time:6.1f}x realtime")
+    print(f"batched    {batched_time * 1000:8.1f} ms  {duration / batched_time:6.1f}x realtime")
+    print(f"speedup {sequential_time / batched_time:.2f}x, text equal: {batched_text == sequential_text}")
+
+
+if __name__ == "__main__":
+    main()
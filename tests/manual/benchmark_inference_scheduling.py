@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Measure how much a transcription disturbs a game's frame pacing.
+
+Starts one busy "game" process per core that renders 16.7 ms frames (a fixed
+slice of work followed by a sleep until the next vsync) and records how late
+each frame finishes. While the game runs, tests/fixtures/test_audio.wav is
+transcribed repeatedly, first with inference at normal priority and then
+under the low-priority policy. Reports frame-time p99 and missed frames next
+to the decode latency for each policy, so the jitter avoided can be weighed
+against the latency inference gives up. Requires numpy, faster-whisper and
+the Whisper model (downloaded on first use); run from the repository root:
+
+    python tests/manual/benchmark_inference_scheduling.py [model_size] [runs] [max_threads]
+"""
+
+import multiprocessing
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "backend", "src"))
+
+from inference_scheduling import InferenceScheduling  # noqa: E402
+from wow_voice_chat import WoWVoiceChat  # noqa: E402
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "..", "fixtures", "test_audio.wav")
+FRAME_SECONDS = 1 / 60
+# Share of a frame the game spends computing; the rest is vsync idle time.
+FRAME_LOAD = 0.6
+
+
+def game(stop, frame_times):
+    times = []
+    deadline = time.perf_counter()
+    while not stop.is_set():
+        started = time.perf_counter()
+        while time.perf_counter() - started < FRAME_SECONDS * FRAME_LOAD:
+            pass
+        deadline += FRAME_SECONDS
+        times.append(time.perf_counter() - started)
+        time.sleep(max(0.0, deadline - time.perf_counter()))
+        deadline = max(deadline, time.perf_counter())
+    frame_times.extend(times)
+
+
+def measure(scheduling, model_size, runs):
+    service = WoWVoiceChat(lazy_load=True, model_size=model_size, scheduling=scheduling)
+    service.load_context = lambda: False
+    if not service._load_model(warm_up=False):
+        sys.exit(f"Could not load the {model_size} model: {service.model_load_error}")
+    service.warm_up_model()
+    audio = service._load_wav(FIXTURE)
+
+    with multiprocessing.Manager() as manager:
+        stop = manager.Event()
+        frame_times = manager.list()
+        games = [
+            multiprocessing.Process(target=game, args=(stop, frame_times))
+            for _ in range(os.cpu_count() or 1)
+        ]
+        for process in games:
+            process.start()
+        time.sleep(1)
+
+        latencies = []
+        for _ in range(runs):
+            started = time.perf_counter()
+            service.transcribe_audio(audio, sample_rate=service.whisper_sample_rate)
+            latencies.append(time.perf_counter() - started)
+
+        stop.set()
+        for process in games:
+            process.join()
+        frames = sorted(frame_times)
+
+    p99 = frames[int(len(frames) * 0.99)]
+    missed = sum(1 for frame in frames if frame > FRAME_SECONDS) / len(frames)
+    return statistics.median(latencies), p99, missed
+
+
+def main():
+    model_size = sys.argv[1] if len(sys.argv) > 1 else "base"
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    max_threads = int(sys.argv[3]) if len(sys.argv) > 3 else 0
+
+    print(f"model={model_size} runs={runs} cpus={os.cpu_count()} max_threads={max_threads}")
+    results = {}
+    for priority in ("normal", "low"):
+        # Nice values cannot be raised back without CAP_SYS_NICE, so normal runs first.
+        scheduling = InferenceScheduling(
+            priority=priority, max_threads=max_threads if priority == "low" else 0
+        )
+        latency, p99, missed = measure(scheduling, model_size, runs)
+        results[priority] = (latency, p99)
+        print(
+            f"{priority:6s} decode {latency * 1000:8.1f} ms  "
+            f"frame p99 {p99 * 1000:6.2f} ms  missed {missed:6.1%}  {scheduling.get_status()}"
+        )
+
+    (normal_latency, normal_p99), (low_latency, low_p99) = results["normal"], results["low"]
+    print(
+        f"decode latency {(low_latency / normal_latency - 1):+.0%}, "
+        f"frame p99 {(low_p99 - normal_p99) * 1000:+.2f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
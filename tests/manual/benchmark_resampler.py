@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Compare the old np.interp resampling path with the polyphase resampler.
+
+Reports wall time, peak temporary memory, passband error for a 1 kHz tone and
+how much of a 12 kHz tone (above Whisper's 8 kHz Nyquist) aliases into the
+16 kHz output. Requires numpy; run from the repository root:
+
+    python tests/manual/benchmark_resampler.py
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "backend", "src"))
+
+from resampler import PolyphaseResampler  # noqa: E402
+
+TARGET_RATE = 16000
+SECONDS = 10
+
+
+def interp_resample(audio, source_rate):
+    """The linear-interpolation path previously used by _prepare_audio."""
+    new_length = int(len(audio) * TARGET_RATE / source_rate)
+    indices = np.linspace(0, len(audio) - 1, new_length)
+    return np.interp(indices, np.arange(len(audio)), audio).astype(np.float32)
+
+
+def tone(frequency, source_rate):
+    t = np.arange(source_rate * SECONDS) / source_rate
+    return (0.5 * np.sin(2 * np.pi * frequency * t)).astype(np.float32)
+
+
+def measure(resample, audio):
+    resample(audio)  # warm caches outside the measurement
+    tracemalloc.start()
+    started = time.perf_counter()
+    output = resample(audio)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return output, elapsed, peak
+
+
+def db(value):
+    return 20 * np.log10(max(value, 1e-12))
+
+
+def main():
+    print(f"{SECONDS}s of audio per run")
+    for source_rate in (48000, 44100):
+        polyphase = PolyphaseResampler(source_rate, TARGET_RATE)
+        paths = {
+            "interp": lambda audio, rate=source_rate: interp_resample(audio, rate),
+            "polyphase": polyphase,
+        }
+        print(f"\n{source_rate} Hz -> {TARGET_RATE} Hz")
+        for name, resample in paths.items():
+            passband, elapsed, peak = measure(resample, tone(1000, source_rate))
+            expected = 0.5 * np.sin(2 * np.pi * 1000 * np.arange(len(passband)) / TARGET_RATE)
+            error = np.sqrt(np.mean((passband[256:-256] - expected[256:-256]) ** 2))
+
+            aliased = resample(tone(12000, source_rate))
+            alias_level = np.sqrt(np.mean(aliased[256:-256] ** 2)) / (0.5 / np.sqrt(2))
+
+            print(
+                f"  {name:9s} {elapsed * 1000:8.1f} ms  "
+                f"peak {peak / 1e6:6.1f} MB  "
+                f"1 kHz error {db(error):6.1f} dB  "
+                f"12 kHz alias {db(alias_level):6.1f} dB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+import audio_capture
+from audio_capture import CaptureBuffer, PreRollBuffer
+
+
+class FakeFrames(list):
+    def reshape(self, shape):
+        return self
+
+
+class FakeNumpy:
+    int16 = "int16"
+
+    @staticmethod
+    def empty(capacity, dtype=None):
+        return [0] * capacity
+
+    zeros = empty
+
+
+class Collector:
+    def __init__(self):
+        self.samples = []
+
+    def write(self, frames):
+        self.samples.extend(frames)
+
+
+def test_writes_append_in_place_without_growing(monkeypatch):
+    monkeypatch.setattr(audio_capture, "np", FakeNumpy)
+    buffer = CaptureBuffer(8)
+    backing = buffer._buffer
+
+    buffer.write(FakeFrames([1, 2, 3]))
+    buffer.write(FakeFrames([4, 5]))
+
+    assert buffer._buffer is backing
+    assert len(buffer) == 5
+    assert buffer.view() == [1, 2, 3, 4, 5]
+    assert buffer.view(3) == [4, 5]
+
+
+def test_long_holds_grow_and_keep_captured_audio(monkeypatch):
+    monkeypatch.setattr(audio_capture, "np", FakeNumpy)
+    buffer = CaptureBuffer(4)
+
+    buffer.write(FakeFrames([1, 2, 3]))
+    buffer.write(FakeFrames([4, 5, 6]))
+
+    assert buffer.capacity == 8
+    assert buffer.view() == [1, 2, 3, 4, 5, 6]
+
+
+def test_reset_reuses_preallocated_storage(monkeypatch):
+    monkeypatch.setattr(audio_capture, "np", FakeNumpy)
+    buffer = CaptureBuffer()
+    buffer.reset(6)
+    backing = buffer._buffer
+    buffer.write(FakeFrames([1, 2]))
+
+    buffer.reset(4)
+
+    assert buffer._buffer is backing
+    assert len(buffer) == 0
+    assert buffer.view() == []
+
+
+def test_pre_roll_keeps_only_the_most_recent_samples(monkeypatch):
+    monkeypatch.setattr(audio_capture, "np", FakeNumpy)
+    ring = PreRollBuffer(4)
+    backing = ring._buffer
+
+    ring.write(FakeFrames([1, 2, 3]))
+    ring.write(FakeFrames([4, 5, 6]))
+    target = Collector()
+    ring.drain_into(target)
+
+    assert ring._buffer is backing
+    assert target.samples == [3, 4, 5, 6]
+    assert len(ring) == 0
+
+
+def test_pre_roll_block_larger_than_ring(monkeypatch):
+    monkeypatch.setattr(audio_capture, "np", FakeNumpy)
+    ring = PreRollBuffer(3)
+
+    ring.write(FakeFrames([1, 2, 3, 4, 5]))
+    ring.write(FakeFrames([6]))
+    target = Collector()
+    ring.drain_into(target)
+
+    assert target.samples == [4, 5, 6]
@@ -0,0 +1,68 @@
+import asyncio
+import json
+
+import pytest
+
+
+def write_config(backend, **settings):
+    with open(backend.BUTTON_CONFIG_FILE, "w") as f:
+        json.dump(settings, f)
+
+
+@pytest.mark.parametrize("stored, expected", [(5000, 1000), (-20, 0), ("lots", 400), (None, 400), (250, 250)])
+def test_hand_edited_pre_roll_is_clamped_on_read(backend, stored, expected):
+    write_config(backend, preRollMs=stored)
+
+    assert backend._read_button_config()["preRollMs"] == expected
+
+
+def test_set_pre_roll_still_rejects_out_of_range_values(backend):
+    result = asyncio.run(backend.Plugin().set_pre_roll(5000))
+
+    assert result["success"] is False
+    assert "between 0 and 1000" in result["error"]
+
+
+class FakeService:
+    def __init__(self, scheduling):
+        self.scheduling = scheduling
+        self.model_size = "base"
+        self.model_swap = None
+        self.decoding_profile = None
+        self.preset = None
+
+    def set_preset(self, preset):
+        self.preset = preset
+
+    def set_cascade_paused(self, reason):
+        pass
+
+    def set_model_size(self, model_size):
+        self.model_size = model_size
+
+
+def test_preset_model_size_is_saved_and_follows_preset_switches(backend, monkeypatch):
+    monkeypatch.setattr(backend, "_game_presets", {
+        "wow": {"model_size": "small"},
+        "generic": {"model_size": "medium"},
+    })
+    monkeypatch.setattr(backend.Plugin, "active_preset", "wow")
+    service = FakeService(backend._inference_scheduling(backend._read_button_config()))
+    monkeypatch.setattr(backend.Plugin, "voice_service", service)
+    plugin = backend.Plugin()
+
+    result = asyncio.run(plugin.set_model_size("preset"))
+
+    assert result["success"] is True
+    assert backend._read_button_config()["modelSize"] == "preset"
+    assert service.model_size == "small"
+
+    assert asyncio.run(plugin.set_active_preset("generic")) == {"success": True}
+    assert service.model_size == "medium"
+
+
+def test_unsupported_model_size_is_still_rejected(backend):
+    result = asyncio.run(backend.Plugin().set_model_size("huge"))
+
+    assert result["success"] is False
+    assert "Unsupported model size" in result["error"]
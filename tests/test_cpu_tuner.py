@@ -0,0 +1,153 @@
+import asyncio
+from types import SimpleNamespace
+
+import wow_voice_chat
+from cpu_tuner import CpuTuner, load_tuning, save_tuning, thread_counts, word_error_rate
+from wow_voice_chat import WoWVoiceChat
+
+# Simulated decode time per setting; int16 is fastest but mishears the clip.
+SPEED = {"int8": 1.0, "int8_float32": 1.2, "int16": 0.5, "float32": 2.0}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeModel:
+    def __init__(self, clock, compute_type, cpu_threads):
+        self.clock = clock
+        self.compute_type = compute_type
+        self.cpu_threads = cpu_threads
+
+    def transcribe(self, clip, beam_size, **kwargs):
+        threads = self.cpu_threads or 4
+        self.clock.now += SPEED[self.compute_type] * beam_size / threads
+        text = "pull the boss now"
+        if self.compute_type == "int16":
+            text = "pool the bus now"
+        elif beam_size == 1:
+            text = "pull the bus now"
+        return [SimpleNamespace(text=text)], None
+
+
+def make_tuner(cpu_count=8, max_mb=None):
+    clock = FakeClock()
+    created = []
+
+    def create_model(model_size, compute_type, cpu_threads, num_workers):
+        if compute_type == "float32" and cpu_threads == 8:
+            raise ValueError("unsupported")
+        created.append((compute_type, cpu_threads))
+        return FakeModel(clock, compute_type, cpu_threads)
+
+    tuner = CpuTuner(create_model, "clip", repeats=2, cpu_count=cpu_count, max_mb=max_mb, clock=clock)
+    return tuner, created
+
+
+def test_word_error_rate_ignores_case_and_punctuation():
+    assert word_error_rate("Pull the boss!", "pull the boss") == 0.0
+    assert word_error_rate("pull the boss now", "pool the bus now") == 0.5
+
+
+def test_thread_counts_cover_half_and_all_cores():
+    assert thread_counts(8) == [4, 8]
+    assert thread_counts(16) == [4, 8, 16]
+    assert thread_counts(1) == [1]
+
+
+def test_picks_the_fastest_setting_within_tolerance():
+    tuner, created = make_tuner()
+
+    result = tuner.run()
+
+    # int16 is faster but fails the accuracy check; beam 1 misheard too.
+    assert result["compute_type"] == "int8"
+    assert result["cpu_threads"] == 8
+    assert result["num_workers"] == 1
+    assert result["beam_size"] == 3
+    assert result["speedup"] == 2.0
+    assert ("float32", 8) not in created
+    assert tuner.get_status()["state"] == "done"
+
+
+def test_compute_types_over_the_memory_limit_are_not_loaded():
+    # A base model is estimated at 250 MB in int8 and 450 MB in int16.
+    tuner, created = make_tuner(max_mb=400)
+
+    tuner.run()
+
+    assert {compute_type for compute_type, _ in created} == {"int8", "int8_float32"}
+    assert tuner.get_status()["skipped_compute_types"] == ["int16", "float32"]
+
+
+def test_tuning_is_stored_per_model_size_and_cpu(tmp_path):
+    save_tuning(tmp_path, "base", {"compute_type": "int8"}, cpu="Custom APU 0405")
+    save_tuning(tmp_path, "small", {"compute_type": "int16"}, cpu="Custom APU 0405")
+
+    assert set(load_tuning(tmp_path, cpu="Custom APU 0405")) == {"base", "small"}
+    assert load_tuning(tmp_path, cpu="Custom APU 0932") == {}
+
+
+def test_model_loads_use_the_stored_setting(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        wow_voice_chat, "WhisperModel", lambda size, **kwargs: calls.append(kwargs) or object()
+    )
+    tuning = {"base": {"compute_type": "int8_float32", "cpu_threads": 8, "num_workers": 1, "beam_size": 3}}
+    service = WoWVoiceChat(lazy_load=True, cpu_tuning=tuning)
+
+    assert service._load_model(warm_up=False) is True
+
+    assert calls == [{"device": "cpu", "compute_type": "int8_float32", "cpu_threads": 8, "num_workers": 1}]
+
+
+def test_first_enable_without_tuning_schedules_calibration_once(backend, monkeypatch):
+    scheduled = []
+    monkeypatch.setattr(backend.Plugin, "_calibrate_when_idle", lambda: scheduled.append(True))
+    monkeypatch.setattr(backend.Plugin, "voice_service", SimpleNamespace(warm_mic=False, stop_warm_stream=lambda: None))
+    plugin = backend.Plugin()
+
+    asyncio.run(plugin.set_enabled(True))
+    asyncio.run(plugin.set_enabled(False))
+    asyncio.run(plugin.set_enabled(True))
+
+    assert scheduled == [True]
+
+
+def test_enable_with_stored_tuning_does_not_calibrate(backend, monkeypatch, tmp_path):
+    save_tuning(str(tmp_path), "base", {"compute_type": "int8"}, cpu="test cpu")
+    scheduled = []
+    monkeypatch.setattr(backend.Plugin, "_calibrate_when_idle", lambda: scheduled.append(True))
+    monkeypatch.setattr(backend.Plugin, "voice_service", SimpleNamespace(warm_mic=False, stop_warm_stream=lambda: None))
+
+    asyncio.run(backend.Plugin().set_enabled(True))
+
+    assert scheduled == []
+
+
+def test_idle_calibration_waits_for_a_quiet_moment(backend, monkeypatch):
+    monkeypatch.setattr(backend, "CALIBRATION_IDLE_CHECK_SECONDS", 0)
+    service = SimpleNamespace(is_recording=True, last_used=backend.time.monotonic())
+    checks = []
+
+    def sleep(seconds):
+        # Recording, then recently used, then idle long enough.
+        checks.append(seconds)
+        if len(checks) == 2:
+            service.is_recording = False
+        elif len(checks) == 3:
+            service.last_used -= backend.CALIBRATION_IDLE_SECONDS
+
+    started = []
+    monkeypatch.setattr(backend.time, "sleep", sleep)
+    monkeypatch.setattr(backend.Plugin, "voice_service", service)
+    monkeypatch.setattr(backend.Plugin, "_start_cpu_calibration", lambda: started.append(True))
+
+    backend.Plugin._calibrate_when_idle()
+
+    assert len(checks) == 3
+    assert started == [True]
@@ -0,0 +1,83 @@
+from decoding_profiles import (
+    DECODING_PROFILES,
+    MAX_DECODE_TOKENS,
+    LoopBreaker,
+    decode_token_budget,
+    resolve_decoding_profile,
+)
+
+
+def test_auto_decodes_short_utterances_greedily():
+    name, options = resolve_decoding_profile("auto", 1.5)
+
+    assert name == "fast"
+    assert options["beam_size"] == 1
+    assert options["best_of"] == 1
+
+
+def test_auto_uses_beam_search_for_long_utterances():
+    name, options = resolve_decoding_profile("auto", 12.0)
+
+    assert name == "accurate"
+    assert options["beam_size"] == 5
+
+
+def test_explicit_profile_ignores_duration():
+    name, options = resolve_decoding_profile("balanced", 30.0)
+
+    assert name == "balanced"
+    assert options["beam_size"] == 3
+
+
+def test_unknown_profile_falls_back_to_auto():
+    assert resolve_decoding_profile("turbo", 1.0)[0] == "fast"
+
+
+def test_resolved_options_do_not_alias_profile_table():
+    _, options = resolve_decoding_profile("accurate", 1.0)
+    options["temperature"].append(2.0)
+
+    assert 2.0 not in DECODING_PROFILES["accurate"]["temperature"]
+
+
+def test_every_profile_sets_the_full_option_set():
+    for options in DECODING_PROFILES.values():
+        assert set(options) == {
+            "beam_size",
+            "best_of",
+            "temperature",
+            "compression_ratio_threshold",
+            "log_prob_threshold",
+            "no_speech_threshold",
+        }
+
+
+def test_token_budget_scales_with_duration_and_is_capped():
+    assert decode_token_budget(2.0) == 28
+    assert decode_token_budget(10.0) == 76
+    assert decode_token_budget(60.0) == MAX_DECODE_TOKENS
+
+
+def test_loop_breaker_stops_on_repeated_segments():
+    breaker = LoopBreaker()
+
+    assert breaker.accept(" Thank you.")
+    assert breaker.accept(" thank you.")
+    assert not breaker.accept(" Thank you.")
+    assert breaker.reason == "repeated_segment"
+
+
+def test_loop_breaker_stops_on_compression_blowup():
+    breaker = LoopBreaker()
+
+    assert breaker.accept(" party pull in 3")
+    assert not breaker.accept(" go" * 40)
+    assert breaker.reason == "compression_ratio"
+
+
+def test_loop_breaker_accepts_ordinary_dictation():
+    breaker = LoopBreaker()
+
+    for text in (" Heal the tank,", " then focus the adds", " on the left side."):
+        assert breaker.accept(text)
+    assert breaker.reason is None
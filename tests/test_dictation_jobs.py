@@ -0,0 +1,189 @@
+import threading
+from unittest.mock import MagicMock
+
+import wow_voice_chat
+from dictation_jobs import DictationJob, DictationQueue
+from wow_voice_chat import WoWVoiceChat
+
+
+class FakeBuffer:
+    def __init__(self):
+        self.samples = []
+
+    def __len__(self):
+        return len(self.samples)
+
+    def reset(self, capacity=0):
+        self.samples = []
+
+    def write(self, frames):
+        self.samples += frames
+
+    def view(self, start=0, end=None):
+        return self.samples[start:end]
+
+
+def test_jobs_run_in_submission_order_and_report_completion():
+    processed = []
+    finished = []
+    queue = DictationQueue(lambda job: processed.append(job.audio))
+
+    for name in ["first", "second", "third"]:
+        queue.submit(DictationJob(audio=name, on_done=finished.append))
+
+    assert queue.wait_idle(5)
+    assert processed == ["first", "second", "third"]
+    assert finished == [True, True, True]
+    assert queue.get_status()["completed"] == 3
+
+
+def test_failed_job_does_not_stop_the_queue():
+    def process(job):
+        if job.audio == "bad":
+            raise RuntimeError("decoder crashed")
+
+    queue = DictationQueue(process)
+    bad = queue.submit(DictationJob(audio="bad"))
+    good = queue.submit(DictationJob(audio="good"))
+
+    assert good.wait(5)
+    assert bad.done.is_set()
+    status = queue.get_status()
+    assert status["failed"] == 1
+    assert status["completed"] == 1
+    assert status["depth"] == 0
+
+
+def make_service(monkeypatch):
+    monkeypatch.setattr(wow_voice_chat, "sd", MagicMock())
+    service = WoWVoiceChat(lazy_load=True, speech_detection=False)
+    service.capture_buffer = FakeBuffer()
+    service._negotiate_sample_rate = lambda: 16000
+    service._load_model = lambda warm_up=True: None
+    service.release = threading.Event()
+    service.decoding = threading.Event()
+    service.transcribed = []
+
+    def transcribe(audio, cancel=None):
+        service.decoding.set()
+        service.release.wait(5)
+        service.transcribed.append(audio)
+        return " ".join(audio)
+
+    service.transcribe_audio = transcribe
+    service.sent = []
+    service.send_to_wow_chat = service.sent.append
+    return service
+
+
+def test_mic_is_free_while_earlier_recordings_transcribe(monkeypatch):
+    service = make_service(monkeypatch)
+
+    service.start_recording()
+    service.audio_callback(["hello"], 1, None, None)
+    first = service.stop_recording()
+
+    # The first recording is still decoding, yet the next press records.
+    service.start_recording()
+    assert service.is_recording
+    service.audio_callback(["world"], 1, None, None)
+    second = service.stop_recording()
+    assert service.dictations.get_status()["depth"] == 2
+
+    service.release.set()
+    assert second.wait(5)
+    assert first.done.is_set()
+    assert service.transcribed == [["hello"], ["world"]]
+    assert service.sent == ["hello", "world"]
+
+
+def test_cancelled_job_is_skipped_before_it_starts():
+    processed = []
+    finished = []
+    queue = DictationQueue(lambda job: processed.append(job.audio))
+    job = DictationJob(audio="never", on_done=finished.append)
+    job.cancel()
+
+    queue.submit(job)
+
+    assert job.wait(5)
+    assert processed == []
+    assert finished == [True]
+    assert queue.get_status()["cancelled"] == 1
+
+
+def test_cancel_transcription_drops_in_flight_and_queued_text(monkeypatch):
+    service = make_service(monkeypatch)
+
+    service.start_recording()
+    service.audio_callback(["hello"], 1, None, None)
+    first = service.stop_recording()
+    service.start_recording()
+    service.audio_callback(["world"], 1, None, None)
+    second = service.stop_recording()
+    # Cancel once the first job is in flight, not while it is still queued.
+    assert service.decoding.wait(5)
+
+    assert service.cancel_transcription() == 2
+    service.release.set()
+
+    assert second.wait(5)
+    assert first.done.is_set()
+    # The first decode ran to its end in this fake, but nothing was typed.
+    assert service.transcribed == [["hello"]]
+    assert service.sent == []
+    assert service.dictations.get_status()["cancelled"] == 2
+
+
+def test_cancel_transcription_drops_a_pending_confirmation(monkeypatch):
+    service = make_service(monkeypatch)
+    service.confirm_delay = 30
+    service.release.set()
+
+    service.start_recording()
+    service.audio_callback(["hello"], 1, None, None)
+    service.stop_recording().wait(5)
+    assert service.pending_text == "hello"
+
+    assert service.cancel_transcription() == 1
+    assert service.pending_text is None
+    assert service.sent == []
+
+
+def test_model_is_not_unloaded_while_a_job_decodes(monkeypatch):
+    service = make_service(monkeypatch)
+    service.model = object()
+    service.start_recording()
+    service.audio_callback(["hello"], 1, None, None)
+    job = service.stop_recording()
+
+    assert service.unload_model() is False
+    assert service.model is not None
+
+    service.release.set()
+    assert job.wait(5)
+    assert service.dictations.wait_idle(5)
+    assert service.unload_model() is True
+
+
+def test_model_is_not_unloaded_under_a_direct_decode():
+    service = WoWVoiceChat(lazy_load=True)
+    service.model = object()
+    decoding = threading.Event()
+    release = threading.Event()
+
+    def transcribe(audio_input, sample_rate, cancel):
+        decoding.set()
+        release.wait(5)
+        return "inc"
+
+    service._transcribe = transcribe
+    thread = threading.Thread(target=service.transcribe_audio, args=([0.0],))
+    thread.start()
+    assert decoding.wait(5)
+
+    assert service.unload_model() is False
+
+    release.set()
+    thread.join(5)
+    assert service.unload_model() is True
@@ -0,0 +1,113 @@
+import os
+import threading
+
+import pytest
+
+import inference_scheduling
+import wow_voice_chat
+from inference_scheduling import InferenceScheduling
+from wow_voice_chat import WoWVoiceChat
+
+
+@pytest.fixture
+def os_calls(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        inference_scheduling.os, "setpriority",
+        lambda which, who, nice: calls.append(("nice", who, nice)),
+    )
+    monkeypatch.setattr(
+        inference_scheduling.os, "sched_setscheduler",
+        lambda pid, policy, param: calls.append(("policy", pid, policy)),
+    )
+    monkeypatch.setattr(
+        inference_scheduling.os, "sched_setaffinity",
+        lambda pid, cpus: calls.append(("affinity", pid, cpus)),
+    )
+    monkeypatch.setattr(inference_scheduling.os, "sched_getaffinity", lambda pid: {0, 1, 2, 3})
+    return calls
+
+
+def test_thread_cap_only_lowers_the_count():
+    assert InferenceScheduling(max_threads=0).cap_threads(8) == 8
+    assert InferenceScheduling(max_threads=2).cap_threads(8) == 2
+    assert InferenceScheduling(max_threads=2).cap_threads(1) == 1
+    # CTranslate2's default (0) uses every core, so the cap replaces it.
+    assert InferenceScheduling(max_threads=2).cap_threads(0) == 2
+
+
+def test_run_applies_the_policy_on_a_separate_thread(os_calls):
+    scheduling = InferenceScheduling(priority="low", cpus=[2, 3, 7])
+
+    thread_id = scheduling.run(threading.get_native_id)
+
+    assert thread_id != threading.get_native_id()
+    assert os_calls == [
+        ("nice", thread_id, inference_scheduling.LOW_PRIORITY_NICE),
+        ("policy", 0, os.SCHED_BATCH),
+        ("affinity", 0, {2, 3}),
+    ]
+    assert scheduling.get_status()["sched_batch"] is True
+
+
+def test_run_propagates_errors(os_calls):
+    def fail():
+        raise RuntimeError("model missing")
+
+    with pytest.raises(RuntimeError, match="model missing"):
+        InferenceScheduling().run(fail)
+
+
+def test_unavailable_mechanisms_are_reported_not_raised(monkeypatch, os_calls):
+    def denied(*args):
+        raise PermissionError("Operation not permitted")
+
+    monkeypatch.setattr(inference_scheduling.os, "setpriority", denied)
+    scheduling = InferenceScheduling(priority="normal")
+
+    assert scheduling.run(lambda: "loaded") == "loaded"
+    assert scheduling.get_status()["nice"] is False
+    assert ("policy", 0, os.SCHED_OTHER) in os_calls
+
+
+def test_policy_threads_are_reused_and_the_caller_is_left_alone(os_calls):
+    scheduling = InferenceScheduling()
+    caller = threading.get_native_id()
+
+    threads = [scheduling.run(threading.get_native_id) for _ in range(3)]
+    # A call made from a policy thread runs there instead of waiting on the pool.
+    nested = scheduling.run(lambda: (threading.get_native_id(), scheduling.run(threading.get_native_id)))
+    scheduling.close()
+
+    assert nested[0] == nested[1]
+    reniced = [call[1] for call in os_calls if call[0] == "nice"]
+    # Each policy thread is set up once, however many calls it serves.
+    assert sorted(reniced) == sorted(set(threads + [nested[0]]))
+    assert caller not in reniced
+
+
+def test_worker_process_joins_the_low_weight_cgroup(tmp_path, os_calls):
+    scheduling = InferenceScheduling(cgroup_root=str(tmp_path))
+
+    scheduling.apply_to_process(4242)
+
+    cgroup = tmp_path / inference_scheduling.CGROUP_NAME
+    assert (cgroup / "cpu.weight").read_text() == str(inference_scheduling.LOW_CPU_WEIGHT)
+    assert (cgroup / "cgroup.procs").read_text() == "4242"
+    assert ("nice", 4242, inference_scheduling.LOW_PRIORITY_NICE) in os_calls
+    assert scheduling.get_status()["cgroup"] is True
+
+
+def test_models_are_built_under_the_policy_with_capped_threads(monkeypatch, os_calls):
+    calls = []
+    monkeypatch.setattr(
+        wow_voice_chat, "WhisperModel",
+        lambda size, **kwargs: calls.append((threading.get_native_id(), kwargs)) or object(),
+    )
+    service = WoWVoiceChat(lazy_load=True, scheduling=InferenceScheduling(max_threads=2))
+
+    assert service._load_model(warm_up=False) is True
+
+    thread_id, options = calls[0]
+    assert options == {"device": "cpu", "compute_type": "int8", "cpu_threads": 2}
+    assert ("nice", thread_id, inference_scheduling.LOW_PRIORITY_NICE) in os_calls
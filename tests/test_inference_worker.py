@@ -0,0 +1,182 @@
+import array
+import os
+import sys
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+import inference_worker
+from inference_worker import (
+    InferenceWorker,
+    InferenceWorkerClient,
+    RemoteWhisperModel,
+    connect_worker,
+)
+
+
+class FloatArray(array.array):
+    @property
+    def nbytes(self):
+        return len(self) * self.itemsize
+
+
+class FakeNumpy:
+    float32 = "float32"
+
+    @staticmethod
+    def ascontiguousarray(values, dtype=None):
+        return FloatArray("f", values)
+
+    @staticmethod
+    def frombuffer(buffer, dtype=None, count=-1):
+        return list(FloatArray("f", bytes(buffer[: count * 4])))
+
+
+class FakeModel:
+    def __init__(self, texts):
+        self.texts = texts
+        self.audio = None
+        self.options = None
+        self.decoded = 0
+
+    def transcribe(self, audio, **options):
+        self.audio = audio
+        self.options = options
+
+        def segments():
+            for text in self.texts:
+                self.decoded += 1
+                yield SimpleNamespace(
+                    text=text, start=0.0, end=1.0, avg_logprob=-0.2,
+                    no_speech_prob=0.01, compression_ratio=1.1,
+                )
+
+        info = SimpleNamespace(language="en", language_probability=0.98, duration=1.0)
+        return segments(), info
+
+
+@pytest.fixture
+def worker(tmp_path, monkeypatch):
+    monkeypatch.setattr(inference_worker, "np", FakeNumpy)
+    socket_path = str(tmp_path / "worker.sock")
+    worker = InferenceWorker("1.0", idle_exit_seconds=0)
+    worker.models["base:int8"] = {
+        "model": FakeModel([" Pull", " the boss."]),
+        "model_size": "base",
+        "compute_type": "int8",
+        "refs": 0,
+    }
+    thread = threading.Thread(target=worker.serve, args=(socket_path,), daemon=True)
+    thread.start()
+    client = InferenceWorkerClient(socket_path, shared_audio_dir=str(tmp_path), timeout=5)
+    assert client.wait_for_hello(5) is not None
+    yield worker, client, tmp_path
+    client.shutdown()
+    thread.join(5)
+
+
+def test_transcribes_audio_passed_through_shared_memory(worker):
+    worker, client, shm_dir = worker
+    model = RemoteWhisperModel(client, "base")
+
+    segments, info = model.transcribe([0.25, -0.5], beam_size=1, language=None)
+
+    assert model.cached is True
+    assert [segment.text for segment in segments] == [" Pull", " the boss."]
+    assert info.language == "en"
+    fake = worker.models["base:int8"]["model"]
+    assert fake.audio == [0.25, -0.5]
+    assert fake.options == {"beam_size": 1, "language": None}
+    assert not [name for name in os.listdir(shm_dir) if name.startswith("decktation-audio")]
+
+
+def test_stopping_iteration_stops_decoding_in_the_worker(worker):
+    worker, client, _ = worker
+    fake = FakeModel([" Thank you."] * 10)
+    worker.models["base:int8"]["model"] = fake
+    model = RemoteWhisperModel(client, "base")
+
+    segments, _ = model.transcribe([0.1])
+    next(segments)
+    segments.close()
+
+    assert fake.decoded == 1
+
+
+def test_release_drops_the_model_after_the_last_reference(worker):
+    worker, client, _ = worker
+    first = RemoteWhisperModel(client, "base")
+    second = RemoteWhisperModel(client, "base")
+
+    first.release()
+    assert "base:int8" in worker.models
+    second.release()
+    assert "base:int8" not in worker.models
+
+
+def test_reattaches_to_a_compatible_worker_without_spawning(worker):
+    _, client, _ = worker
+    spawned = []
+
+    hello, reattached = connect_worker(client, "1.0", lambda: spawned.append(True))
+
+    assert reattached is True
+    assert spawned == []
+    assert hello["models"] == [
+        {"model_size": "base", "compute_type": "int8", "cpu_threads": 0, "num_workers": 1}
+    ]
+
+
+def test_missing_worker_is_spawned(tmp_path):
+    client = InferenceWorkerClient(str(tmp_path / "none.sock"), timeout=1)
+
+    with pytest.raises(RuntimeError):
+        connect_worker(client, "1.0", lambda: None, timeout=0.2)
+
+
+def test_load_forwards_thread_settings(worker, monkeypatch):
+    worker, client, _ = worker
+    created = []
+    monkeypatch.setattr(
+        sys.modules["faster_whisper"], "WhisperModel",
+        lambda size, **kwargs: created.append(kwargs) or FakeModel([]),
+    )
+
+    RemoteWhisperModel(client, "small", compute_type="int8", cpu_threads=2, num_workers=1)
+
+    assert created == [{"device": "cpu", "compute_type": "int8", "cpu_threads": 2, "num_workers": 1}]
+    assert "small:int8:2t:1w" in worker.models
+
+
+def test_exited_worker_is_replaced_and_the_model_loaded_again(tmp_path, monkeypatch):
+    monkeypatch.setattr(inference_worker, "np", FakeNumpy)
+    monkeypatch.setattr(
+        sys.modules["faster_whisper"], "WhisperModel",
+        lambda size, **kwargs: FakeModel([" Again."]),
+    )
+    socket_path = str(tmp_path / "worker.sock")
+    threads = []
+
+    def spawn():
+        thread = threading.Thread(
+            target=InferenceWorker("1.0", idle_exit_seconds=0).serve, args=(socket_path,), daemon=True
+        )
+        thread.start()
+        threads.append(thread)
+
+    client = InferenceWorkerClient(socket_path, shared_audio_dir=str(tmp_path), timeout=5)
+    connect_worker(client, "1.0", spawn)
+    client.reconnect = lambda: connect_worker(client, "1.0", spawn)
+    model = RemoteWhisperModel(client, "base")
+
+    # The idle exit: the worker goes away with the model still referenced.
+    client.shutdown()
+    threads[0].join(5)
+    segments, _ = model.transcribe([0.1])
+
+    assert [segment.text for segment in segments] == [" Again."]
+    assert len(threads) == 2
+    assert client.generation == 1
+    client.shutdown()
+    threads[1].join(5)
@@ -0,0 +1,92 @@
+from types import SimpleNamespace
+
+import wow_voice_chat
+from language_cache import LanguageCache
+from wow_voice_chat import WoWVoiceChat
+
+
+def test_caches_after_a_confident_streak():
+    cache = LanguageCache(streak=3)
+
+    for _ in range(3):
+        assert cache.lookup() is None
+        cache.observe("de", 0.95, -0.3, cached=False)
+
+    assert cache.lookup() == "de"
+    assert cache.get_status()["hit_rate"] == 0.25
+
+
+def test_unsure_or_different_detection_restarts_the_streak():
+    cache = LanguageCache(streak=2)
+
+    cache.observe("en", 0.9, -0.2, cached=False)
+    cache.observe("en", 0.5, -0.2, cached=False)
+    cache.observe("en", 0.9, -0.2, cached=False)
+    cache.observe("nl", 0.9, -0.2, cached=False)
+    assert cache.language is None
+
+    cache.observe("nl", 0.9, -0.2, cached=False)
+    assert cache.language == "nl"
+
+
+def test_low_confidence_with_the_cached_language_invalidates_it():
+    cache = LanguageCache(streak=1)
+    cache.observe("fr", 0.99, -0.2, cached=False)
+
+    cache.observe(None, 1.0, -0.4, cached=True)
+    assert cache.language == "fr"
+    cache.observe(None, 1.0, -1.6, cached=True)
+
+    assert cache.language is None
+    assert cache.get_status()["last_invalidation"] == "low_confidence"
+
+
+class FakeNumpy:
+    @staticmethod
+    def abs(values):
+        return [abs(value) for value in values]
+
+    @staticmethod
+    def max(values):
+        return max(values)
+
+    @staticmethod
+    def square(values):
+        return [value * value for value in values]
+
+    @staticmethod
+    def mean(values):
+        return sum(values) / len(values)
+
+    @staticmethod
+    def sqrt(value):
+        return value ** 0.5
+
+
+class FakeAudio(list):
+    dtype = "float32"
+
+
+def test_auto_mode_skips_detection_once_cached_until_the_preset_changes(monkeypatch):
+    monkeypatch.setattr(wow_voice_chat, "np", FakeNumpy)
+    service = WoWVoiceChat(lazy_load=True)
+    service._prepare_audio = lambda audio, sample_rate: FakeAudio([0.0, 0.1])
+    languages = []
+
+    def transcribe(audio, **kwargs):
+        languages.append(kwargs["language"])
+        info = SimpleNamespace(language="es", language_probability=0.97)
+        return [SimpleNamespace(text="vamos", avg_logprob=-0.2)], info
+
+    service.model = SimpleNamespace(transcribe=transcribe)
+
+    for _ in range(4):
+        service.transcribe_audio([0.0, 0.1])
+    service.set_preset({"name": "Generic"})
+    service.transcribe_audio([0.0, 0.1])
+
+    assert languages == [None, None, None, "es", None]
+    status = service.language_cache.get_status()
+    assert status["detected_language"] == "es"
+    assert status["hits"] == 1
+    assert status["last_invalidation"] == "preset_changed"
@@ -0,0 +1,100 @@
+from dictation_jobs import DictationJob
+from latency_slo import LatencyHistogram, LatencySlo
+from wow_voice_chat import WoWVoiceChat
+
+
+def make_slo(clock, max_level=2):
+    changes = []
+    slo = LatencySlo(
+        lambda level, seconds: changes.append(level),
+        target_seconds=1.5,
+        percentile=95,
+        max_level=max_level,
+        min_samples=5,
+        sustain_seconds=60,
+        clock=lambda: clock[0],
+    )
+    return slo, changes
+
+
+def record(slo, clock, seconds, count, step=10):
+    for _ in range(count):
+        slo.record(seconds)
+        clock[0] += step
+
+
+def test_histogram_percentile_and_buckets():
+    histogram = LatencyHistogram(window=20)
+    for seconds in [0.4] * 18 + [2.0, 6.0]:
+        histogram.add(seconds)
+
+    assert histogram.percentile(50) == 0.4
+    assert histogram.percentile(95) == 2.0
+    assert histogram.percentile(100) == 6.0
+    assert histogram.buckets()["<=0.5s"] == 18
+    assert histogram.buckets()[">5.0s"] == 1
+
+
+def test_one_slow_dictation_does_not_downgrade():
+    clock = [0]
+    slo, changes = make_slo(clock)
+
+    record(slo, clock, 0.9, 19)
+    record(slo, clock, 4.0, 1)
+    record(slo, clock, 0.9, 20)
+
+    assert changes == []
+    assert slo.get_status()["state"] == "ok"
+
+
+def test_sustained_violation_steps_down_one_tier_at_a_time():
+    clock = [0]
+    slo, changes = make_slo(clock)
+
+    # Five samples to start measuring, then a minute of violation.
+    record(slo, clock, 2.5, 11)
+    assert changes == [1]
+    assert slo.get_status()["samples"] == 0
+
+    record(slo, clock, 2.5, 11)
+    record(slo, clock, 2.5, 20)
+    assert changes == [1, 2]
+    assert slo.level == 2
+
+
+def test_headroom_steps_back_up():
+    clock = [0]
+    slo, changes = make_slo(clock)
+    record(slo, clock, 2.5, 11)
+
+    # Under the target but without headroom keeps the faster tier.
+    record(slo, clock, 1.2, 20)
+    assert changes == [1]
+
+    slo.histogram.clear()
+    record(slo, clock, 0.5, 11)
+    assert changes == [1, 0]
+    assert slo.get_status()["last_change"]["from"] == 1
+
+
+def test_lowering_the_max_level_restores_a_tier():
+    clock = [0]
+    slo, changes = make_slo(clock)
+    record(slo, clock, 2.5, 11)
+
+    slo.set_max_level(0)
+
+    assert changes == [1, 0]
+
+
+def test_delivered_dictations_report_release_to_chat_latency(monkeypatch):
+    latencies = []
+    service = WoWVoiceChat(lazy_load=True, latency_reporter=latencies.append)
+    monkeypatch.setattr(service, "transcribe_audio", lambda audio, cancel=None: "inc mid")
+    monkeypatch.setattr(service, "send_to_wow_chat", lambda text: None)
+
+    service._process_dictation(DictationJob(audio=[0.0]))
+    service._process_dictation(DictationJob(audio=[0.0], send=False))
+
+    assert len(latencies) == 1
+    assert service.last_dictation_latency == round(latencies[0], 3)
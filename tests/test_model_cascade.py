@@ -0,0 +1,135 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import wow_voice_chat
+from model_cascade import CascadeStats, escalation_reason
+from wow_voice_chat import WoWVoiceChat
+
+
+def quality(**overrides):
+    values = {
+        "text_present": True,
+        "avg_logprob": -0.3,
+        "no_speech_prob": 0.1,
+        "compression_ratio": 1.1,
+    }
+    values.update(overrides)
+    return values
+
+
+def test_confident_decodes_are_not_escalated():
+    assert escalation_reason(quality()) is None
+    # Nothing heard is left to speech detection, not a larger model.
+    assert escalation_reason(quality(text_present=False, avg_logprob=-2.0)) is None
+
+
+def test_each_low_confidence_signal_escalates():
+    assert escalation_reason(quality(avg_logprob=-1.2)) == "avg_logprob"
+    assert escalation_reason(quality(no_speech_prob=0.8)) == "no_speech_prob"
+    assert escalation_reason(quality(compression_ratio=2.6)) == "compression_ratio"
+    assert escalation_reason(quality(), "repeated_segment") == "loop_breaker"
+
+
+def test_stats_report_rate_and_added_latency():
+    stats = CascadeStats()
+    stats.record(None)
+    stats.record("avg_logprob")
+    stats.record("avg_logprob", 0.5)
+    stats.record("no_speech_prob", 1.5)
+
+    status = stats.get_status()
+    assert status["escalations"] == 2
+    assert status["skipped"] == 1
+    assert status["escalation_rate"] == 0.5
+    assert status["mean_added_latency_seconds"] == 1.0
+
+
+class FakeNumpy:
+    @staticmethod
+    def abs(values):
+        return [abs(value) for value in values]
+
+    @staticmethod
+    def max(values):
+        return max(values)
+
+    @staticmethod
+    def square(values):
+        return [value * value for value in values]
+
+    @staticmethod
+    def mean(values):
+        return sum(values) / len(values)
+
+    @staticmethod
+    def sqrt(value):
+        return value ** 0.5
+
+
+class FakeAudio(list):
+    dtype = "float32"
+
+
+class TierModel:
+    def __init__(self, size, text, avg_logprob):
+        self.size = size
+        self.text = text
+        self.avg_logprob = avg_logprob
+        self.calls = 0
+
+    def transcribe(self, audio, **kwargs):
+        self.calls += 1
+        segment = SimpleNamespace(text=self.text, avg_logprob=self.avg_logprob, no_speech_prob=0.05)
+        return [segment], SimpleNamespace(language="en", language_probability=0.9)
+
+
+def test_unsure_base_result_is_redecoded_by_the_second_tier(monkeypatch):
+    monkeypatch.setattr(wow_voice_chat, "np", FakeNumpy)
+    loaded = threading.Event()
+    small = TierModel("small", "pull the boss", -0.2)
+
+    def factory(size):
+        assert size == "small"
+        loaded.set()
+        return small
+
+    service = WoWVoiceChat(lazy_load=True, model_factory=factory, cascade_model_size="small")
+    service.model = TierModel("base", "pool the bus", -1.1)
+    service._prepare_audio = lambda audio, sample_rate: FakeAudio([0.0, 0.1])
+
+    # The first unsure result starts loading the second tier and is kept.
+    assert service.transcribe_audio([0.1]) == "pool the bus"
+    assert loaded.wait(5)
+    for _ in range(100):
+        if service.get_cascade_status()["loaded"] == "small":
+            break
+        time.sleep(0.01)
+
+    assert service.transcribe_audio([0.1]) == "pull the boss"
+    status = service.get_cascade_status()
+    assert status["escalations"] == 1
+    assert status["skipped"] == 1
+    assert status["last_reason"] == "avg_logprob"
+    assert status["last_added_latency_seconds"] is not None
+
+    service.set_cascade_model_size(None)
+    assert service.get_cascade_status()["loaded"] is None
+
+
+def test_paused_cascade_keeps_the_first_tier_result(monkeypatch):
+    monkeypatch.setattr(wow_voice_chat, "np", FakeNumpy)
+
+    def factory(size):
+        raise AssertionError("the second tier must not load while paused")
+
+    service = WoWVoiceChat(lazy_load=True, model_factory=factory, cascade_model_size="small")
+    service.model = TierModel("base", "pool the bus", -1.1)
+    service._prepare_audio = lambda audio, sample_rate: FakeAudio([0.0, 0.1])
+    service.set_cascade_paused("constrained")
+
+    assert service.transcribe_audio([0.1]) == "pool the bus"
+    status = service.get_cascade_status()
+    assert status["paused"] == "constrained"
+    assert status["transcriptions"] == 0
+    assert status["loading"] is False
@@ -0,0 +1,115 @@
+from model_pool import ModelPool, estimate_mb
+from wow_voice_chat import WoWVoiceChat
+
+
+class FakeModel:
+    def __init__(self, name):
+        self.name = name
+        self.released = False
+
+    def release(self):
+        self.released = True
+
+
+def make_pool(budget_mb, in_use=()):
+    released = []
+    pool = ModelPool(released.append, in_use=lambda: in_use, budget_mb=budget_mb)
+    return pool, released
+
+
+def test_evicts_least_recently_used_models_over_budget():
+    pool, released = make_pool(budget_mb=1200)
+    base, small, base_fp32 = FakeModel("base"), FakeModel("small"), FakeModel("base-fp32")
+    pool.put(("base", "int8"), base, {})
+    pool.put(("small", "int8"), small, {})
+    assert pool.get(("base", "int8"), {}) is base
+
+    pool.put(("base", "float32"), base_fp32, {})
+
+    assert released == [small]
+    assert [model["model_size"] for model in pool.get_status()["models"]] == ["base", "base"]
+    assert pool.get_status()["used_mb"] == estimate_mb("base", "int8") + estimate_mb("base", "float32")
+
+
+def test_models_in_use_and_the_new_model_are_never_evicted():
+    active = FakeModel("medium")
+    pool, released = make_pool(budget_mb=500, in_use=(active,))
+    pool.put(("medium", "int8"), active, {})
+
+    small = pool.put(("small", "int8"), FakeModel("small"), {})
+
+    assert released == []
+    assert pool.get_status()["used_mb"] > 500
+    # Once it is no longer needed, the retired model goes first.
+    pool.retire(small)
+    assert released == [small]
+
+
+def test_a_model_built_with_other_options_is_not_reused():
+    pool, released = make_pool(budget_mb=1024)
+    old = FakeModel("base")
+    pool.put(("base", "int8"), old, {"cpu_threads": 8})
+
+    assert pool.get(("base", "int8"), {"cpu_threads": 4}) is None
+    assert released == [old]
+    assert pool.get_status()["misses"] == 1
+
+
+def test_retiring_an_unpooled_model_releases_it():
+    pool, released = make_pool(budget_mb=1024)
+    model = FakeModel("base")
+
+    pool.retire(model)
+
+    assert released == [model]
+
+
+def make_service(budget_mb=2048):
+    created = []
+
+    def factory(model_size):
+        model = FakeModel(model_size)
+        created.append(model)
+        return model
+
+    service = WoWVoiceChat(lazy_load=True, model_factory=factory, model_pool_mb=budget_mb)
+    service.warm_up_model = lambda: True
+    return service, created
+
+
+def test_switching_back_reuses_the_resident_model():
+    service, created = make_service()
+    assert service._load_model(warm_up=False)
+
+    service.set_model_size("small")
+    assert service.wait_for_model_swap(5)
+    service.set_model_size("base")
+    assert service.wait_for_model_swap(5)
+
+    assert [model.name for model in created] == ["base", "small"]
+    assert service.model is created[0]
+    assert not any(model.released for model in created)
+    assert service.model_pool.get_status()["hits"] == 1
+
+
+def test_switching_over_budget_releases_the_previous_model():
+    service, created = make_service(budget_mb=600)
+    assert service._load_model(warm_up=False)
+
+    service.set_model_size("small")
+    assert service.wait_for_model_swap(5)
+
+    assert created[0].released is True
+    assert service.model_pool.get_status()["evictions"] == 1
+
+
+def test_unloading_frees_every_pooled_model():
+    service, created = make_service()
+    assert service._load_model(warm_up=False)
+    service.set_model_size("small")
+    assert service.wait_for_model_swap(5)
+
+    assert service.unload_model() is True
+
+    assert all(model.released for model in created)
+    assert service.model_pool.get_status()["models"] == []
@@ -0,0 +1,86 @@
+import model_residency
+from model_residency import ModelResidency, read_mem_available
+
+
+class FakeService:
+    def __init__(self):
+        self.model = object()
+        self.last_used = 0.0
+        self.busy = False
+
+    def is_model_ready(self):
+        return self.model is not None
+
+    def unload_model(self):
+        if self.busy:
+            return False
+        self.model = None
+        return True
+
+
+def write_meminfo(path, available_kib):
+    path.write_text(
+        "MemTotal:       16000000 kB\n"
+        f"MemAvailable:   {available_kib} kB\n"
+    )
+
+
+def make_residency(tmp_path, monkeypatch, service, now, available_kib=8000000):
+    monkeypatch.setattr(model_residency, "release_freed_memory", lambda: None)
+    meminfo = tmp_path / "meminfo"
+    write_meminfo(meminfo, available_kib)
+    status = tmp_path / "status"
+    status.write_text("VmRSS:\t  900000 kB\n")
+    return ModelResidency(
+        service,
+        idle_seconds=600,
+        min_available_bytes=1024 * 1024 * 1024,
+        meminfo_path=str(meminfo),
+        status_path=str(status),
+        clock=lambda: now,
+    )
+
+
+def test_reads_mem_available_in_bytes(tmp_path):
+    meminfo = tmp_path / "meminfo"
+    write_meminfo(meminfo, 2048)
+
+    assert read_mem_available(str(meminfo)) == 2048 * 1024
+    assert read_mem_available(str(tmp_path / "missing")) is None
+
+
+def test_keeps_recently_used_model(tmp_path, monkeypatch):
+    service = FakeService()
+    residency = make_residency(tmp_path, monkeypatch, service, now=60)
+
+    assert residency.check() is None
+    assert service.is_model_ready()
+
+
+def test_unloads_after_idle_timeout(tmp_path, monkeypatch):
+    service = FakeService()
+    residency = make_residency(tmp_path, monkeypatch, service, now=601)
+
+    assert residency.check() == "idle"
+
+    status = residency.get_status()
+    assert status["resident"] is False
+    assert status["unloaded_reason"] == "idle"
+    assert status["reclaimed_rss_mb"] == 0
+
+
+def test_unloads_early_below_memory_watermark(tmp_path, monkeypatch):
+    service = FakeService()
+    residency = make_residency(tmp_path, monkeypatch, service, now=5, available_kib=512 * 1024)
+
+    assert residency.check() == "memory_pressure"
+    assert not service.is_model_ready()
+
+
+def test_busy_service_is_not_unloaded(tmp_path, monkeypatch):
+    service = FakeService()
+    service.busy = True
+    residency = make_residency(tmp_path, monkeypatch, service, now=601)
+
+    assert residency.check() is None
+    assert residency.get_status()["resident"] is True
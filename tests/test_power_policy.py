@@ -0,0 +1,180 @@
+import threading
+import time
+from types import SimpleNamespace
+
+from power_policy import PowerPolicy, smaller_model_size
+
+MODEL_SIZES = ("base", "small", "medium")
+
+
+class FakeSysfs:
+    """A sysfs tree shaped like a Steam Deck's."""
+
+    def __init__(self, root):
+        self.root = root
+        self.set_temperature(55)
+        self.set_battery("Charging")
+        self.set_max_freq(3500000)
+        zone = root / "class" / "thermal" / "thermal_zone1"
+        zone.mkdir(parents=True)
+        (zone / "temp").write_text("0\n")  # disabled sensors report 0
+        adapter = root / "class" / "power_supply" / "ADP1"
+        adapter.mkdir(parents=True)
+        (adapter / "type").write_text("Mains\n")
+
+    def set_temperature(self, celsius):
+        zone = self.root / "class" / "thermal" / "thermal_zone0"
+        zone.mkdir(parents=True, exist_ok=True)
+        (zone / "temp").write_text(f"{int(celsius * 1000)}\n")
+
+    def set_battery(self, status):
+        battery = self.root / "class" / "power_supply" / "BAT1"
+        battery.mkdir(parents=True, exist_ok=True)
+        (battery / "type").write_text("Battery\n")
+        (battery / "status").write_text(f"{status}\n")
+
+    def set_max_freq(self, khz):
+        policy = self.root / "devices" / "system" / "cpu" / "cpufreq" / "policy0"
+        policy.mkdir(parents=True, exist_ok=True)
+        (policy / "cpuinfo_max_freq").write_text("3500000\n")
+        (policy / "scaling_max_freq").write_text(f"{khz}\n")
+
+
+def make_policy(tmp_path, clock):
+    sysfs = FakeSysfs(tmp_path)
+    changes = []
+    policy = PowerPolicy(
+        lambda constrained, reasons: changes.append((constrained, reasons)),
+        sysfs_root=str(tmp_path),
+        recover_seconds=60,
+        clock=lambda: clock[0],
+    )
+    return sysfs, policy, changes
+
+
+def test_smaller_model_size_stops_at_the_cheapest():
+    assert smaller_model_size("medium", MODEL_SIZES) == "small"
+    assert smaller_model_size("base", MODEL_SIZES) == "base"
+
+
+def test_reads_conditions_from_the_sysfs_root(tmp_path):
+    sysfs, policy, _ = make_policy(tmp_path, [0])
+    sysfs.set_max_freq(1750000)
+
+    assert policy.read_conditions() == {
+        "temperature_c": 55.0,
+        "on_battery": False,
+        "freq_ratio": 0.5,
+    }
+
+
+def test_missing_sensors_do_not_constrain(tmp_path):
+    policy = PowerPolicy(lambda *args: None, sysfs_root=str(tmp_path))
+
+    assert policy.check() is False
+    assert policy.get_status()["temperature_c"] is None
+
+
+def test_constrains_when_hot_and_recovers_after_cooling(tmp_path):
+    clock = [0]
+    sysfs, policy, changes = make_policy(tmp_path, clock)
+    assert policy.check() is False
+
+    sysfs.set_temperature(90)
+    assert policy.check() is True
+    assert changes == [(True, ["thermal"])]
+
+    # Below the limit but within the cooling margin still counts as hot.
+    sysfs.set_temperature(80)
+    assert policy.check() is True
+
+    sysfs.set_temperature(70)
+    assert policy.check() is True
+    clock[0] = 59
+    assert policy.check() is True
+    clock[0] = 60
+    assert policy.check() is False
+    assert changes == [(True, ["thermal"]), (False, [])]
+
+
+def test_battery_and_frequency_caps_constrain(tmp_path):
+    clock = [0]
+    sysfs, policy, changes = make_policy(tmp_path, clock)
+
+    sysfs.set_battery("Discharging")
+    sysfs.set_max_freq(1600000)
+
+    assert policy.check() is True
+    assert changes == [(True, ["battery", "cpufreq"])]
+    assert policy.get_status()["freq_ratio"] == 0.46
+
+
+def test_a_relapse_restarts_the_recovery_timer(tmp_path):
+    clock = [0]
+    sysfs, policy, changes = make_policy(tmp_path, clock)
+    sysfs.set_battery("Discharging")
+    policy.check()
+
+    sysfs.set_battery("Charging")
+    policy.check()
+    clock[0] = 30
+    sysfs.set_battery("Discharging")
+    policy.check()
+    sysfs.set_battery("Charging")
+    clock[0] = 70
+    policy.check()
+
+    assert policy.constrained is True
+    assert policy.get_status()["recovering"] is True
+    assert len(changes) == 1
+
+
+class OverlapService:
+    """Records whether two policy updates ever ran at the same time."""
+
+    def __init__(self, scheduling):
+        self.scheduling = scheduling
+        self.model_size = "base"
+        self.decoding_profile = None
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def set_cascade_paused(self, reason):
+        # The first update _apply_inference_limits makes.
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.005)
+
+    def set_scheduling(self, scheduling, rebuild):
+        self.scheduling = scheduling
+
+    def set_model_size(self, model_size):
+        # The last one.
+        self.model_size = model_size
+        self.in_flight -= 1
+
+
+def test_power_changes_and_settings_rpcs_apply_limits_one_at_a_time(backend, monkeypatch):
+    config = backend._read_button_config()
+    service = OverlapService(backend._inference_scheduling(config))
+    policy = SimpleNamespace(constrained=False)
+    monkeypatch.setattr(backend.Plugin, "voice_service", service)
+    monkeypatch.setattr(backend.Plugin, "power_policy", policy)
+
+    def power_poll():
+        for _ in range(10):
+            policy.constrained = not policy.constrained
+            backend.Plugin._on_power_change(policy.constrained, ["thermal"])
+
+    def settings_rpc():
+        for _ in range(10):
+            backend.Plugin._apply_inference_limits(config)
+
+    threads = [threading.Thread(target=target) for target in (power_poll, settings_rpc, settings_rpc)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+
+    assert service.max_in_flight == 1
+    assert service.in_flight == 0
@@ -8,6 +8,7 @@ and game_presets.json structural validity.
 import json
 import os
 import pytest
+from decoding_profiles import SUPPORTED_DECODING_PROFILES
 from wow_voice_chat import WoWVoiceChat
 
 
@@ -85,6 +86,10 @@ class TestPresetsFile:
     def test_generic_has_no_context_file(self, presets):
         assert "context_file" not in presets["generic"]
 
+    @pytest.mark.parametrize("preset_id", ["wow", "guildwars2", "generic"])
+    def test_decoding_profile_is_supported(self, presets, preset_id):
+        assert presets[preset_id].get("decoding_profile", "auto") in SUPPORTED_DECODING_PROFILES
+
 
 # ---------------------------------------------------------------------------
 # Constructor wiring from preset
@@ -180,3 +185,13 @@ class TestSetPreset:
         ch, text = svc.parse_channel_and_text("party hello")
         assert ch == "type"
         assert text == "party hello"
+
+    def test_switch_changes_decoding_profile_unless_overridden(self):
+        svc = WoWVoiceChat(preset={"decoding_profile": "fast"}, lazy_load=True)
+        assert svc.get_decoding_profile() == "fast"
+
+        svc.set_preset({"decoding_profile": "accurate"})
+        assert svc.get_decoding_profile() == "accurate"
+
+        svc.decoding_profile = "balanced"
+        assert svc.get_decoding_profile() == "balanced"
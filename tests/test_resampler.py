@@ -0,0 +1,66 @@
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+import resampler
+from resampler import PolyphaseResampler
+
+
+@pytest.fixture
+def np(monkeypatch):
+    """The real numpy in place of conftest's mock; the filter math needs it."""
+    if isinstance(sys.modules.get("numpy"), MagicMock):
+        monkeypatch.delitem(sys.modules, "numpy")
+    numpy = pytest.importorskip("numpy")
+    monkeypatch.setattr(resampler, "np", numpy)
+    return numpy
+
+
+def tone(np, frequency, rate, seconds=1.0):
+    t = np.arange(int(rate * seconds)) / rate
+    return (0.5 * np.sin(2 * np.pi * frequency * t)).astype(np.float32)
+
+
+def rms(np, audio):
+    # Skip the filter's edges.
+    middle = audio[len(audio) // 10: -len(audio) // 10]
+    return float(np.sqrt(np.mean(middle.astype(np.float64) ** 2)))
+
+
+@pytest.mark.parametrize("source_rate", [48000, 44100, 22050])
+def test_output_length_follows_the_rate_ratio(np, source_rate):
+    resample = PolyphaseResampler(source_rate, 16000)
+
+    output = resample(np.zeros(source_rate * 2, dtype=np.float32))
+
+    assert len(output) == 32000
+    assert output.dtype == np.float32
+    assert resample.up / resample.down == pytest.approx(16000 / source_rate)
+
+
+@pytest.mark.parametrize("source_rate", [48000, 44100, 22050])
+def test_speech_band_tone_survives(np, source_rate):
+    output = PolyphaseResampler(source_rate, 16000)(tone(np, 440, source_rate))
+
+    assert rms(np, output) == pytest.approx(0.5 / 2 ** 0.5, rel=0.02)
+    # Still a 440 Hz tone at the new rate: two zero crossings per cycle.
+    crossings = np.count_nonzero(np.diff(np.signbit(output[1600:-1600])))
+    assert crossings / (len(output) - 3200) * 16000 / 2 == pytest.approx(440, rel=0.01)
+
+
+@pytest.mark.parametrize("source_rate", [48000, 44100])
+def test_tone_above_the_new_nyquist_is_removed(np, source_rate):
+    # Linear interpolation would fold 11 kHz back to 5 kHz.
+    output = PolyphaseResampler(source_rate, 16000)(tone(np, 11000, source_rate))
+
+    assert rms(np, output) < 0.01 * 0.5 / 2 ** 0.5
+
+
+def test_blocks_do_not_change_the_result(np):
+    audio = tone(np, 440, 48000)
+
+    whole = PolyphaseResampler(48000, 16000, block_size=1 << 20)(audio)
+    blocked = PolyphaseResampler(48000, 16000, block_size=1000)(audio)
+
+    assert np.array_equal(whole, blocked)
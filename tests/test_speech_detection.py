@@ -0,0 +1,158 @@
+import time
+from unittest.mock import MagicMock
+
+import speech_detection
+import wow_voice_chat
+from speech_detection import SpeechDetector
+from wow_voice_chat import WoWVoiceChat
+
+# At 50 Hz a 20 ms frame is one sample, so each "sample" below is a frame level.
+RATE = 50
+
+
+class FakeBuffer:
+    def __init__(self):
+        self.samples = []
+
+    def __len__(self):
+        return len(self.samples)
+
+    def reset(self, capacity=0):
+        self.samples = []
+
+    def write(self, frames):
+        self.samples += frames
+
+    def view(self, start=0, end=None):
+        return self.samples[start:end]
+
+
+def make_detector(monkeypatch, **kwargs):
+    monkeypatch.setattr(speech_detection, "frame_levels", lambda samples, frame_length, *buffers: list(samples))
+    detector = SpeechDetector(**kwargs)
+    detector.reset(RATE)
+    return detector
+
+
+def test_silent_press_has_no_speech_span(monkeypatch):
+    detector = make_detector(monkeypatch)
+    buffer = FakeBuffer()
+    buffer.samples = [0.002] * 100
+
+    detector.update(buffer)
+
+    assert not detector.detected
+    assert detector.span(len(buffer)) is None
+
+
+def test_records_padded_speech_span_as_blocks_arrive(monkeypatch):
+    heard = []
+    detector = make_detector(monkeypatch, on_speech=lambda: heard.append(True))
+    buffer = FakeBuffer()
+
+    buffer.samples += [0.002] * 50
+    detector.update(buffer)
+    buffer.samples += [0.2] * 25
+    detector.update(buffer)
+    buffer.samples += [0.002] * 75
+    detector.update(buffer)
+
+    assert detector.speech_start == 50
+    assert detector.speech_end == 75
+    assert heard == [True]
+    # 0.3 s before and 0.4 s after at 50 Hz
+    assert detector.span(len(buffer)) == (35, 95)
+
+
+def test_clicks_shorter_than_min_speech_are_ignored(monkeypatch):
+    detector = make_detector(monkeypatch)
+    buffer = FakeBuffer()
+    buffer.samples = [0.002] * 20 + [0.5] * 2 + [0.002] * 20 + [0.5] * 3
+
+    detector.update(buffer)
+
+    assert not detector.detected
+
+
+def test_speech_from_the_first_frame_is_detected(monkeypatch):
+    detector = make_detector(monkeypatch)
+    buffer = FakeBuffer()
+    buffer.samples = [0.2] * 30
+
+    detector.update(buffer)
+
+    assert detector.span(len(buffer)) == (0, 30)
+
+
+def test_threshold_follows_a_rising_noise_floor(monkeypatch):
+    detector = make_detector(monkeypatch)
+    buffer = FakeBuffer()
+    # A fan spins up, then its noise alone would clear the -40 dBFS minimum.
+    buffer.samples = [0.004] * 10 + [0.008] * 60 + [0.015] * 10 + [0.1] * 10
+
+    detector.update(buffer)
+
+    assert detector.speech_start == 80
+
+
+def test_quiet_microphone_speech_clears_a_quiet_noise_floor(monkeypatch):
+    detector = make_detector(monkeypatch)
+    buffer = FakeBuffer()
+    # Speech peaks near -46 dBFS, below the absolute minimum but well above the room.
+    buffer.samples = [0.0005] * 20 + [0.005] * 20
+
+    detector.update(buffer)
+
+    assert detector.speech_start == 20
+
+
+def make_service(monkeypatch):
+    monkeypatch.setattr(speech_detection, "frame_levels", lambda samples, frame_length, *buffers: list(samples))
+    monkeypatch.setattr(wow_voice_chat, "sd", MagicMock())
+    service = WoWVoiceChat(lazy_load=True)
+    service.capture_buffer = FakeBuffer()
+    service._negotiate_sample_rate = lambda: RATE
+    service.loads = []
+    service._load_model = lambda warm_up=True: service.loads.append(warm_up)
+    service.transcribed = []
+    service.transcribe_audio = lambda audio, cancel=None: service.transcribed.append(audio) or "pull"
+    return service
+
+
+def test_press_without_speech_never_loads_or_runs_the_model(monkeypatch):
+    service = make_service(monkeypatch)
+
+    service.start_recording()
+    service.audio_callback([0.002] * 50, 50, None, None)
+    service.stop_recording(send=False)
+
+    assert service.loads == []
+    assert service.transcribed == []
+    assert service.last_speech_detection["speech"] is False
+    assert service.last_speech_detection["peak_dbfs"] == -54.0
+    assert service.no_speech_count == 1
+
+
+def test_only_the_speech_span_is_transcribed(monkeypatch):
+    service = make_service(monkeypatch)
+
+    service.start_recording()
+    service.audio_callback([0.002] * 50, 50, None, None)
+    service.audio_callback([0.2] * 25, 25, None, None)
+    service.audio_callback([0.002] * 75, 75, None, None)
+    service.stop_recording(send=False)
+    assert service.dictations.wait_idle(5)
+
+    for _ in range(100):
+        if service.loads:
+            break
+        time.sleep(0.01)
+    assert service.loads == [False]
+    assert service.transcribed == [[0.002] * 15 + [0.2] * 25 + [0.002] * 20]
+    assert service.last_speech_detection == {
+        "speech": True,
+        "captured_seconds": 3.0,
+        "speech_seconds": 1.2,
+        "trimmed_seconds": 1.8,
+        "peak_dbfs": -14.0,
+    }
@@ -0,0 +1,103 @@
+import streaming_transcription
+from streaming_transcription import StreamingTranscriber
+
+
+class FakeNumpy:
+    array = staticmethod(list)
+
+    @staticmethod
+    def concatenate(blocks, axis=0):
+        return [sample for block in blocks for sample in block]
+
+
+class BlockSource:
+    def __init__(self):
+        self.blocks = []
+
+    def push(self, samples):
+        self.blocks.append(list(samples))
+
+    def __call__(self):
+        blocks, self.blocks = self.blocks, []
+        return blocks
+
+
+def make_streamer(monkeypatch, source, decoded):
+    monkeypatch.setattr(streaming_transcription, "np", FakeNumpy)
+    monkeypatch.setattr(
+        streaming_transcription,
+        "find_quiet_split",
+        lambda audio, sample_rate, earliest, latest: earliest,
+    )
+
+    def transcribe(audio):
+        decoded.append(list(audio))
+        return f" chunk{len(decoded)} "
+
+    return StreamingTranscriber(
+        transcribe,
+        source,
+        sample_rate=10,
+        min_chunk_seconds=1.0,
+        guard_seconds=0.5,
+    )
+
+
+def test_waits_for_a_stable_chunk_before_decoding(monkeypatch):
+    source = BlockSource()
+    decoded = []
+    streamer = make_streamer(monkeypatch, source, decoded)
+
+    source.push(range(12))
+    assert streamer.step() is False
+    assert decoded == []
+
+
+def test_release_decodes_only_the_uncommitted_tail(monkeypatch):
+    source = BlockSource()
+    decoded = []
+    streamer = make_streamer(monkeypatch, source, decoded)
+
+    source.push(range(16))
+    assert streamer.step() is True
+    assert decoded == [list(range(10))]
+
+    source.push(range(16, 20))
+    text, stats = streamer.finish()
+
+    assert decoded[1] == list(range(10, 20))
+    assert text == "chunk1 chunk2"
+    assert stats["chunks"] == 1
+    assert stats["streamed_audio_seconds"] == 1.0
+    assert stats["tail_audio_seconds"] == 1.0
+    assert stats["latency_saved_seconds"] >= 0
+
+
+def test_chunks_wait_for_the_model(monkeypatch):
+    source = BlockSource()
+    decoded = []
+    streamer = make_streamer(monkeypatch, source, decoded)
+    streamer.ready = lambda: False
+
+    source.push(range(20))
+    assert streamer.step() is False
+
+    text, stats = streamer.finish()
+    assert decoded == [list(range(20))]
+    assert stats["chunks"] == 0
+    assert text == "chunk1"
+
+
+def test_cancelled_release_skips_the_tail(monkeypatch):
+    source = BlockSource()
+    decoded = []
+    streamer = make_streamer(monkeypatch, source, decoded)
+
+    source.push(range(16))
+    assert streamer.step() is True
+    streamer.stop()
+    streamer.cancelled.set()
+    text, stats = streamer.finish()
+
+    assert decoded == [list(range(10))]
+    assert text == "chunk1"
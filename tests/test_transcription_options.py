@@ -1,3 +1,6 @@
+import os
+import threading
+import time
 from types import SimpleNamespace
 
 import wow_voice_chat
@@ -121,5 +124,321 @@ def test_set_model_size_reloads_loaded_model(monkeypatch):
 
     assert service._load_model() is True
     assert service.set_model_size("medium") is True
+    assert service.wait_for_model_swap(timeout=5) is True
 
     assert [call["model_size"] for call in fake_ctor.calls] == ["base", "medium"]
+
+
+def test_warm_up_runs_full_transcribe_path_with_and_without_vad():
+    service = WoWVoiceChat(lazy_load=True)
+    service.model = FakeModel()
+    calls = []
+    service.model.transcribe = lambda audio, **kwargs: (
+        calls.append((audio, kwargs["vad_filter"])) or ([SimpleNamespace(text="")], None)
+    )
+    service._warm_up_clip = lambda: "clip"
+
+    assert service.warm_up_model() is True
+
+    assert calls == [("clip", True), ("clip", False)]
+    assert service.model_warm is True
+    assert service.warm_up_seconds is not None
+
+
+def test_model_reload_clears_warm_state(monkeypatch):
+    monkeypatch.setattr(wow_voice_chat, "WhisperModel", FakeWhisperCtor())
+    service = WoWVoiceChat(lazy_load=True)
+    service.model_warm = True
+
+    assert service._load_model(warm_up=False) is True
+
+    assert service.model_warm is False
+
+
+def test_set_model_size_keeps_serving_old_model_until_swap(monkeypatch):
+    import threading
+
+    release = threading.Event()
+    old_model = FakeModel()
+    new_model = FakeModel()
+
+    def slow_ctor(model_size, device, compute_type):
+        release.wait(5)
+        return new_model
+
+    monkeypatch.setattr(wow_voice_chat, "WhisperModel", slow_ctor)
+    service = WoWVoiceChat(lazy_load=True, model_size="base")
+    service.model = old_model
+    service.warm_up_model = lambda: True
+
+    assert service.set_model_size("small") is True
+    assert service.model is old_model
+    assert service.model_swap["state"] == "loading"
+
+    release.set()
+    assert service.wait_for_model_swap(timeout=5) is True
+    assert service.model is new_model
+    assert service.model_swap["model_size"] == "small"
+
+
+def test_superseded_model_swap_is_discarded(monkeypatch):
+    import threading
+
+    release_small = threading.Event()
+
+    def ctor(model_size, device, compute_type):
+        if model_size == "small":
+            release_small.wait(5)
+        return SimpleNamespace(size=model_size)
+
+    monkeypatch.setattr(wow_voice_chat, "WhisperModel", ctor)
+    service = WoWVoiceChat(lazy_load=True, model_size="base")
+    service.model = FakeModel()
+    service.warm_up_model = lambda: True
+
+    first = service._start_model_swap("small")
+    first_thread = service._model_swap_thread
+    second = service._start_model_swap("medium")
+    assert service.wait_for_model_swap(timeout=5) is True
+
+    release_small.set()
+    first_thread.join(5)
+
+    assert first["state"] == "superseded"
+    assert second["state"] == "ready"
+    assert service.model.size == "medium"
+
+
+def test_short_utterance_uses_greedy_auto_profile(monkeypatch):
+    monkeypatch.setattr(wow_voice_chat, "np", FakeNumpy)
+    service = WoWVoiceChat(lazy_load=True)
+    service.model = FakeModel()
+    service._prepare_audio = lambda audio, sample_rate: FakeAudio([0.0, 0.1])
+
+    service.transcribe_audio([0.0, 0.1])
+
+    assert service.last_decoding_profile == "fast"
+    assert service.model.kwargs["beam_size"] == 1
+
+
+def test_short_utterance_is_decoded_once_on_the_full_window(monkeypatch):
+    monkeypatch.setattr(wow_voice_chat, "np", FakeNumpy)
+    service = WoWVoiceChat(lazy_load=True)
+    chunk_lengths = []
+
+    def transcribe(audio, **kwargs):
+        chunk_lengths.append(kwargs["chunk_length"])
+        return [SimpleNamespace(text="")], SimpleNamespace()
+
+    service.model = SimpleNamespace(transcribe=transcribe)
+    service._prepare_audio = lambda audio, sample_rate: FakeAudio([0.0, 0.1])
+
+    assert service.transcribe_audio([0.0, 0.1]) == ""
+
+    # faster-whisper pads every segment to 30 s, so a shorter window would
+    # save no encoder work; an empty result is not decoded a second time.
+    assert chunk_lengths == [30]
+
+
+def test_token_budget_follows_utterance_duration(monkeypatch):
+    monkeypatch.setattr(wow_voice_chat, "np", FakeNumpy)
+    service = WoWVoiceChat(lazy_load=True)
+    service.model = FakeModel()
+    service._prepare_audio = lambda audio, sample_rate: FakeAudio([0.1] * 32000)
+
+    service.transcribe_audio([0.1])
+
+    assert service.model.kwargs["max_new_tokens"] == 28
+    assert service.decode_guard_stats["last_token_budget"] == 28
+
+
+def test_loop_breaker_stops_consuming_segments(monkeypatch):
+    monkeypatch.setattr(wow_voice_chat, "np", FakeNumpy)
+    reported = []
+    events = []
+    service = WoWVoiceChat(
+        lazy_load=True,
+        diagnostic_reporter=lambda name, error=None: reported.append(name),
+        event_reporter=lambda name, **data: events.append((name, data)),
+    )
+    consumed = []
+
+    def segments():
+        for text in ["Pull the boss.", " Thank you.", " Thank you.", " Thank you.", " Thank you."]:
+            consumed.append(text)
+            yield SimpleNamespace(text=text)
+
+    service.model = SimpleNamespace(transcribe=lambda audio, **kwargs: (segments(), None))
+    service._prepare_audio = lambda audio, sample_rate: FakeAudio([0.0, 0.1])
+
+    assert service.transcribe_audio([0.0, 0.1]) == "Pull the boss. Thank you. Thank you."
+
+    assert len(consumed) == 4
+    assert service.decode_guard_stats["breaker_fired"] == 1
+    assert service.decode_guard_stats["last_reason"] == "repeated_segment"
+    # A stopped loop is a breadcrumb, not an error event.
+    assert reported == []
+    assert events == [(
+        "transcription.loop_breaker",
+        {"reason": "repeated_segment", "token_budget": service.decode_guard_stats["last_token_budget"]},
+    )]
+
+
+def test_model_factory_replaces_in_process_model_and_is_released(monkeypatch):
+    released = []
+
+    class WorkerModel(FakeModel):
+        def __init__(self, size):
+            super().__init__()
+            self.size = size
+
+        def release(self):
+            released.append(self.size)
+
+    service = WoWVoiceChat(lazy_load=True, model_factory=WorkerModel)
+
+    assert service._load_model(warm_up=False) is True
+    assert service.model.size == "base"
+    assert service.unload_model() is True
+    assert released == ["base"]
+
+
+def test_cancel_stops_decoding_between_segments(monkeypatch):
+    monkeypatch.setattr(wow_voice_chat, "np", FakeNumpy)
+    service = WoWVoiceChat(lazy_load=True)
+    cancel = threading.Event()
+    chunk_lengths = []
+    consumed = []
+
+    def segments():
+        for text in ["Pull", " the", " boss"]:
+            consumed.append(text)
+            yield SimpleNamespace(text=text)
+            cancel.set()
+
+    def transcribe(audio, **kwargs):
+        chunk_lengths.append(kwargs["chunk_length"])
+        return segments(), None
+
+    service.model = SimpleNamespace(transcribe=transcribe)
+    service._prepare_audio = lambda audio, sample_rate: FakeAudio([0.0, 0.1])
+
+    assert service.transcribe_audio([0.0, 0.1], cancel=cancel) == "Pull"
+
+    assert consumed == ["Pull", " the"]
+    assert chunk_lengths == [30]
+
+
+class FakeBatchedPipeline:
+    calls = []
+
+    def __init__(self, model):
+        self.model = model
+
+    def transcribe(self, audio, **kwargs):
+        FakeBatchedPipeline.calls.append(kwargs)
+        return [SimpleNamespace(text="batched")], SimpleNamespace()
+
+
+def test_batched_inference_decodes_recordings_with_several_speech_chunks(monkeypatch):
+    monkeypatch.setattr(wow_voice_chat, "np", FakeNumpy)
+    monkeypatch.setattr(wow_voice_chat, "BatchedInferencePipeline", FakeBatchedPipeline)
+    vad_calls = []
+    chunks = [{"start": 0, "end": 24000}, {"start": 40000, "end": 72000}]
+    monkeypatch.setattr(
+        wow_voice_chat, "get_speech_timestamps",
+        lambda audio, **options: vad_calls.append(options) or list(chunks),
+    )
+    FakeBatchedPipeline.calls = []
+    service = WoWVoiceChat(lazy_load=True, batched_inference=True, batch_size=3)
+    service.model = FakeModel()
+    # A continuous-mode length recording with two phrases.
+    service._prepare_audio = lambda audio, sample_rate: FakeAudio([0.1] * 16000 * 5)
+
+    assert service.transcribe_audio([0.1]) == "batched"
+    assert FakeBatchedPipeline.calls[0]["batch_size"] == 3
+    assert FakeBatchedPipeline.calls[0]["clip_timestamps"] == [
+        {"start": 0.0, "end": 1.5}, {"start": 2.5, "end": 4.5},
+    ]
+    # Chunks never exceed the encoder window the recording is decoded with.
+    assert vad_calls[0]["max_speech_duration_s"] == FakeBatchedPipeline.calls[0]["chunk_length"]
+    assert service.last_decode_batched is True
+
+    chunks.pop()
+    assert service.transcribe_audio([0.1]) == "hello"
+    assert len(FakeBatchedPipeline.calls) == 1
+    assert service.last_decode_batched is False
+
+
+def test_concurrent_model_loads_share_one_build(monkeypatch):
+    release = threading.Event()
+    built = []
+
+    def factory(size):
+        built.append(size)
+        release.wait(5)
+        return FakeModel()
+
+    service = WoWVoiceChat(lazy_load=True, model_factory=factory)
+    results = []
+    callers = [
+        threading.Thread(target=lambda: results.append(service._load_model(warm_up=False)))
+        for _ in range(3)
+    ]
+    for caller in callers:
+        caller.start()
+    for _ in range(100):
+        if service.get_model_load_status()["waiters"] == 2:
+            break
+        time.sleep(0.01)
+
+    status = service.get_model_load_status()
+    assert status["state"] == "loading"
+    assert status["elapsed_seconds"] is not None
+    assert service.model_loading is True
+
+    release.set()
+    for caller in callers:
+        caller.join(5)
+
+    assert built == ["base"]
+    assert results == [True, True, True]
+    status = service.get_model_load_status()
+    assert status["state"] == "ready"
+    assert status["loads"] == 1
+    assert status["expected_seconds"] is not None
+
+
+def test_failed_load_is_retried_by_the_next_caller():
+    attempts = []
+
+    def factory(size):
+        attempts.append(size)
+        if len(attempts) == 1:
+            raise RuntimeError("download interrupted")
+        return FakeModel()
+
+    service = WoWVoiceChat(lazy_load=True, model_factory=factory)
+
+    assert service._load_model(warm_up=False) is False
+    assert service.get_model_load_status()["state"] == "failed"
+    assert service._load_model(warm_up=False) is True
+    assert len(attempts) == 2
+
+
+def test_run_once_records_transcribes_and_sends(monkeypatch):
+    monkeypatch.setattr(wow_voice_chat, "np", FakeNumpy)
+    service = WoWVoiceChat(lazy_load=True)
+    service.model = FakeModel()
+    wav_files = []
+    sent = []
+    service.record_audio = lambda duration: [0.0, 0.1]
+    service.save_audio_to_wav = lambda audio, filename: wav_files.append(filename)
+    service._load_wav = lambda path: FakeAudio([0.0, 0.1])
+    service.send_to_wow_chat = sent.append
+
+    service.run_once(duration=1)
+
+    assert sent == ["hello"]
+    assert len(wav_files) == 1
+    assert not os.path.exists(wav_files[0])
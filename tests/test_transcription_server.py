@@ -0,0 +1,185 @@
+import array
+import asyncio
+import os
+import threading
+import time
+
+import pytest
+
+import transcription_server
+from transcription_server import TranscriptionClient, TranscriptionServer
+
+
+class FakeNumpy:
+    int16 = "int16"
+    float32 = "float32"
+
+    @staticmethod
+    def ascontiguousarray(values):
+        return values
+
+    @staticmethod
+    def frombuffer(payload, dtype=None):
+        return array.array("h" if dtype == "int16" else "f", payload)
+
+
+class FakeService:
+    def __init__(self):
+        self.calls = []
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.release.set()
+
+    def is_model_ready(self):
+        return True
+
+    def transcribe_audio(self, audio, sample_rate=None):
+        self.calls.append((list(audio), sample_rate))
+        self.started.set()
+        self.release.wait(5)
+        return f"heard {len(audio)} samples"
+
+
+@pytest.fixture
+def served(tmp_path, monkeypatch):
+    monkeypatch.setattr(transcription_server, "np", FakeNumpy)
+    service = FakeService()
+    socket_path = str(tmp_path / "transcribe.sock")
+    server = TranscriptionServer(service, socket_path=socket_path, max_queue=1).start()
+    yield server, service, TranscriptionClient(socket_path, timeout=5)
+    service.release.set()
+    server.close()
+
+
+def test_transcribes_pcm_and_reports_latency(served):
+    server, service, client = served
+
+    reply = client.transcribe(array.array("h", [1, -2, 3]), 48000)
+
+    assert reply["ok"] is True
+    assert reply["text"] == "heard 3 samples"
+    assert service.calls == [([1, -2, 3], 48000)]
+    assert reply["latency_seconds"] >= reply["transcribe_seconds"] >= 0
+    assert client.status()["served"] == 1
+
+
+def test_concurrent_clients_share_one_model_in_order(served):
+    server, service, client = served
+    server.max_queue = 8
+    server.jobs.maxsize = 8
+    replies = []
+
+    threads = [
+        threading.Thread(target=lambda n=n: replies.append(client.transcribe(array.array("f", [0.0] * n), 16000)))
+        for n in (1, 2, 3, 4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert sorted(reply["text"] for reply in replies) == [f"heard {n} samples" for n in (1, 2, 3, 4)]
+    assert len(service.calls) == 4
+
+
+def test_full_queue_rejects_new_requests(served):
+    server, service, client = served
+    service.release.clear()
+    replies = []
+
+    def send():
+        replies.append(client.transcribe(array.array("h", [0]), 16000))
+
+    running = threading.Thread(target=send)
+    running.start()
+    assert service.started.wait(5)  # first request holds the model
+    queued = threading.Thread(target=send)
+    queued.start()
+    deadline = time.monotonic() + 5
+    while server.jobs.qsize() < 1 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    rejected = client.transcribe(array.array("h", [0]), 16000)
+    service.release.set()
+    running.join(5)
+    queued.join(5)
+
+    assert rejected == {"ok": False, "rejected": True, "error": "transcription queue is full"}
+    assert [reply["ok"] for reply in replies] == [True, True]
+    assert client.status()["rejected"] == 1
+
+
+def test_localhost_tcp_port(monkeypatch):
+    monkeypatch.setattr(transcription_server, "np", FakeNumpy)
+    server = TranscriptionServer(FakeService(), port=0).start()
+    try:
+        reply = TranscriptionClient(port=server.port, timeout=5).transcribe(array.array("h", [5]), 16000)
+    finally:
+        server.close()
+
+    assert reply["text"] == "heard 1 samples"
+
+
+def test_malformed_and_oversized_requests_get_an_error_reply(served):
+    server, service, client = served
+    header = {"op": "transcribe", "samples": 1, "sample_rate": 16000, "dtype": "int16"}
+
+    missing_samples = client._request({key: value for key, value in header.items() if key != "samples"})
+    missing_dtype = client._request({key: value for key, value in header.items() if key != "dtype"})
+    # Rejected from the header alone, before any payload is read.
+    too_long = client._request({
+        **header, "samples": (transcription_server.MAX_AUDIO_SECONDS + 1) * 16000,
+    })
+
+    assert missing_samples == {"ok": False, "error": "invalid samples: None"}
+    assert missing_dtype == {"ok": False, "error": "unsupported dtype: None"}
+    assert too_long["ok"] is False and "longer than" in too_long["error"]
+    assert service.calls == []
+
+
+@pytest.fixture
+def plugin_socket(backend, tmp_path, monkeypatch):
+    monkeypatch.setattr(transcription_server, "np", FakeNumpy)
+    socket_path = str(tmp_path / "plugin.sock")
+    monkeypatch.setattr(backend, "TRANSCRIPTION_SOCKET_PATH", socket_path)
+    monkeypatch.setattr(backend.Plugin, "transcription_server", None)
+    yield socket_path
+    backend.Plugin._stop_transcription_server()
+
+
+def test_plugin_serves_its_own_model(backend, plugin_socket, monkeypatch):
+    service = FakeService()
+    monkeypatch.setattr(backend.Plugin, "voice_service", service)
+
+    backend.Plugin._start_transcription_server()
+    reply = TranscriptionClient(plugin_socket, timeout=5).transcribe(array.array("h", [4, 5]), 16000)
+
+    assert reply["text"] == "heard 2 samples"
+    assert service.calls == [([4, 5], 16000)]
+
+
+def test_plugin_leaves_a_running_standalone_server_alone(backend, plugin_socket, monkeypatch):
+    standalone = FakeService()
+    server = TranscriptionServer(standalone, socket_path=plugin_socket).start()
+    try:
+        monkeypatch.setattr(backend.Plugin, "voice_service", FakeService())
+
+        backend.Plugin._start_transcription_server()
+        reply = TranscriptionClient(plugin_socket, timeout=5).transcribe(array.array("h", [1]), 16000)
+
+        assert backend.Plugin.transcription_server is None
+        assert standalone.calls == [([1], 16000)]
+    finally:
+        server.close()
+
+
+def test_set_transcription_server_stops_and_restarts_serving(backend, plugin_socket, monkeypatch):
+    monkeypatch.setattr(backend.Plugin, "voice_service", FakeService())
+    plugin = backend.Plugin()
+
+    assert asyncio.run(plugin.set_transcription_server(False)) == {"success": True, "serving": False}
+    assert not os.path.exists(plugin_socket)
+    assert backend._read_button_config()["transcriptionServer"] is False
+
+    assert asyncio.run(plugin.set_transcription_server(True)) == {"success": True, "serving": True}
+    assert TranscriptionClient(plugin_socket, timeout=5).status()["ok"] is True
@@ -0,0 +1,75 @@
+from unittest.mock import MagicMock
+
+import wow_voice_chat
+from wow_voice_chat import WoWVoiceChat
+
+
+def make_service(monkeypatch):
+    fake_sd = MagicMock()
+    fake_sd.InputStream.return_value.active = True
+    fake_sd.InputStream.return_value.cpu_load = 0.01
+    monkeypatch.setattr(wow_voice_chat, "sd", fake_sd)
+    service = WoWVoiceChat(lazy_load=True, warm_mic=True)
+    service.capture_buffer = MagicMock()
+    return service, fake_sd
+
+
+def test_warm_stream_gates_frames_until_press(monkeypatch):
+    service, fake_sd = make_service(monkeypatch)
+    service.start_warm_stream()
+
+    service.audio_callback("idle", 512, None, None)
+    service.capture_buffer.write.assert_not_called()
+
+    service.start_recording()
+    service.audio_callback("speech", 512, None, None)
+
+    assert fake_sd.InputStream.call_count == 1
+    service.capture_buffer.write.assert_called_once_with("speech")
+    assert len(service.first_frame_latencies["warm"]) == 1
+    assert service.get_capture_stats()["warm_stream_cpu_load"] == 0.01
+
+
+def test_stop_recording_keeps_warm_stream_open(monkeypatch):
+    service, fake_sd = make_service(monkeypatch)
+    service.capture_buffer.__len__.return_value = 0
+    service.start_warm_stream()
+
+    service.start_recording()
+    service.stop_recording()
+    service.audio_callback("after release", 512, None, None)
+
+    fake_sd.InputStream.return_value.close.assert_not_called()
+    service.capture_buffer.write.assert_not_called()
+    assert service.warm_stream is not None
+
+
+def test_press_without_warm_stream_opens_a_cold_stream(monkeypatch):
+    service, fake_sd = make_service(monkeypatch)
+
+    service.start_recording()
+    service.audio_callback("speech", 512, None, None)
+
+    fake_sd.InputStream.return_value.start.assert_called_once_with()
+    assert len(service.first_frame_latencies["cold"]) == 1
+    assert service.get_capture_stats()["warm_mic"] is False
+
+
+def test_press_prepends_pre_roll_before_live_frames(monkeypatch):
+    service, fake_sd = make_service(monkeypatch)
+    service.pre_roll_ms = 400
+    service.start_warm_stream()
+    service.pre_roll = MagicMock()
+
+    service.audio_callback("before press", 512, None, None)
+    service.pre_roll.write.assert_called_once_with("before press")
+
+    service.start_recording()
+    service.audio_callback("speech", 512, None, None)
+    service.audio_callback("more speech", 512, None, None)
+
+    service.pre_roll.drain_into.assert_called_once_with(service.capture_buffer)
+    assert [c.args[0] for c in service.capture_buffer.write.call_args_list] == [
+        "speech",
+        "more speech",
+    ]